@@ -1,7 +1,7 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+import instrumentation
 from semester import Semester
 from course import Course
-from web_crawler import WebCrawler
 from prerequisite_checker import PrerequisiteChecker
 
 
@@ -10,9 +10,20 @@ class AcademicPlan:
     Represents an academic plan with semesters and course management.
     """
 
-    def __init__(self, remaining_courses: List[str], completed_courses: List[str]):
+    def __init__(self, remaining_courses: List[str], completed_courses: List[str],
+                 prerequisite_checker: Optional[PrerequisiteChecker] = None):
+        """
+        Initialize an AcademicPlan object.
+
+        Args:
+            remaining_courses (List[str]): Course codes still to be scheduled
+            completed_courses (List[str]): Course codes already completed
+            prerequisite_checker (Optional[PrerequisiteChecker]): Shared, already loaded checker used by
+                validate_plan. Prerequisites are not validated without one.
+        """
         self._remaining_courses = set(remaining_courses)
         self._completed_courses = set(completed_courses)
+        self._prerequisite_checker = prerequisite_checker
         self._semesters: List[Semester] = []
         self._total_semesters = 0
         self._last_errors: List[str] = []
@@ -28,6 +39,7 @@ class AcademicPlan:
             return self._semesters[index]
         raise IndexError(f"Semester index {index} out of range")
 
+    @instrumentation.traced("validate")
     def validate_plan(self) -> bool:
         """
         Validate the academic plan:
@@ -35,12 +47,14 @@ class AcademicPlan:
           - All remaining courses are scheduled
           - Completed courses are not re-scheduled
           - No semester exceeds maxHours
+          - Prerequisites are met, if a prerequisite checker was given
         """
         errors = []
         scheduled_codes = []
         prereq_errors = []
-        wc = WebCrawler()
-        pc = PrerequisiteChecker(wc)
+        pc = self._prerequisite_checker
+        # Courses from earlier semesters count as completed for later ones
+        completed_so_far = set(self._completed_courses)
         for sem in self._semesters:
             # check credit hours
             if sem.getTotalCredits() > sem.maxHours:
@@ -49,10 +63,12 @@ class AcademicPlan:
                 )
 
             # collect codes
-            for c in sem.courses:
-                scheduled_codes.append(c.code)
+            codes = sem.getCourseCodes()
+            scheduled_codes.extend(codes)
 
-            prereq_errors += pc.validate_semester_plan(sem, self._completed_courses)
+            if pc:
+                prereq_errors += pc.validate_semester_plan(sem, completed_so_far)
+            completed_so_far.update(codes)
             
         # check duplicates
         if len(scheduled_codes) != len(set(scheduled_codes)):
@@ -75,7 +91,7 @@ class AcademicPlan:
 
     def get_plan_summary(self) -> Dict:
         """Get a summary of the academic plan."""
-        scheduled_codes = [c.code for s in self._semesters for c in s.courses]
+        scheduled_codes = [code for s in self._semesters for code in s.getCourseCodes()]
         total_hours = sum(s.getTotalCredits() for s in self._semesters)
 
         return {
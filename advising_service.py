@@ -0,0 +1,208 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+from academic_plan import AcademicPlan
+from course import normalize_course_code
+from dag_generator import DAGGenerator
+from excel_exporter import ExcelExporter
+from input_cache import InputCache
+from pdf_parser import PDFParser
+from plan_generator import PlanGenerator
+from prerequisite_checker import PrerequisiteChecker
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+MAX_REQUEST_BYTES = 20 * 1024 * 1024
+
+
+class AdvisingService:
+    """
+    Plans students over HTTP. The catalog, compiled prerequisites, Graduate Study Plan
+    and four-year schedule are loaded once when the service starts, so a request only
+    pays for parsing the student's own DegreeWorks PDF and planning.
+
+    Endpoints:
+        GET  /health  Service status
+        POST /plan    DegreeWorks PDF (application/pdf) or {"remaining_courses": [...]}
+                      (application/json). Returns the plan as JSON, or as an Excel file
+                      with ?format=xlsx or an Accept header asking for xlsx.
+    """
+
+    def __init__(self, prerequisite_checker: PrerequisiteChecker, study_plan_courses: List[str],
+                 course_schedule: Dict[str, List[str]], max_hours_per_term: int,
+                 start_year_two_digit: int = 25, plan_strategy: str = "greedy",
+                 plan_time_limit_seconds: float = 5, input_cache: Optional[InputCache] = None,
+                 pdf_stop_early: bool = False):
+        """
+        Initialize an AdvisingService object.
+
+        Args:
+            prerequisite_checker (PrerequisiteChecker): Checker with the compiled catalog prerequisites
+            study_plan_courses (List[str]): Parsed Graduate Study Plan courses
+            course_schedule (Dict[str, List[str]]): Parsed four-year schedule
+            max_hours_per_term (int): Maximum credit hours per term
+            start_year_two_digit (int): Year of the first planned term
+            plan_strategy (str): "greedy" or "optimal", see PlanGenerator
+            plan_time_limit_seconds (float): Search time per request for the "optimal" strategy
+            input_cache (Optional[InputCache]): Cache of parsed DegreeWorks PDFs
+            pdf_stop_early (bool): Stop reading each PDF after its requirement blocks, see PDFParser
+        """
+        self._prerequisite_checker = prerequisite_checker
+        self._study_plan_courses = study_plan_courses
+        self._course_schedule = course_schedule
+        self._max_hours_per_term = max_hours_per_term
+        self._start_year_two_digit = start_year_two_digit
+        self._plan_strategy = plan_strategy
+        self._plan_time_limit_seconds = plan_time_limit_seconds
+        self._input_cache = input_cache
+        self._pdf_stop_early = pdf_stop_early
+        self._exporter = ExcelExporter()
+        self._requests_served = 0
+        self._lock = threading.Lock()
+
+    def plan_for_pdf(self, pdf_data: bytes) -> AcademicPlan:
+        """Plan a student from the content of their DegreeWorks PDF. Raises ValueError if it can't be read."""
+        pdf_parser = PDFParser(pdf_data, self._input_cache, stop_early=self._pdf_stop_early)
+        if not pdf_parser.is_valid_pdf():
+            raise ValueError("Request body is not a readable PDF")
+        return self._generate_plan(pdf_parser, None)
+
+    def plan_for_courses(self, remaining_courses: List[str]) -> AcademicPlan:
+        """Plan a student from the course codes DegreeWorks lists as still needed."""
+        return self._generate_plan(None, [normalize_course_code(code) for code in remaining_courses])
+
+    def plan_to_dict(self, plan: AcademicPlan) -> Dict:
+        """JSON friendly form of a plan: its summary and the courses of every semester."""
+        summary = plan.get_plan_summary()
+        semesters = []
+        for i in range(summary["total_semesters"]):
+            semester = plan.get_semester(i)
+            semesters.append({
+                "term": f"{semester.name}{semester.year}",
+                "total_hours": semester.getTotalCredits(),
+                "courses": [{"code": c.code, "title": c.name, "hours": c.getHours()} for c in semester.courses],
+            })
+        return {"summary": summary, "semesters": semesters}
+
+    def plan_to_xlsx(self, plan: AcademicPlan) -> bytes:
+        """Excel file of a plan, same layout as the exported plan of a normal run."""
+        return self._exporter.export_academic_plan_bytes(plan)
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            requests_served = self._requests_served
+        return {
+            "status": "ok",
+            "catalog_courses": len(self._prerequisite_checker.get_course_catalog()),
+            "study_plan_courses": len(self._study_plan_courses),
+            "requests_served": requests_served,
+        }
+
+    def create_server(self, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+        """Create the HTTP server, call serve_forever() on it to start handling requests."""
+        server = ThreadingHTTPServer((host, port), _AdvisingRequestHandler)
+        server.advising_service = self
+        return server
+
+    def _generate_plan(self, pdf_parser: Optional[PDFParser], remaining_courses: Optional[List[str]]) -> AcademicPlan:
+        # The catalog-wide prerequisites are compiled once in the checker. The DAGGenerator only
+        # holds this student's remaining courses and PlanGenerator rebuilds it for them anyway
+        # (about 2 ms for 70 courses), so each request gets its own instead of sharing one
+        # under a lock and planning one request at a time.
+        gen = PlanGenerator(
+            dag=DAGGenerator(),
+            graduate_parser=None,
+            four_year_parser=None,
+            prerequisite_checker=self._prerequisite_checker,
+            degreeworks_parser=pdf_parser,
+            max_hours_per_term=self._max_hours_per_term,
+            start_year_two_digit=self._start_year_two_digit,
+        )
+        gen.set_shared_inputs(self._study_plan_courses, self._course_schedule)
+        if remaining_courses is not None:
+            gen.set_required_courses(remaining_courses)
+        if self._plan_strategy == "optimal":
+            plan = gen.generate_solver_plan(self._plan_time_limit_seconds)
+        else:
+            plan = gen.generate_optimal_plan()
+        with self._lock:
+            self._requests_served += 1
+        return plan
+
+
+class _AdvisingRequestHandler(BaseHTTPRequestHandler):
+    server_version = "BetterAdvise"
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path == "/health":
+            self._send_json(200, self.server.advising_service.get_status())
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        if url.path != "/plan":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            self._send_json(400, {"error": "Request body is empty"})
+            return
+        if length > MAX_REQUEST_BYTES:
+            self._send_json(413, {"error": "Request body is too large"})
+            return
+        body = self.rfile.read(length)
+
+        service = self.server.advising_service
+        try:
+            plan = self._plan_from_body(service, body)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": repr(e)})
+            return
+
+        if self._wants_xlsx(url):
+            self._send(200, XLSX_CONTENT_TYPE, service.plan_to_xlsx(plan))
+        else:
+            self._send_json(200, service.plan_to_dict(plan))
+
+    def _plan_from_body(self, service: AdvisingService, body: bytes) -> AcademicPlan:
+        content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        if content_type == "application/json":
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise ValueError("Request body is not valid JSON")
+            courses = payload.get("remaining_courses") if isinstance(payload, dict) else None
+            if not isinstance(courses, list) or not all(isinstance(c, str) for c in courses):
+                raise ValueError('Expected {"remaining_courses": ["CPSC 6119", ...]}')
+            return service.plan_for_courses(courses)
+
+        if content_type in ("application/pdf", "application/octet-stream", ""):
+            return service.plan_for_pdf(body)
+
+        raise ValueError(f"Unsupported Content-Type: {content_type}")
+
+    def _wants_xlsx(self, url) -> bool:
+        requested = parse_qs(url.query).get("format", [""])[0].lower()
+        if requested:
+            return requested == "xlsx"
+        return XLSX_CONTENT_TYPE in (self.headers.get("Accept") or "")
+
+    def _send_json(self, status: int, payload: Dict) -> None:
+        self._send(status, "application/json", json.dumps(payload).encode("utf-8"))
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        print("[AdvisingService]", self.address_string(), format % args)
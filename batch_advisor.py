@@ -0,0 +1,151 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from course_catalog import CourseCatalog
+from dag_generator import DAGGenerator
+from excel_exporter import ExcelExporter
+from input_cache import InputCache
+from pdf_parser import PDFParser
+from plan_generator import PlanGenerator
+from prerequisite_checker import PrerequisiteChecker
+
+# Shared inputs of a worker process, set once by _init_worker
+_worker_state: Dict = {}
+
+
+def _init_worker(catalog_data: List[Dict], study_plan_courses: List[str], course_schedule: Dict[str, List[str]],
+                 settings: Dict) -> None:
+    _worker_state["checker"] = PrerequisiteChecker(CourseCatalog(catalog_data))
+    _worker_state["study_plan_courses"] = study_plan_courses
+    _worker_state["course_schedule"] = course_schedule
+    _worker_state["settings"] = settings
+    _worker_state["input_cache"] = None
+    if settings["input_cache_directory"]:
+        _worker_state["input_cache"] = InputCache(settings["input_cache_directory"], settings["input_cache_max_bytes"])
+
+
+def _advise_student(pdf_path: str) -> Dict:
+    """Plan and export one student's DegreeWorks PDF. Runs in a worker process."""
+    settings = _worker_state["settings"]
+    started = time.perf_counter()
+    result = {"pdf": pdf_path, "ok": False}
+    try:
+        gen = PlanGenerator(
+            dag=DAGGenerator(),
+            graduate_parser=None,
+            four_year_parser=None,
+            prerequisite_checker=_worker_state["checker"],
+            degreeworks_parser=PDFParser(pdf_path, _worker_state["input_cache"],
+                                         stop_early=settings["pdf_stop_early"]),
+            max_hours_per_term=settings["max_hours_per_term"],
+            start_year_two_digit=settings["start_year_two_digit"],
+        )
+        gen.set_shared_inputs(_worker_state["study_plan_courses"], _worker_state["course_schedule"])
+        if settings["plan_strategy"] == "optimal":
+            plan = gen.generate_solver_plan(settings["plan_time_limit_seconds"])
+        else:
+            plan = gen.generate_optimal_plan()
+
+        output_path = os.path.join(settings["output_directory"], Path(pdf_path).stem + ".xlsx")
+        if not ExcelExporter(output_path).export_academic_plan(plan):
+            raise RuntimeError("Failed to export academic plan to Excel.")
+
+        summary = plan.get_plan_summary()
+        result.update({
+            "ok": True,
+            "output": output_path,
+            "total_semesters": summary["total_semesters"],
+            "scheduled_courses": summary["scheduled_courses"],
+            "is_valid": summary["is_valid"],
+            "errors": summary["errors"],
+        })
+    except Exception as e:
+        result["error"] = repr(e)
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+class BatchAdvisor:
+    """
+    Plans a whole directory of DegreeWorks PDFs. The catalog, Graduate Study Plan and
+    four-year schedule are loaded once and shared by a pool of worker processes, each
+    worker parses, plans and exports one student at a time.
+    """
+
+    def __init__(self, catalog_data: List[Dict], study_plan_courses: List[str],
+                 course_schedule: Dict[str, List[str]], output_directory: str, max_hours_per_term: int,
+                 start_year_two_digit: int = 25, plan_strategy: str = "greedy",
+                 plan_time_limit_seconds: float = 5, max_workers: Optional[int] = None,
+                 input_cache_directory: Optional[str] = None, input_cache_max_bytes: int = 64 * 1024 * 1024,
+                 pdf_stop_early: bool = False):
+        """
+        Initialize a BatchAdvisor object.
+
+        Args:
+            catalog_data (List[Dict]): Crawled course data, see WebCrawler.get_catalog_data()
+            study_plan_courses (List[str]): Parsed Graduate Study Plan courses
+            course_schedule (Dict[str, List[str]]): Parsed four-year schedule
+            output_directory (str): Directory for the per-student plans and the run summary
+            max_hours_per_term (int): Maximum credit hours per term
+            start_year_two_digit (int): Year of the first planned term
+            plan_strategy (str): "greedy" or "optimal", see PlanGenerator
+            plan_time_limit_seconds (float): Search time per student for the "optimal" strategy
+            max_workers (Optional[int]): Worker processes, one per CPU if None
+            input_cache_directory (Optional[str]): Parsed input cache for the DegreeWorks PDFs, off if None
+            input_cache_max_bytes (int): Size limit of the parsed input cache
+            pdf_stop_early (bool): Stop reading each PDF after its requirement blocks, see PDFParser
+        """
+        self._output_directory = output_directory
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._init_args = (catalog_data, study_plan_courses, course_schedule, {
+            "output_directory": output_directory,
+            "max_hours_per_term": max_hours_per_term,
+            "start_year_two_digit": start_year_two_digit,
+            "plan_strategy": plan_strategy,
+            "plan_time_limit_seconds": plan_time_limit_seconds,
+            "input_cache_directory": input_cache_directory,
+            "input_cache_max_bytes": input_cache_max_bytes,
+            "pdf_stop_early": pdf_stop_early,
+        })
+
+    def find_pdfs(self, pdf_directory: str) -> List[str]:
+        """List the DegreeWorks PDFs in a directory."""
+        return sorted(str(p) for p in Path(pdf_directory).iterdir() if p.suffix.lower() == ".pdf")
+
+    def run(self, pdf_paths: List[str]) -> Dict:
+        """
+        Plan every PDF and write batch_summary.json to the output directory.
+
+        Args:
+            pdf_paths (List[str]): DegreeWorks PDFs to plan
+
+        Returns:
+            Dict: Run summary with one result per student
+        """
+        os.makedirs(self._output_directory, exist_ok=True)
+        started = time.perf_counter()
+
+        workers = max(1, min(self._max_workers, len(pdf_paths)))
+        if workers == 1:
+            _init_worker(*self._init_args)
+            results = [_advise_student(path) for path in pdf_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=self._init_args) as pool:
+                results = list(pool.map(_advise_student, pdf_paths))
+
+        summary = {
+            "students": len(results),
+            "succeeded": sum(1 for r in results if r["ok"]),
+            "failed": sum(1 for r in results if not r["ok"]),
+            "workers": workers,
+            "seconds": round(time.perf_counter() - started, 3),
+            "results": results,
+        }
+        with open(os.path.join(self._output_directory, "batch_summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        return summary
@@ -0,0 +1,140 @@
+"""
+Catalog page parsing benchmark for Better Advise.
+
+Parses catalog subject pages with WebCrawler.parse_subject_page (streaming extractor) and
+with the BeautifulSoup reference parse_subject_page_soup, checks that both return identical
+course data and reports the time and peak memory of each per page. Pages are saved subject
+pages given with --pages, or a synthetic page in the catalog's markup (course links,
+character references, comments, courses without prerequisites). Exits with status 1 when
+the outputs differ or the speedup is below --min-speedup.
+
+Usage (from the repository root):
+    python benchmarks/catalog_parse_benchmark.py [--pages saved/cpsc.html saved/cybr.html] [--output parse.json]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from web_crawler import WebCrawler  # noqa: E402
+
+HEADER = """<div class="courseblock">
+<div class="cols noindent">
+<span class="text detail-code margin--small text--semibold text--big"><strong>{code}</strong></span>
+<span class="text detail-title margin--small text--semibold text--big"><strong>{title}</strong></span>
+<span class="text detail-hours_html margin--small text--semibold text--big"><strong>{hours} Credit Hours</strong></span>
+</div>
+<div class="courseblockextra noindent"><p>{description}</p></div>
+"""
+PREREQUISITE = """<div class="noindent courseblockextra"><span class="text detail-prereq"><strong>Prerequisite(s): </strong>{text}</span></div>
+"""
+LINK = '<a href="/search/?P={subject}%20{number}" title="{subject}&#160;{number}" class="bubblelink code" onclick="return showCourse(this, \'{subject} {number}\');">{subject}&#160;{number}</a>'
+
+
+def course_link(rng: random.Random) -> str:
+    return LINK.format(subject=rng.choice(["CPSC", "CYBR", "MATH"]), number=rng.randint(1000, 6999))
+
+
+def synthetic_page(courses: int, seed: int) -> str:
+    """A subject page in the catalog's markup with the given number of course blocks."""
+    rng = random.Random(seed)
+    parts = ["<!DOCTYPE html><html><head><title>CPSC &amp; CYBR</title><script>var x = '<div>';</script></head>",
+             '<body><div id="content"><h2>Computer Science (CPSC)</h2>']
+    for i in range(courses):
+        parts.append(HEADER.format(
+            code=f"CPSC&#160;{1000 + i}{'K' if i % 7 == 0 else ''}",
+            title=f"Course {i} <em>Topics</em> &amp; Practice",
+            hours=rng.choice([1, 3, 4]),
+            description=" ".join(["Covers data structures, algorithms&nbsp;and software design."] * rng.randint(1, 6))
+                        + "<br/>Lecture<!-- internal note --> and lab.",
+        ))
+        kind = rng.random()
+        if kind < 0.25:
+            pass
+        elif kind < 0.5:
+            parts.append(PREREQUISITE.format(text=course_link(rng) + " with a grade of C or better"))
+        elif kind < 0.75:
+            parts.append(PREREQUISITE.format(text=f"({course_link(rng)} or {course_link(rng)}) and "
+                                                  f"{course_link(rng)}Â or permission of instructor"))
+        else:
+            parts.append(PREREQUISITE.format(text=" and ".join(course_link(rng) for _ in range(rng.randint(2, 5)))))
+        if rng.random() < 0.2:
+            parts.append('<div class="courseblockextra noindent"><p>Cross-listed with CYBR&#160;5000.</p></div>\n')
+        parts.append("</div>\n")
+    parts.append("</div></body></html>")
+    return "".join(parts)
+
+
+def measure(parse, html: str, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(html)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        parse(html)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"median_ms": round(statistics.median(timings) * 1000, 2), "peak_kb": round(peak / 1024, 1)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", nargs="*", help="Saved catalog subject pages (HTML files)")
+    parser.add_argument("--courses", type=int, default=300, help="Course blocks of the synthetic page")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic page")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per parser, the median is reported")
+    parser.add_argument("--min-speedup", type=float, default=3, help="Least speedup over the reference parser")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    pages = {}
+    for path in args.pages or []:
+        with open(path, encoding="utf-8") as f:
+            pages[path] = f.read()
+    if not pages:
+        pages[f"synthetic ({args.courses} courses)"] = synthetic_page(args.courses, args.seed)
+
+    crawler = WebCrawler.__new__(WebCrawler)  # parsing needs no catalog URL, cache or network
+    results, failures = [], []
+    for name, html in pages.items():
+        streaming = crawler.parse_subject_page(html)
+        reference = crawler.parse_subject_page_soup(html)
+        result = {
+            "page": name,
+            "bytes": len(html.encode("utf-8")),
+            "courses": len(reference),
+            "identical": streaming == reference,
+            "streaming": measure(crawler.parse_subject_page, html, args.repeat),
+            "soup": measure(crawler.parse_subject_page_soup, html, args.repeat),
+        }
+        result["speedup"] = round(result["soup"]["median_ms"] / max(result["streaming"]["median_ms"], 1e-6), 2)
+        result["memory_ratio"] = round(result["soup"]["peak_kb"] / max(result["streaming"]["peak_kb"], 1e-6), 2)
+        results.append(result)
+
+        if not result["identical"]:
+            different = [s["Course_Code"] for s, r in zip(streaming, reference) if s != r]
+            failures.append(f"{name}: output differs from the reference parser "
+                            f"({len(streaming)} vs {len(reference)} courses, first differences: {different[:5]})")
+        if result["speedup"] < args.min_speedup:
+            failures.append(f"{name}: speedup {result['speedup']}x (min {args.min_speedup}x)")
+
+    report = {"python": sys.version.split()[0], "pages": results, "failures": failures}
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Incremental catalog refresh check for Better Advise.
+
+Serves synthetic subject pages (see catalog_parse_benchmark) from a local stand-in catalog
+server and refreshes a WebCrawler with a CatalogCache against it:
+  1. a first crawl parses every page
+  2. a refresh right after gets HTTP 304 for every page and parses none
+  3. after one page is edited (a course retitled, one added, one removed) only that page is
+     parsed again, and the merged data equals a full crawl without the cache
+  4. with a server that sends no Last-Modified, unchanged pages are recognized by content hash
+Every page also lists one cross-listed course with its own title, which must stay with its
+page. Reports the time of the full crawl and of the incremental refresh. Exits with status 1
+when a step parses other pages than expected or the data differs from a full crawl.
+
+Usage (from the repository root):
+    python benchmarks/catalog_refresh_benchmark.py [--subjects 6] [--courses 300] [--output refresh.json]
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from catalog_cache import CatalogCache  # noqa: E402
+from catalog_parse_benchmark import HEADER, synthetic_page  # noqa: E402
+from web_crawler import WebCrawler  # noqa: E402
+
+CROSS_LISTED = "XLST&#160;9000"
+
+
+class _CatalogHandler(SimpleHTTPRequestHandler):
+    """Static subject pages. Without validators it neither sends Last-Modified nor answers with 304."""
+
+    def do_GET(self) -> None:
+        if not self.server.validators:
+            del self.headers["If-Modified-Since"]
+        super().do_GET()
+
+    def send_header(self, keyword: str, value: str) -> None:
+        if keyword == "Last-Modified" and not self.server.validators:
+            return
+        super().send_header(keyword, value)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def subject_page(subject: str, courses: int, seed: int) -> str:
+    """Synthetic page of a subject, with the cross-listed course titled after the subject."""
+    page = synthetic_page(courses, seed).replace("CPSC&#160;", subject.upper() + "&#160;")
+    cross_listed = HEADER.format(code=CROSS_LISTED, title=f"Cross-listed in {subject.upper()}", hours=3,
+                                 description="Shared course.") + "</div>\n"
+    return page.replace("</div></body>", cross_listed + "</div></body>")
+
+
+def write_page(root: str, subject: str, html: str, modified: float) -> None:
+    os.makedirs(os.path.join(root, subject), exist_ok=True)
+    path = os.path.join(root, subject, "index.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    os.utime(path, (modified, modified))
+
+
+def edit_page(html: str, subject: str) -> str:
+    """Retitle the first course, remove the second and add a new one."""
+    prefix = subject.upper() + "&#160;"
+    html = html.replace("<strong>Course 0 <em>Topics</em>", "<strong>Course 0 <em>Revised</em>", 1)
+    blocks = html.split('<div class="courseblock">')
+    del blocks[2]
+    html = '<div class="courseblock">'.join(blocks)
+    added = HEADER.format(code=prefix + "8999", title="Added Course", hours=3, description="New.") + "</div>\n"
+    return html.replace("</div></body>", added + "</div></body>")
+
+
+def crawl(url: str, subjects: list, cache) -> tuple:
+    """Crawl with refresh, returns (course data, refresh summary, seconds)."""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        crawler = WebCrawler(url, subjects, cache=cache, refresh=True, max_workers=4)
+    return crawler.get_catalog_data(), crawler.get_refresh_summary(), time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subjects", type=int, default=6, help="Subject pages of the stand-in catalog")
+    parser.add_argument("--courses", type=int, default=300, help="Course blocks per page")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic pages")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    subjects = [f"s{i:03d}" for i in range(max(2, args.subjects))]
+    edited = subjects[len(subjects) // 2]
+    failures = []
+
+    def check(step: str, summary: dict, expected: dict) -> None:
+        statuses = summary["subjects"]
+        unexpected = {s: statuses.get(s) for s in subjects if statuses.get(s) != expected.get(s, expected["*"])}
+        if unexpected:
+            failures.append(f"{step}: unexpected page statuses {unexpected}")
+
+    with tempfile.TemporaryDirectory() as root:
+        site = os.path.join(root, "site")
+        modified = time.time() - 3600
+        pages = {subject: subject_page(subject, args.courses, args.seed + i) for i, subject in enumerate(subjects)}
+        for subject, html in pages.items():
+            write_page(site, subject, html, modified)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_CatalogHandler, directory=site))
+        server.validators = True
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            cache = CatalogCache(os.path.join(root, "catalog.json"))
+            first, summary, full_seconds = crawl(url, subjects, cache)
+            check("first crawl", summary, {"*": "new"})
+
+            again, summary, _ = crawl(url, subjects, cache)
+            check("refresh without changes", summary, {"*": "not_modified"})
+            if again != first:
+                failures.append("refresh without changes: data differs from the first crawl")
+
+            write_page(site, edited, edit_page(pages[edited], edited), modified + 60)
+            refreshed, summary, refresh_seconds = crawl(url, subjects, cache)
+            check("refresh after an edit", summary, {"*": "not_modified", edited: "changed"})
+            diff = summary["diff"]
+            if not (len(diff["added"]) == 1 and len(diff["removed"]) == 1 and len(diff["retitled"]) == 1):
+                failures.append(f"refresh after an edit: unexpected diff {diff}")
+            expected, _, _ = crawl(url, subjects, None)
+            if refreshed != expected:
+                failures.append("refresh after an edit: data differs from a full crawl")
+
+            server.validators = False
+            hashed, summary, _ = crawl(url, subjects, cache)
+            check("refresh without validators", summary, {"*": "unchanged"})
+            if hashed != expected:
+                failures.append("refresh without validators: data differs from a full crawl")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    report = {
+        "python": sys.version.split()[0],
+        "subjects": len(subjects),
+        "courses": len(first),
+        "full_crawl_ms": round(full_seconds * 1000, 2),
+        "incremental_refresh_ms": round(refresh_seconds * 1000, 2),
+        "failures": failures,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
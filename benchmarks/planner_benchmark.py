@@ -0,0 +1,399 @@
+"""
+Planner scaling benchmark for Better Advise.
+
+Generates synthetic catalogs at configurable scale, from hundreds to tens of thousands
+of courses, with deep prerequisite chains and wide OR-groups, plus a four-year style
+term-offering table and a DegreeWorks style list of remaining courses. For every
+profile it times, in process:
+  - catalog: compiling the catalog records into a CourseCatalog and PrerequisiteChecker
+  - DAGGenerator: build, topological sort, levels and cycle detection over the whole catalog
+  - PrerequisiteChecker: checking every course against a half completed transcript
+  - PlanGenerator.generate_optimal_plan end to end, and the plan summary
+
+and records the peak memory of each stage with tracemalloc. Results are written as JSON.
+It also checks a few catalogs the synthetic data never produces, e.g. a circular
+dependency with courses behind it or prerequisite text with a stray parenthesis. Exits with status 1 when a stage fails (e.g. hits the
+recursion limit), passes its threshold in the thresholds file, is slower than --tolerance
+times a baseline result, or an edge case check fails.
+
+Usage (from the repository root):
+    python benchmarks/planner_benchmark.py [--profiles small,medium] [--output planner.json]
+    python benchmarks/planner_benchmark.py --courses 10000 --depth 200 --or-width 6
+    python benchmarks/planner_benchmark.py --baseline planner.json --tolerance 1.5
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from course import Course  # noqa: E402
+from course_catalog import CourseCatalog  # noqa: E402
+from dag_generator import DAGGenerator  # noqa: E402
+from plan_generator import PlanGenerator  # noqa: E402
+from prerequisite_checker import PrerequisiteChecker  # noqa: E402
+
+DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "planner_thresholds.json")
+START_YEAR = 25
+
+# courses: catalog size, depth: prerequisite levels (longest chain), or_width: courses per
+# OR-group, and_groups: most groups per course, study_plan: courses the student plans
+PROFILES = {
+    "small": {"courses": 500, "depth": 8, "or_width": 3, "and_groups": 2, "study_plan": 60},
+    "medium": {"courses": 5000, "depth": 20, "or_width": 4, "and_groups": 2, "study_plan": 300},
+    "large": {"courses": 20000, "depth": 40, "or_width": 4, "and_groups": 3, "study_plan": 1500},
+    "deep": {"courses": 3000, "depth": 2000, "or_width": 2, "and_groups": 1, "study_plan": 600},
+    "wide": {"courses": 5000, "depth": 6, "or_width": 30, "and_groups": 3, "study_plan": 300},
+}
+DEFAULT_PROFILES = ["small", "medium", "large", "deep", "wide"]
+
+# Semester patterns of the term-offering table, e.g. ("FA", "SP") for fall and spring only
+OFFERING_PATTERNS = [("FA", "SP", "SU"), ("FA", "SP"), ("FA", "SP"), ("FA",), ("SP",), ("FA", "SU"), ("SP", "SU")]
+
+
+def course_code(index: int) -> str:
+    """Synthetic course code of a course index, e.g. "SAAA 1000"."""
+    subject, number = divmod(index, 9000)
+    letters = ""
+    for _ in range(3):
+        subject, letter = divmod(subject, 26)
+        letters = chr(ord("A") + letter) + letters
+    return f"S{letters} {1000 + number}"
+
+
+def generate_catalog(courses: int, depth: int, or_width: int, and_groups: int, seed: int) -> tuple:
+    """
+    Generate catalog records in the WebCrawler format.
+
+    Courses are spread evenly over the levels. The first prerequisite group of every course
+    above level 0 is an OR-group of the level right below it, so the longest chain is depth
+    courses long; further groups pick from any lower level.
+
+    Returns:
+        tuple: (catalog records, level of every course code)
+    """
+    rng = random.Random(seed)
+    depth = max(1, min(depth, courses))
+    bounds = [level * courses // depth for level in range(depth + 1)]
+    records, levels = [], {}
+    for level in range(depth):
+        for index in range(bounds[level], bounds[level + 1]):
+            code = course_code(index)
+            levels[code] = level
+            groups = []
+            if level > 0:
+                for g in range(rng.randint(1, and_groups)):
+                    low = bounds[level - 1] if g == 0 else 0
+                    population = range(low, bounds[level])
+                    members = rng.sample(population, min(or_width, len(population)))
+                    groups.append([course_code(m) for m in members])
+            text = " and ".join("(" + " or ".join(group) + ")" for group in groups)
+            records.append({
+                "Course_Code": code,
+                "Course_Title": f"Synthetic Course {index}",
+                "Prerequisites": text or "None",
+                "preq_list": groups,
+                "Prerequisite_Text": text,
+            })
+    return records, levels
+
+
+def generate_schedule(records: list, years: int, seed: int) -> dict:
+    """Term-offering table like the parsed four-year schedule, course code -> ["FA25", "SP26", ...]."""
+    rng = random.Random(seed)
+    # Courses with the same pattern share one list, the table stays small for long horizons
+    offerings = []
+    for pattern in OFFERING_PATTERNS:
+        terms = []
+        for i in range(years * 3):
+            name = ("FA", "SP", "SU")[i % 3]
+            if name in pattern:
+                terms.append(f"{name}{START_YEAR + i // 3}")
+        offerings.append(terms)
+    return {record["Course_Code"]: rng.choice(offerings) for record in records}
+
+
+def generate_student(records: list, levels: dict, study_plan: int, seed: int) -> tuple:
+    """
+    Generate a study plan and the DegreeWorks style list of its still needed courses.
+
+    The study plan is closed under prerequisites through the first course of every group,
+    so every course can be scheduled. A few courses of the lowest level count as completed.
+
+    Returns:
+        tuple: (study plan course codes, remaining course codes)
+    """
+    rng = random.Random(seed)
+    groups = {record["Course_Code"]: record["preq_list"] for record in records}
+    # Deepest courses first, so the plan has long chains to schedule
+    targets = sorted(groups, key=lambda code: (-levels[code], rng.random()))
+    planned = {}
+    for target in targets:
+        if len(planned) >= study_plan:
+            break
+        stack = [target]
+        while stack:
+            code = stack.pop()
+            if code in planned:
+                continue
+            planned[code] = True
+            stack.extend(group[0] for group in groups[code])
+
+    study_plan_courses = sorted(planned, key=lambda code: levels[code])
+    completed = {code for code in study_plan_courses if levels[code] == 0 and rng.random() < 0.3}
+    return study_plan_courses, [code for code in study_plan_courses if code not in completed]
+
+
+def run_stage(fn, repeat: int, memory: bool) -> dict:
+    """Time a stage, report the median run and, with memory, the peak traced memory of one more run."""
+    timings, result = [], None
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                result = fn()
+                timings.append(time.perf_counter() - started)
+            if memory:
+                tracemalloc.start()
+                try:
+                    fn()
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+        except RecursionError as e:
+            return {"error": f"RecursionError: {e}"}, None
+        except Exception as e:
+            return {"error": repr(e)}, None
+
+    stats = {
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+    }
+    if memory:
+        stats["peak_kb"] = round(peak / 1024, 1)
+    return stats, result
+
+
+def benchmark_profile(name: str, spec: dict, seed: int, repeat: int, memory: bool, max_hours: int) -> dict:
+    generated_at = time.perf_counter()
+    records, levels = generate_catalog(spec["courses"], spec["depth"], spec["or_width"], spec["and_groups"], seed)
+    study_plan_courses, remaining_courses = generate_student(records, levels, spec["study_plan"], seed)
+    # Worst case one level of the study plan per year (fall only courses) plus the terms the hours limit needs
+    plan_depth = max((levels[code] for code in study_plan_courses), default=0) + 1
+    years = plan_depth + len(study_plan_courses) * 3 // max_hours + 4
+    course_schedule = generate_schedule(records, years, seed)
+
+    result = {
+        "profile": name,
+        **spec,
+        "catalog_courses": len(records),
+        "prerequisite_edges": sum(len(group) for record in records for group in record["preq_list"]),
+        "study_plan_courses": len(study_plan_courses),
+        "remaining_courses": len(remaining_courses),
+        "generate_ms": round((time.perf_counter() - generated_at) * 1000, 2),
+        "stages": {},
+    }
+    stages = result["stages"]
+    state = {}
+
+    def stage(stage_name: str, fn):
+        stats, value = run_stage(fn, repeat, memory)
+        stages[stage_name] = stats
+        return value
+
+    catalog = stage("catalog_build", lambda: CourseCatalog(records))
+    if catalog is None:
+        return result
+    checker = PrerequisiteChecker(catalog)
+
+    dag = DAGGenerator()
+
+    def dag_build():
+        # Deepest courses first, so a depth-first walk from the first course follows the whole chain
+        dag.set_courses_from_catalog(catalog, list(reversed(catalog.course_codes())))
+        return dag.build_prerequisite_dag()
+
+    stage("dag_build", dag_build)
+    stage("dag_topological_sort", dag.topological_sort)
+    stage("dag_course_levels", dag.find_course_levels)
+    stage("dag_cycle_detection", dag.detect_circular_dependencies)
+    stage("course_graph_cycle_courses", lambda: dag.get_course_graph().find_cycle_courses())
+
+    half_completed = [code for code, level in levels.items() if level < spec["depth"] // 2]
+
+    def check_all():
+        mask = checker.completed_mask(half_completed)
+        return sum(1 for code in levels if checker.check_prerequisites_mask(code, mask))
+
+    satisfied = stage("checker_check_all", check_all)
+    stage("checker_missing_prerequisites",
+          lambda: [checker.get_missing_prerequisites(code, half_completed) for code in remaining_courses[:200]])
+    if satisfied is not None:
+        result["satisfied_courses"] = satisfied
+
+    def plan():
+        gen = PlanGenerator(
+            dag=DAGGenerator(),
+            graduate_parser=None,
+            four_year_parser=None,
+            prerequisite_checker=checker,
+            degreeworks_parser=None,
+            max_hours_per_term=max_hours,
+            start_year_two_digit=START_YEAR,
+        )
+        gen.set_shared_inputs(study_plan_courses, course_schedule)
+        gen.set_required_courses(remaining_courses)
+        state["plan"] = gen.generate_optimal_plan()
+        return state["plan"]
+
+    academic_plan = stage("plan_generate", plan)
+    if academic_plan is not None:
+        summary = stage("plan_summary", academic_plan.get_plan_summary)
+        if summary is not None:
+            result["plan"] = {
+                "total_semesters": summary["total_semesters"],
+                "scheduled_courses": len(summary["scheduled_courses"]),
+                "is_valid": summary["is_valid"],
+            }
+    return result
+
+
+def check_edge_cases() -> list:
+    """Failures on catalogs with circular dependencies or malformed prerequisite text."""
+    failures = []
+    # A and B require each other, C requires A and D requires C
+    dag = DAGGenerator({code: Course(code, code, 3, prereq=prereqs)
+                        for code, prereqs in (("A", ["B"]), ("B", ["A"]), ("C", ["A"]), ("D", ["C"]))})
+    try:
+        dag.build_prerequisite_dag()
+        order = dag.get_topological_order()
+        if sorted(order) != ["A", "B", "C", "D"] or order.index("C") > order.index("D"):
+            failures.append(f"circular catalog: topological order {order}")
+        unlocked = sorted(dag.get_unlocked_courses("A"))
+        if not {"C", "D"} <= set(unlocked):
+            failures.append(f"circular catalog: A unlocks {unlocked}")
+        prerequisites = sorted(dag.get_all_prerequisites("D"))
+        if not {"A", "B", "C"} <= set(prerequisites):
+            failures.append(f"circular catalog: D requires {prerequisites}")
+        # Raises the level of a course on the cycle, which must not go around it forever
+        dag.add_prerequisite("A", "E")
+        levels = dag.get_levels()
+        if not levels["A"] < levels["C"] < levels["D"]:
+            failures.append(f"circular catalog: levels {levels} after adding a prerequisite")
+    except Exception as e:
+        failures.append(f"circular catalog: {e!r}")
+
+    # A closing parenthesis without an opening one must not drop the requirements after it
+    text = "SAAA 1000) and SAAA 1001"
+    checker = PrerequisiteChecker(CourseCatalog([{
+        "Course_Code": "SAAA 2000",
+        "Course_Title": "Malformed Prerequisites",
+        "Prerequisites": "SAAA 1000, SAAA 1001",
+        "preq_list": [["SAAA 1000"], ["SAAA 1001"]],
+        "Prerequisite_Text": text,
+    }]))
+    missing = checker.get_missing_prerequisites("SAAA 2000", ["SAAA 1000"])
+    if missing != [["SAAA 1001"]]:
+        failures.append(f"prerequisite text {text!r}: missing {missing} after SAAA 1000, expected [['SAAA 1001']]")
+    return failures
+
+
+def check_results(results: list, thresholds: dict, baseline: dict, tolerance: float) -> list:
+    """Failures of a run: stage errors, thresholds passed and regressions against the baseline."""
+    baseline_profiles = {p["profile"]: p for p in baseline.get("profiles", [])} if baseline else {}
+    failures = []
+    for profile in results:
+        name = profile["profile"]
+        limits = thresholds.get(name, {})
+        previous = baseline_profiles.get(name, {}).get("stages", {})
+        for stage_name, stats in profile["stages"].items():
+            if "error" in stats:
+                failures.append(f"{name}/{stage_name} failed: {stats['error']}")
+                continue
+            max_ms = limits.get(stage_name, {}).get("max_ms")
+            if max_ms is not None and stats["median_ms"] > max_ms:
+                failures.append(f"{name}/{stage_name} took {stats['median_ms']} ms (max {max_ms})")
+            max_peak_kb = limits.get(stage_name, {}).get("max_peak_kb")
+            if max_peak_kb is not None and stats.get("peak_kb", 0) > max_peak_kb:
+                failures.append(f"{name}/{stage_name} peaked at {stats['peak_kb']} KB (max {max_peak_kb})")
+            before = previous.get(stage_name, {}).get("median_ms")
+            # Ignore sub-millisecond stages, their timings are mostly noise
+            if before and stats["median_ms"] > max(before * tolerance, before + 1):
+                failures.append(f"{name}/{stage_name} took {stats['median_ms']} ms, "
+                                f"{stats['median_ms'] / before:.2f}x the baseline {before} ms")
+        if "plan" in profile and profile["plan"]["scheduled_courses"] != profile["remaining_courses"]:
+            failures.append(f"{name}: planned {profile['plan']['scheduled_courses']} of "
+                            f"{profile['remaining_courses']} remaining courses")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", default=",".join(DEFAULT_PROFILES),
+                        help=f"Comma separated profiles to run, from: {', '.join(PROFILES)}")
+    parser.add_argument("--courses", type=int, help="Run one custom profile with this many catalog courses")
+    parser.add_argument("--depth", type=int, default=20, help="Prerequisite levels of the custom profile")
+    parser.add_argument("--or-width", type=int, default=4, help="Courses per OR-group of the custom profile")
+    parser.add_argument("--and-groups", type=int, default=2, help="Most prerequisite groups per course of the custom profile")
+    parser.add_argument("--study-plan", type=int, default=300, help="Study plan courses of the custom profile")
+    parser.add_argument("--max-hours", type=int, default=15, help="Maximum credit hours per planned term")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic data")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage, the median is reported")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak memory runs")
+    parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS,
+                        help="JSON file of per profile and stage max_ms/max_peak_kb limits")
+    parser.add_argument("--baseline", help="Earlier --output of this benchmark to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed slowdown against the baseline")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    if args.courses:
+        profiles = {"custom": {"courses": args.courses, "depth": args.depth, "or_width": args.or_width,
+                               "and_groups": args.and_groups, "study_plan": args.study_plan}}
+    else:
+        names = [n.strip() for n in args.profiles.split(",") if n.strip()]
+        unknown = [n for n in names if n not in PROFILES]
+        if unknown:
+            parser.error("unknown profiles: " + ", ".join(unknown))
+        profiles = {n: PROFILES[n] for n in names}
+
+    thresholds, baseline = {}, None
+    if args.thresholds and os.path.exists(args.thresholds):
+        with open(args.thresholds, encoding="utf-8") as f:
+            thresholds = json.load(f)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = []
+    for name, spec in profiles.items():
+        print(f"[PlannerBenchmark] {name}: {spec['courses']} courses, depth {spec['depth']}, "
+              f"OR-groups of {spec['or_width']}", file=sys.stderr)
+        results.append(benchmark_profile(name, spec, args.seed, max(1, args.repeat), not args.no_memory,
+                                         args.max_hours))
+
+    report = {
+        "python": sys.version.split()[0],
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "max_hours": args.max_hours,
+        "profiles": results,
+        "failures": check_results(results, thresholds, baseline, args.tolerance) + check_edge_cases(),
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Advising service check for Better Advise.
+
+Starts AdvisingService on localhost (a free port) with a synthetic catalog, study plan and
+four-year schedule from planner_benchmark, then checks it over HTTP:
+  - GET /health reports the loaded catalog and study plan
+  - POST /plan with {"remaining_courses": [...]} returns a valid plan scheduling all of them
+  - POST /plan?format=xlsx returns an Excel workbook
+  - a body that isn't a PDF, JSON without remaining_courses and an unknown path get 400/404
+and times --requests plan requests sent by --concurrency clients at once. Exits with status 1
+when a check fails or the median request is slower than --max-median-ms.
+
+Usage (from the repository root):
+    python benchmarks/service_benchmark.py [--courses 2000 --study-plan 60] [--requests 50 --concurrency 4]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from advising_service import AdvisingService, XLSX_CONTENT_TYPE  # noqa: E402
+from course_catalog import CourseCatalog  # noqa: E402
+from planner_benchmark import generate_catalog, generate_schedule, generate_student  # noqa: E402
+from prerequisite_checker import PrerequisiteChecker  # noqa: E402
+
+
+def request(base: str, path: str, body: bytes = None, content_type: str = None) -> tuple:
+    """Send a request, returns (status, content type, body) for error statuses too."""
+    headers = {"Content-Type": content_type} if content_type else {}
+    req = urllib.request.Request(base + path, data=body, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=60) as response:
+            return response.status, response.headers.get("Content-Type"), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get("Content-Type"), e.read()
+
+
+def check_endpoints(base: str, remaining_courses: list, study_plan_courses: list) -> list:
+    """Failures of the endpoint checks, empty when every endpoint answers as documented."""
+    failures = []
+    courses_body = json.dumps({"remaining_courses": remaining_courses}).encode("utf-8")
+
+    status, _, body = request(base, "/health")
+    health = json.loads(body) if status == 200 else {}
+    if health.get("status") != "ok" or health.get("study_plan_courses") != len(study_plan_courses):
+        failures.append(f"/health: {status} {body[:200]!r}")
+
+    status, _, body = request(base, "/plan", courses_body, "application/json")
+    if status != 200:
+        failures.append(f"/plan (JSON): {status} {body[:200]!r}")
+    else:
+        summary = json.loads(body)["summary"]
+        if sorted(summary["scheduled_courses"]) != sorted(remaining_courses) or not summary["is_valid"]:
+            failures.append(f"/plan (JSON): scheduled {len(summary['scheduled_courses'])} of "
+                            f"{len(remaining_courses)} courses, valid: {summary['is_valid']}")
+
+    status, content_type, body = request(base, "/plan?format=xlsx", courses_body, "application/json")
+    if status != 200 or content_type != XLSX_CONTENT_TYPE or not zipfile.is_zipfile(io.BytesIO(body)):
+        failures.append(f"/plan?format=xlsx: {status} {content_type}")
+
+    for path, body, content_type, expected in (
+            ("/plan", b"not a pdf", "application/pdf", 400),
+            ("/plan", b"{}", "application/json", 400),
+            ("/unknown", None, None, 404)):
+        status, _, response = request(base, path, body, content_type)
+        if status != expected:
+            failures.append(f"{path} ({content_type}): {status}, expected {expected}")
+    return failures
+
+
+def time_requests(base: str, remaining_courses: list, requests: int, concurrency: int) -> dict:
+    """Send plan requests from concurrency clients at once, reports the latency and throughput."""
+    body = json.dumps({"remaining_courses": remaining_courses}).encode("utf-8")
+
+    def send(_):
+        started = time.perf_counter()
+        status, _, _ = request(base, "/plan", body, "application/json")
+        return status, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    timings = sorted(seconds for _, seconds in results)
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": sum(1 for status, _ in results if status != 200),
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 2),
+        "requests_per_second": round(requests / elapsed, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--courses", type=int, default=2000, help="Synthetic catalog courses")
+    parser.add_argument("--depth", type=int, default=8, help="Prerequisite levels of the catalog")
+    parser.add_argument("--study-plan", type=int, default=60, help="Study plan courses")
+    parser.add_argument("--max-hours", type=int, default=15, help="Maximum credit hours per planned term")
+    parser.add_argument("--strategy", default="greedy", choices=["greedy", "optimal"], help="Plan strategy")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic data")
+    parser.add_argument("--requests", type=int, default=50, help="Timed plan requests")
+    parser.add_argument("--concurrency", type=int, default=4, help="Clients sending the timed requests")
+    parser.add_argument("--max-median-ms", type=float, default=1000, help="Slowest allowed median request")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    records, levels = generate_catalog(args.courses, args.depth, 3, 2, args.seed)
+    study_plan_courses, remaining_courses = generate_student(records, levels, args.study_plan, args.seed)
+    course_schedule = generate_schedule(records, args.depth + len(study_plan_courses) * 3 // args.max_hours + 4,
+                                        args.seed)
+
+    service = AdvisingService(
+        prerequisite_checker=PrerequisiteChecker(CourseCatalog(records)),
+        study_plan_courses=study_plan_courses,
+        course_schedule=course_schedule,
+        max_hours_per_term=args.max_hours,
+        plan_strategy=args.strategy,
+    )
+    server = service.create_server("127.0.0.1", 0)
+    host, port = server.server_address[:2]
+    base = f"http://{host}:{port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # Keep the request log and planner output out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            failures = check_endpoints(base, remaining_courses, study_plan_courses)
+            timing = time_requests(base, remaining_courses, max(1, args.requests), max(1, args.concurrency))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    if timing["errors"]:
+        failures.append(f"{timing['errors']} of {timing['requests']} timed requests failed")
+    if timing["median_ms"] > args.max_median_ms:
+        failures.append(f"median request took {timing['median_ms']} ms (max {args.max_median_ms})")
+
+    report = {
+        "python": sys.version.split()[0],
+        "catalog_courses": len(records),
+        "study_plan_courses": len(study_plan_courses),
+        "remaining_courses": len(remaining_courses),
+        "strategy": args.strategy,
+        "timing": timing,
+        "failures": failures,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
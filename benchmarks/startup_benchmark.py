@@ -0,0 +1,170 @@
+"""
+Startup time benchmark for Better Advise.
+
+Measures, in fresh interpreter processes:
+  - launch to menu: importing smart_advising_tool, which is all the CLI does before the menu prints
+  - launch to cached plan: a full run whose catalog and parsed inputs come from the caches
+
+and checks that no heavy dependency (pandas, bs4, requests, openpyxl, pypdf) is loaded
+before a stage needs it. The cached plan runs on a copy of --config whose caches and
+outputs live in a temporary directory, with the catalog cache seeded from a synthetic
+catalog (see planner_benchmark), so the working tree is left alone and no network is used.
+Exits with status 1 when a threshold is exceeded, or when the cached plan run fails, has
+stage errors, doesn't take the catalog from the cache or loads the crawler.
+
+Usage (from the repository root):
+    python benchmarks/startup_benchmark.py [--config config.toml] [--repeat 5] [--output startup.json]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from catalog_cache import CatalogCache, CATALOG_SUBJECTS  # noqa: E402
+from config_manager import ConfigManager  # noqa: E402
+from planner_benchmark import generate_catalog  # noqa: E402
+
+HEAVY_MODULES = ["pandas", "numpy", "bs4", "requests", "openpyxl", "pypdf"]
+# Only a catalog cache miss may load these
+CRAWLER_MODULES = ["web_crawler", "requests", "bs4"]
+# Nothing listens here, a run that tries to crawl fails at once instead of reaching the real catalog
+FIXTURE_CATALOG_URL = "http://127.0.0.1:9/course-descriptions/"
+
+IMPORT_SCRIPT = """
+import sys, json
+import smart_advising_tool
+print(json.dumps([m for m in {heavy!r} if m in sys.modules]))
+"""
+
+RUN_SCRIPT = """
+import sys, json
+from smart_advising_tool import SmartAdvisingTool
+tool = SmartAdvisingTool({config!r})
+ok = tool.run()
+print(json.dumps({{"ok": ok, "stage_errors": tool.get_stage_errors(),
+                  "loaded": [m for m in {modules!r} if m in sys.modules]}}))
+"""
+
+
+def time_script(script: str) -> tuple:
+    """Run a script in a fresh interpreter, return (seconds, last line of its output)."""
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True)
+    seconds = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip() or f"exit status {completed.returncode}")
+    lines = completed.stdout.strip().splitlines()
+    return seconds, lines[-1] if lines else ""
+
+
+def write_cached_run_config(config: str, directory: str, catalog_courses: int) -> str:
+    """
+    Copy a config with its catalog cache, input cache and outputs moved to a directory, and
+    seed the catalog cache with a synthetic catalog. Returns the path of the copy.
+    """
+    path = os.path.join(directory, "config.toml")
+    shutil.copyfile(config, path)
+    config_manager = ConfigManager(path)
+    cache_path = os.path.join(directory, "prerequisites.cache")
+    for key, value in (("course_catalog_url", FIXTURE_CATALOG_URL),
+                       ("cache_prerequisites", "on"),
+                       ("prerequiste_cache_path", cache_path),
+                       ("catalog_offline", False),
+                       ("input_cache_directory", os.path.join(directory, "input_cache")),
+                       ("output_directory", os.path.join(directory, "outputs")),
+                       ("profile_directory", "")):
+        config_manager.update_setting(key, value)
+    config_manager.update_config_file()
+
+    records, _ = generate_catalog(catalog_courses, 8, 3, 2, seed=1)
+    CatalogCache(cache_path).save(FIXTURE_CATALOG_URL, CATALOG_SUBJECTS, records)
+    return path
+
+
+def measure(script: str, repeat: int) -> dict:
+    timings, output = [], ""
+    for _ in range(repeat):
+        seconds, output = time_script(script)
+        timings.append(seconds)
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 1),
+        "min_ms": round(min(timings) * 1000, 1),
+        "max_ms": round(max(timings) * 1000, 1),
+        "output": json.loads(output) if output else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="config.toml",
+                        help="Config for the cached plan run, copied with its caches and outputs in a temporary directory")
+    parser.add_argument("--catalog-courses", type=int, default=500, help="Courses of the seeded catalog cache")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement, the median is reported")
+    parser.add_argument("--max-menu-ms", type=float, default=300, help="Threshold for launch to menu")
+    parser.add_argument("--max-plan-ms", type=float, default=2000, help="Threshold for launch to cached plan")
+    parser.add_argument("--skip-plan", action="store_true", help="Only measure launch to menu")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    baseline = measure("pass", args.repeat)
+    results = {"python": sys.version.split()[0], "interpreter_ms": baseline["median_ms"]}
+    failures = []
+
+    menu = measure(IMPORT_SCRIPT.format(heavy=HEAVY_MODULES), args.repeat)
+    results["launch_to_menu"] = {k: v for k, v in menu.items() if k != "output"}
+    results["launch_to_menu"]["heavy_modules_loaded"] = menu["output"]
+    if menu["median_ms"] > args.max_menu_ms:
+        failures.append(f"launch to menu took {menu['median_ms']} ms (max {args.max_menu_ms})")
+    if menu["output"]:
+        failures.append("heavy modules loaded before the menu: " + ", ".join(menu["output"]))
+
+    if not args.skip_plan:
+        with tempfile.TemporaryDirectory() as directory:
+            config = write_cached_run_config(args.config, directory, args.catalog_courses)
+            cache_path = os.path.join(directory, "prerequisites.cache")
+            seeded_at = os.stat(cache_path).st_mtime_ns
+            script = RUN_SCRIPT.format(config=config, modules=sorted(set(HEAVY_MODULES + CRAWLER_MODULES)))
+            # First run fills the input cache
+            time_script(script)
+            plan = measure(script, args.repeat)
+            catalog_from_cache = os.stat(cache_path).st_mtime_ns == seeded_at
+
+        output = plan["output"]
+        loaded = output["loaded"]
+        results["launch_to_cached_plan"] = {k: v for k, v in plan.items() if k != "output"}
+        results["launch_to_cached_plan"].update({
+            "ok": output["ok"],
+            "stage_errors": output["stage_errors"],
+            "catalog_from_cache": catalog_from_cache,
+            "heavy_modules_loaded": [m for m in loaded if m in HEAVY_MODULES],
+        })
+        if not output["ok"]:
+            failures.append("cached plan run failed")
+        if output["stage_errors"]:
+            failures.append("cached plan run had stage errors: " + json.dumps(output["stage_errors"]))
+        if not catalog_from_cache:
+            failures.append("cached plan run crawled the catalog instead of using the cache")
+        crawler_loaded = [m for m in CRAWLER_MODULES if m in loaded]
+        if crawler_loaded:
+            failures.append("crawler modules loaded by the cached plan run: " + ", ".join(crawler_loaded))
+        if plan["median_ms"] > args.max_plan_ms:
+            failures.append(f"launch to cached plan took {plan['median_ms']} ms (max {args.max_plan_ms})")
+
+    results["failures"] = failures
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Optional
+
+# Subject pages of the course catalog the tool plans with
+CATALOG_SUBJECTS = ["cpsc", "cybr"]
+
+
+class CatalogCache:
+    """
+    Persists parsed catalog data (course code, title, prerequisites) to disk so
+    repeat runs don't have to crawl the course catalog again. The validators of each
+    subject page (ETag, Last-Modified, content hash) are kept with it, so a refresh
+    only downloads and parses the pages that changed.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_path: str, ttl_hours: float = 168):
+        """
+        Initialize a CatalogCache object.
+
+        Args:
+            cache_path (str): Path of the cache file
+            ttl_hours (float): Hours a cached catalog stays fresh
+        """
+        self._cache_path = Path(cache_path)
+        self._ttl_seconds = ttl_hours * 3600
+
+    def load(self, catalog_url: str, subjects: List[str], allow_stale: bool = False) -> Optional[List[Dict]]:
+        """
+        Load cached catalog data.
+
+        Args:
+            catalog_url (str): Catalog the data was crawled from
+            subjects (List[str]): Subject prefixes the data must cover
+            allow_stale (bool): Return the data even if the TTL has expired
+
+        Returns:
+            Optional[List[Dict]]: Cached course data, None if missing, stale or for another catalog
+        """
+        payload = self._read()
+        if payload is None:
+            return None
+        if payload.get("catalog_url") != catalog_url or payload.get("subjects") != sorted(subjects):
+            return None
+        if not allow_stale and self.is_expired(payload.get("fetched_at", 0)):
+            return None
+        return payload.get("courses")
+
+    def load_pages(self, catalog_url: str, subjects: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        Load the subject page validators saved with the catalog data, expired or not.
+
+        Args:
+            catalog_url (str): Catalog the data was crawled from
+            subjects (List[str]): Subject prefixes the data must cover
+
+        Returns:
+            Optional[Dict[str, Dict]]: Per subject etag, last_modified, content_hash and
+                course_codes, None if the cache has none or is for another catalog
+        """
+        payload = self._read()
+        if payload is None:
+            return None
+        if payload.get("catalog_url") != catalog_url or payload.get("subjects") != sorted(subjects):
+            return None
+        pages = payload.get("pages")
+        return pages if isinstance(pages, dict) else None
+
+    def save(self, catalog_url: str, subjects: List[str], courses: List[Dict],
+             pages: Optional[Dict[str, Dict]] = None) -> None:
+        """
+        Save catalog data to the cache file.
+
+        Args:
+            catalog_url (str): Catalog the data was crawled from
+            subjects (List[str]): Subject prefixes covered by the data
+            courses (List[Dict]): Parsed course data from the WebCrawler
+            pages (Optional[Dict[str, Dict]]): Validators and course codes of each subject page,
+                see load_pages()
+        """
+        payload = {
+            "version": self.CACHE_VERSION,
+            "catalog_url": catalog_url,
+            "subjects": sorted(subjects),
+            "fetched_at": time.time(),
+            "courses": courses,
+        }
+        if pages is not None:
+            payload["pages"] = pages
+        if self._cache_path.parent != Path(""):
+            os.makedirs(self._cache_path.parent, exist_ok=True)
+
+        # Write to a temp file first so an interrupted run never leaves a half written cache.
+        # One per process and thread, another tool or a background crawl may be saving too.
+        tmp_path = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self._cache_path)
+
+    def is_expired(self, fetched_at: float) -> bool:
+        """Check if data fetched at the given timestamp is past the TTL."""
+        return time.time() - fetched_at > self._ttl_seconds
+
+    def clear(self) -> None:
+        """Delete the cache file."""
+        if self._cache_path.exists():
+            os.remove(self._cache_path)
+
+    def _read(self) -> Optional[Dict]:
+        if not self._cache_path.is_file():
+            return None
+        try:
+            with open(self._cache_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            # Corrupt or unreadable cache is treated as a miss
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != self.CACHE_VERSION:
+            return None
+        return payload
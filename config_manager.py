@@ -81,6 +81,37 @@ class ConfigManager:
             "four_year_schedule_path": self.get_setting("four_year_schedule_path"),
         }
 
+    def get_cache_settings(self) -> Dict:
+        """
+        Get prerequisite catalog cache settings from configuration.
+        Caching is on unless cache_prerequisites is empty or "off"/"false"/"no".
+
+        Returns:
+            Dict: Dictionary containing cache settings
+        """
+        enabled = str(self.get_setting("cache_prerequisites") or "").strip().lower()
+        return {
+            "enabled": enabled not in ("", "0", "off", "false", "no"),
+            "cache_path": self.get_setting("prerequiste_cache_path"),
+            "ttl_hours": self.get_setting("prerequisite_cache_ttl_hours"),
+            "offline": self.get_setting("catalog_offline"),
+        }
+
+    def get_input_cache_settings(self) -> Dict:
+        """
+        Get parsed input cache settings from configuration.
+        Caching is on unless input_cache_directory is empty.
+
+        Returns:
+            Dict: Dictionary containing input cache settings
+        """
+        cache_directory = str(self.get_setting("input_cache_directory") or "").strip()
+        return {
+            "enabled": bool(cache_directory),
+            "cache_directory": cache_directory,
+            "max_bytes": self.get_setting("input_cache_max_mb") * 1024 * 1024,
+        }
+
     def default_settings(self) -> Dict[str, Any]:
         """
         Set default configuration settings. Required minimum settings.
@@ -94,6 +125,19 @@ class ConfigManager:
         "course_catalog_url": "https://catalog.columbusstate.edu/course-descriptions/",
         "cache_prerequisites": "cacheprerequisites.txt",
         "prerequiste_cache_path": "prerequisites.cache",
+        "prerequisite_cache_ttl_hours": 168,
+        "catalog_offline": False,
+        "crawler_max_workers": 4,
+        "plan_strategy": "greedy",
+        "plan_time_limit_seconds": 5,
+        "batch_max_workers": 0,
+        "input_cache_directory": "input_cache",
+        "input_cache_max_mb": 64,
+        "pdf_extraction_workers": 1,
+        "pdf_stop_early": False,
+        "service_host": "127.0.0.1",
+        "service_port": 8080,
+        "profile_directory": "",
         "max_semester_hours": 15
         }
 
@@ -140,6 +184,9 @@ class ConfigManager:
 
                 if type(value) == str:
                     write_str += f"\"{value}\"\n"
+                elif type(value) == bool:
+                    # TOML booleans are lowercase
+                    write_str += f"{str(value).lower()}\n"
                 else:
                     write_str += f"{value}\n"
                 f.write(write_str)
@@ -1,12 +1,36 @@
-from typing import List
+import re
+from typing import List, Optional
+
+_COURSE_CODE = re.compile(r"([A-Za-z]{4})\s*(\d{4}[A-Za-z]?)")
+
+
+def normalize_course_code(code: str) -> str:
+    """
+    Normalize a course code to the "CPSC 1301K" form used across the tool.
+
+    Args:
+        code (str): Course code as found in the catalog, PDF or Excel files
+
+    Returns:
+        str: Normalized course code
+    """
+    match = _COURSE_CODE.search(code)
+    if not match:
+        return " ".join(code.split())
+    return match.group(1).upper() + " " + match.group(2).upper()
+
 
 class Course():
-    def __init__(self, code:str, name:str, hours:float, course_taken:bool = False, prereq:List[str] = []):
+    # Slotted, batch and service processes hold the courses of many plans
+    __slots__ = ("code", "name", "hours", "courseTaken", "prerequisites")
+
+    def __init__(self, code:str, name:str, hours:float, course_taken:bool = False, prereq:Optional[List[str]] = None):
             self.code = code 
             self.name = name
             self.hours = hours
             self.courseTaken = course_taken
-            self.prerequisites = prereq
+            # Own list per course, a shared default would leak addPrereq() into every other course
+            self.prerequisites = prereq if prereq is not None else []
 
     def addPrereq(self, *args):
           for a in args:
@@ -0,0 +1,88 @@
+from typing import List, Dict
+import instrumentation
+from course import normalize_course_code
+from prerequisite_expression import PrerequisiteEngine, parse_prerequisite_expression
+
+class CourseCatalog:
+    """
+    Indexed view of the crawled course catalog. Built once from the WebCrawler data,
+    every lookup is a dictionary access by normalized course code.
+    """
+
+    def __init__(self, course_data: List[Dict]):
+        """
+        Initialize a CourseCatalog object.
+
+        Args:
+            course_data (List[Dict]): Course data in the WebCrawler format
+                (Course_Code, Course_Title, Prerequisites, preq_list)
+        """
+        self._titles: Dict[str, str] = {}
+        self._prerequisites: Dict[str, List[List[str]]] = {}
+        self._prerequisite_codes: Dict[str, List[str]] = {}
+        self._subjects: Dict[str, List[str]] = {}
+        self._engine = PrerequisiteEngine()
+
+        for course in course_data:
+            code = normalize_course_code(course.get("Course_Code", ""))
+            text = course.get("Prerequisite_Text")
+            if text:
+                self._engine.compile(code, parse_prerequisite_expression(text))
+            else:
+                # Older cached data only has the flattened groups
+                self._engine.compile_groups(code, [[normalize_course_code(c) for c in group]
+                                                   for group in course.get("preq_list") or []])
+            groups = self._engine.get_groups(code)
+
+            self._titles[code] = course.get("Course_Title", "")
+            self._prerequisites[code] = groups
+            self._prerequisite_codes[code] = list(dict.fromkeys(c for group in groups for c in group))
+            self._subjects.setdefault(code.split(" ")[0], []).append(code)
+
+    def get_prerequisites(self, course_code: str) -> List[List[str]]:
+        """
+        Get the prerequisite groups of a course. Every group must be met,
+        any one course of a group meets it.
+        """
+        return self._prerequisites.get(self._key(course_code), [])
+
+    def get_prerequisite_codes(self, course_code: str) -> List[str]:
+        """Get every course code named in the prerequisites of a course."""
+        return self._prerequisite_codes.get(self._key(course_code), [])
+
+    def get_title(self, course_code: str) -> str:
+        """Get the title of a course, empty if the course is not in the catalog."""
+        return self._titles.get(self._key(course_code), "")
+
+    def get_subject_courses(self, subject: str) -> List[str]:
+        """Get the course codes of a subject prefix, e.g. "CPSC"."""
+        return self._subjects.get(subject.strip().upper(), [])
+
+    def get_prerequisite_engine(self) -> PrerequisiteEngine:
+        """Get the compiled prerequisite expressions for bitmask checks."""
+        return self._engine
+
+    def get_prerequisite_map(self) -> Dict[str, List[List[str]]]:
+        """Get the prerequisite groups of every course keyed by course code."""
+        return self._prerequisites
+
+    def course_codes(self) -> List[str]:
+        """Get every course code in the catalog."""
+        return list(self._titles.keys())
+
+    def has_course(self, course_code: str) -> bool:
+        return self._key(course_code) in self._titles
+
+    def __contains__(self, course_code: str) -> bool:
+        return self.has_course(course_code)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _key(self, course_code: str) -> str:
+        if instrumentation.enabled:
+            instrumentation.count("catalog_lookups")
+        # Most callers already pass normalized codes, skip the regex for them
+        if course_code in self._titles:
+            return course_code
+        return normalize_course_code(course_code)
@@ -0,0 +1,179 @@
+from array import array
+from typing import List, Dict, Iterable, Optional
+
+
+class CourseGraph:
+    """
+    Compact prerequisite graph. Course codes are mapped to dense integer ids and the
+    edges are stored in CSR form (an offsets array plus a flat targets array) in both
+    directions. Every algorithm is iterative, so long prerequisite chains can't hit
+    the recursion limit.
+    """
+
+    def __init__(self, prerequisites: Dict[str, Iterable[str]]):
+        """
+        Initialize a CourseGraph object.
+
+        Args:
+            prerequisites (Dict[str, Iterable[str]]): Course code to its prerequisite codes.
+                Prerequisites that are not keys themselves become nodes without prerequisites.
+        """
+        self._ids: Dict[str, int] = {}
+        self._codes: List[str] = []
+
+        edges = []  # (course id, prerequisite id)
+        for code in prerequisites:
+            self._add_node(code)
+        for code, prereqs in prerequisites.items():
+            course_id = self._ids[code]
+            for prereq in dict.fromkeys(prereqs):
+                if prereq == code:
+                    continue
+                edges.append((course_id, self._add_node(prereq)))
+
+        # course -> prerequisites and prerequisite -> dependents
+        self._prereq_offsets, self._prereq_targets = self._build_csr(edges, 0)
+        self._dependent_offsets, self._dependent_targets = self._build_csr(edges, 1)
+
+    def _add_node(self, code: str) -> int:
+        node = self._ids.get(code)
+        if node is None:
+            node = len(self._codes)
+            self._ids[code] = node
+            self._codes.append(code)
+        return node
+
+    def _build_csr(self, edges: List, source: int):
+        count = len(self._codes)
+        offsets = array("l", [0]) * (count + 1)
+        for edge in edges:
+            offsets[edge[source] + 1] += 1
+        for i in range(count):
+            offsets[i + 1] += offsets[i]
+
+        targets = array("l", [0]) * len(edges)
+        fill = array("l", offsets[:count])
+        target = 1 - source
+        for edge in edges:
+            node = edge[source]
+            targets[fill[node]] = edge[target]
+            fill[node] += 1
+        return offsets, targets
+
+    def node_count(self) -> int:
+        return len(self._codes)
+
+    def edge_count(self) -> int:
+        return len(self._prereq_targets)
+
+    def get_id(self, course_code: str) -> Optional[int]:
+        return self._ids.get(course_code)
+
+    def get_code(self, node: int) -> str:
+        return self._codes[node]
+
+    def get_prerequisites(self, course_code: str) -> List[str]:
+        node = self._ids[course_code]
+        return [self._codes[t] for t in self._prereq_targets[self._prereq_offsets[node]:self._prereq_offsets[node + 1]]]
+
+    def get_dependents(self, course_code: str) -> List[str]:
+        node = self._ids[course_code]
+        return [self._codes[t] for t in self._dependent_targets[self._dependent_offsets[node]:self._dependent_offsets[node + 1]]]
+
+    def topological_sort(self) -> List[str]:
+        """
+        Kahn's algorithm. Prerequisites come before the courses that need them.
+        Courses on or behind a circular dependency are left out, see find_cycle_courses().
+        """
+        return [self._codes[node] for node in self._kahn_order()]
+
+    def find_course_levels(self) -> Dict[str, int]:
+        """
+        Length of the longest prerequisite chain behind each course. Courses
+        without prerequisites are level 0.
+        """
+        offsets, targets = self._prereq_offsets, self._prereq_targets
+        levels = array("l", [0]) * len(self._codes)
+        order = self._kahn_order()
+        for node in order:
+            level = 0
+            for i in range(offsets[node], offsets[node + 1]):
+                prereq_level = levels[targets[i]] + 1
+                if prereq_level > level:
+                    level = prereq_level
+            levels[node] = level
+        return {self._codes[node]: levels[node] for node in order}
+
+    def find_cycle_courses(self) -> List[str]:
+        """
+        Courses that are part of, or sit between, circular dependencies. Peels off
+        every course that has no remaining prerequisites or no remaining dependents,
+        whatever is left can't be ordered.
+        """
+        count = len(self._codes)
+        remaining_prereqs = array("l", (self._prereq_offsets[n + 1] - self._prereq_offsets[n] for n in range(count)))
+        remaining_dependents = array("l", (self._dependent_offsets[n + 1] - self._dependent_offsets[n] for n in range(count)))
+        removed = bytearray(count)
+
+        stack = [n for n in range(count) if remaining_prereqs[n] == 0 or remaining_dependents[n] == 0]
+        while stack:
+            node = stack.pop()
+            if removed[node]:
+                continue
+            removed[node] = 1
+            for i in range(self._dependent_offsets[node], self._dependent_offsets[node + 1]):
+                dependent = self._dependent_targets[i]
+                remaining_prereqs[dependent] -= 1
+                if remaining_prereqs[dependent] == 0 and not removed[dependent]:
+                    stack.append(dependent)
+            for i in range(self._prereq_offsets[node], self._prereq_offsets[node + 1]):
+                prereq = self._prereq_targets[i]
+                remaining_dependents[prereq] -= 1
+                if remaining_dependents[prereq] == 0 and not removed[prereq]:
+                    stack.append(prereq)
+
+        return [self._codes[n] for n in range(count) if not removed[n]]
+
+    def get_all_prerequisites(self, course_code: str) -> List[str]:
+        """Every course behind a course's prerequisite chain."""
+        return self._reachable(course_code, self._prereq_offsets, self._prereq_targets)
+
+    def get_all_dependents(self, course_code: str) -> List[str]:
+        """Every course that completing a course leads towards."""
+        return self._reachable(course_code, self._dependent_offsets, self._dependent_targets)
+
+    def _reachable(self, course_code: str, offsets: array, targets: array) -> List[str]:
+        start = self._ids.get(course_code)
+        if start is None:
+            return []
+        seen = bytearray(len(self._codes))
+        seen[start] = 1
+        stack = [start]
+        found = []
+        while stack:
+            node = stack.pop()
+            for i in range(offsets[node], offsets[node + 1]):
+                target = targets[i]
+                if not seen[target]:
+                    seen[target] = 1
+                    found.append(target)
+                    stack.append(target)
+        return [self._codes[n] for n in found]
+
+    def _kahn_order(self) -> List[int]:
+        count = len(self._codes)
+        offsets = self._prereq_offsets
+        in_degree = array("l", (offsets[n + 1] - offsets[n] for n in range(count)))
+        order = [n for n in range(count) if in_degree[n] == 0]
+
+        dep_offsets, dep_targets = self._dependent_offsets, self._dependent_targets
+        head = 0
+        while head < len(order):
+            node = order[head]
+            head += 1
+            for i in range(dep_offsets[node], dep_offsets[node + 1]):
+                dependent = dep_targets[i]
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    order.append(dependent)
+        return order
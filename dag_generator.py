@@ -1,5 +1,8 @@
-from typing import List, Dict
+import heapq
+from typing import List, Dict, Optional, Iterable
 from course import Course
+from course_catalog import CourseCatalog
+from course_graph import CourseGraph
 
 
 class DAGGenerator:
@@ -7,69 +10,350 @@ class DAGGenerator:
     Generates and manages Directed Acyclic Graph for course prerequisites.
     """
     
-    def __init__(self, courses: Dict[str, Course] = {}):
+    def __init__(self, courses: Optional[Dict[str, Course]] = None):
         """
         Initialize a DAGGenerator object.
         
         Args:
             courses (Dict[str, Course]): Dictionary of course codes to Course objects
         """
-        self._courses = courses
-        self._prerequisite_graph = {}
-        self._adjacency_list = {}
+        self._courses = courses if courses is not None else {}
+        self._prerequisite_graph: Dict[str, List[str]] = {}
+        self._adjacency_list: Dict[str, List[str]] = {}
+        # Maintained topological order (prerequisites first) and levels, see add_prerequisite()
+        self._order: List[Optional[str]] = []
+        self._position: Dict[str, int] = {}
+        self._levels: Dict[str, int] = {}
+        # Memoized transitive closure as bitsets, one bit per course, see get_all_prerequisites()
+        self._bits: Dict[str, int] = {}
+        self._bit_codes: List[str] = []
+        self._ancestors: Dict[str, int] = {}
+        self._descendants: Dict[str, int] = {}
     
     def build_prerequisite_dag(self) -> Dict:
+        self._prerequisite_graph = {}
+        self._adjacency_list = {}
         for course in self._courses.values():
-            self._prerequisite_graph[course.code] = course.prerequisites
-            for prereq in course.prerequisites:
+            prereqs = [p for p in dict.fromkeys(course.prerequisites) if p != course.code]
+            self._prerequisite_graph[course.code] = prereqs
+            for prereq in prereqs:
                 if prereq not in self._adjacency_list:
                     self._adjacency_list[prereq] = []
                 self._adjacency_list[prereq].append(course.code)
-        
-    
+
+        # Seed the incrementally maintained order and levels
+        graph = CourseGraph(self._prerequisite_graph)
+        self._levels = graph.find_course_levels()
+        self._order = graph.topological_sort()
+        ordered = set(self._order)
+        # Courses on a circular dependency can't be ordered, keep them at the end, followed by
+        # the courses that need them (Kahn's order leaves out both)
+        self._order += [code for code in graph.find_cycle_courses() if code not in ordered]
+        ordered.update(self._order)
+        self._order += self._order_behind_cycles(
+            [code for code in dict.fromkeys([*self._prerequisite_graph, *self._adjacency_list]) if code not in ordered])
+        self._position = {code: i for i, code in enumerate(self._order)}
+        for code in self._order:
+            if code not in self._levels:
+                self._levels[code] = self._level_of(code)
+
+        self._bit_codes = list(self._order)
+        self._bits = {code: 1 << i for i, code in enumerate(self._bit_codes)}
+        self._ancestors = {}
+        self._descendants = {}
+        return self._prerequisite_graph
+
+    # ---------------------------
+    # Incremental updates
+    # ---------------------------
+    def add_course(self, course: Course) -> None:
+        """
+        Add a course, or replace one, without rebuilding the graph.
+
+        Raises:
+            CircularDependencyError: If a prerequisite would create a cycle
+        """
+        self._courses[course.code] = course
+        self._add_node(course.code)
+        for prereq in list(self._prerequisite_graph[course.code]):
+            if prereq not in course.prerequisites:
+                self.remove_prerequisite(course.code, prereq)
+        for prereq in course.prerequisites:
+            self.add_prerequisite(course.code, prereq)
+
+    def remove_course(self, course_code: str) -> None:
+        """Remove a course and every prerequisite edge to or from it."""
+        self._courses.pop(course_code, None)
+        if course_code not in self._position:
+            return
+        for prereq in list(self._prerequisite_graph.get(course_code, [])):
+            self.remove_prerequisite(course_code, prereq)
+        for dependent in list(self._adjacency_list.get(course_code, [])):
+            self.remove_prerequisite(dependent, course_code)
+
+        self._order[self._position.pop(course_code)] = None
+        self._prerequisite_graph.pop(course_code, None)
+        self._adjacency_list.pop(course_code, None)
+        self._levels.pop(course_code, None)
+        self._ancestors.pop(course_code, None)
+        self._descendants.pop(course_code, None)
+        if len(self._position) * 2 < len(self._order):
+            self._compact_order()
+
+    def add_prerequisite(self, course_code: str, prereq_code: str) -> None:
+        """
+        Add a prerequisite edge and repair the topological order and levels in place.
+        Only courses between the two positions in the current order are touched.
+
+        Raises:
+            CircularDependencyError: If the edge would create a cycle
+        """
+        self._add_node(course_code)
+        self._add_node(prereq_code)
+        if prereq_code in self._prerequisite_graph[course_code]:
+            return
+        if prereq_code == course_code:
+            raise CircularDependencyError(f"{course_code} can't be its own prerequisite")
+
+        lower, upper = self._position[course_code], self._position[prereq_code]
+        if lower < upper:
+            self._reorder(course_code, prereq_code, lower, upper)
+
+        self._invalidate_closure(course_code, prereq_code)
+        self._prerequisite_graph[course_code].append(prereq_code)
+        self._adjacency_list.setdefault(prereq_code, []).append(course_code)
+        self._update_levels([course_code])
+
+    def remove_prerequisite(self, course_code: str, prereq_code: str) -> None:
+        """Remove a prerequisite edge. The order stays valid, levels are repaired."""
+        prereqs = self._prerequisite_graph.get(course_code, [])
+        if prereq_code not in prereqs:
+            return
+        self._invalidate_closure(course_code, prereq_code)
+        prereqs.remove(prereq_code)
+        self._adjacency_list[prereq_code].remove(course_code)
+        self._update_levels([course_code])
+
+    def get_topological_order(self) -> List[str]:
+        """Incrementally maintained order, prerequisites before the courses that need them."""
+        return [code for code in self._order if code is not None]
+
+    def get_levels(self) -> Dict[str, int]:
+        """Incrementally maintained length of the longest prerequisite chain behind each course."""
+        return dict(self._levels)
+
+    # ---------------------------
+    # Reachability queries
+    # ---------------------------
+    def get_all_prerequisites(self, course_code: str) -> List[str]:
+        """Every course in the prerequisite chain behind a course."""
+        return self._decode(self._closure(course_code, self._prerequisite_graph, self._ancestors))
+
+    def get_unlocked_courses(self, course_code: str) -> List[str]:
+        """Every course that completing a course leads towards, directly or not."""
+        return self._decode(self._closure(course_code, self._adjacency_list, self._descendants))
+
+    def get_unlock_count(self, course_code: str) -> int:
+        """Number of courses downstream of a course."""
+        return self._closure(course_code, self._adjacency_list, self._descendants).bit_count()
+
+    def get_chain_length(self, course_code: str) -> int:
+        """Length of the longest prerequisite chain behind a course."""
+        return self._levels.get(course_code, 0)
+
+    def is_prerequisite_of(self, prereq_code: str, course_code: str) -> bool:
+        """Check if a course is anywhere in the prerequisite chain of another."""
+        bit = self._bits.get(prereq_code, 0)
+        return bool(bit and self._closure(course_code, self._prerequisite_graph, self._ancestors) & bit)
+
+    def _closure(self, code: str, edges: Dict[str, List[str]], memo: Dict[str, int]) -> int:
+        # Iterative post-order so a course's neighbors are memoized before the course itself
+        if code in memo:
+            return memo[code]
+        if code not in self._bits:
+            return 0
+        on_path = set()
+        finished = set()
+        stack = [(code, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in memo or node in finished:
+                continue
+            if not expanded:
+                if node in on_path:
+                    continue  # circular dependency
+                on_path.add(node)
+                stack.append((node, True))
+                stack.extend((n, False) for n in edges.get(node, [])
+                             if n not in memo and n not in on_path and n not in finished)
+                continue
+            on_path.discard(node)
+            finished.add(node)
+            # A walk cut short by a circular dependency is incomplete, only memoize
+            # courses whose neighbors all have their complete closure
+            if all(neighbor in memo for neighbor in edges.get(node, [])):
+                bits = 0
+                for neighbor in edges.get(node, []):
+                    bits |= self._bits[neighbor] | memo[neighbor]
+                memo[node] = bits
+        if code in memo:
+            return memo[code]
+
+        # On or behind a circular dependency: plain walk, reusing the memoized closures
+        bits = 0
+        seen = {code}
+        stack = [code]
+        while stack:
+            for neighbor in edges.get(stack.pop(), []):
+                bits |= self._bits[neighbor] | memo.get(neighbor, 0)
+                if neighbor not in memo and neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return bits
+
+    def _invalidate_closure(self, course_code: str, prereq_code: str) -> None:
+        # An edge between the two only changes the ancestors of the course and everything
+        # downstream of it, and the descendants of the prerequisite and everything upstream
+        stale_ancestors = self._closure(course_code, self._adjacency_list, self._descendants) | self._bits[course_code]
+        stale_descendants = self._closure(prereq_code, self._prerequisite_graph, self._ancestors) | self._bits[prereq_code]
+        for code in self._decode(stale_ancestors):
+            self._ancestors.pop(code, None)
+        for code in self._decode(stale_descendants):
+            self._descendants.pop(code, None)
+
+    def _decode(self, bits: int) -> List[str]:
+        codes = []
+        while bits:
+            low = bits & -bits
+            codes.append(self._bit_codes[low.bit_length() - 1])
+            bits ^= low
+        return codes
+
+    def _add_node(self, code: str) -> None:
+        if code in self._position:
+            return
+        self._position[code] = len(self._order)
+        self._order.append(code)
+        self._prerequisite_graph.setdefault(code, [])
+        self._levels[code] = 0
+        if code not in self._bits:
+            self._bits[code] = 1 << len(self._bit_codes)
+            self._bit_codes.append(code)
+
+    def _reorder(self, course_code: str, prereq_code: str, lower: int, upper: int) -> None:
+        # Pearce-Kelly: the new prerequisite sits after the course in the order. Collect
+        # the courses after the course (up to the prerequisite) that depend on it and the
+        # courses before the prerequisite (down to the course) that it depends on, then
+        # hand their positions back out with the prerequisite side first.
+        forward = self._collect(course_code, self._adjacency_list, lambda pos: pos <= upper)
+        if prereq_code in forward:
+            raise CircularDependencyError(f"{prereq_code} already depends on {course_code}")
+        backward = self._collect(prereq_code, self._prerequisite_graph, lambda pos: pos >= lower)
+        # The two sets only overlap on a circular dependency already in the catalog, give
+        # those courses one slot
+        forward -= backward
+
+        nodes = sorted(backward, key=self._position.get) + sorted(forward, key=self._position.get)
+        slots = sorted(self._position[code] for code in nodes)
+        for slot, code in zip(slots, nodes):
+            self._order[slot] = code
+            self._position[code] = slot
+
+    def _collect(self, start: str, edges: Dict[str, List[str]], in_region) -> set:
+        found = {start}
+        stack = [start]
+        while stack:
+            for neighbor in edges.get(stack.pop(), []):
+                if neighbor not in found and in_region(self._position[neighbor]):
+                    found.add(neighbor)
+                    stack.append(neighbor)
+        return found
+
+    def _update_levels(self, changed: Iterable[str]) -> None:
+        # Walk forward in topological order so every course sees its prerequisites' final level
+        heap = [(self._position[code], code) for code in changed]
+        heapq.heapify(heap)
+        queued = set(changed)
+        while heap:
+            _, code = heapq.heappop(heap)
+            queued.discard(code)
+            level = self._level_of(code)
+            if level == self._levels.get(code):
+                continue
+            self._levels[code] = level
+            for dependent in self._adjacency_list.get(code, []):
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heapq.heappush(heap, (self._position[dependent], dependent))
+
+    def _order_behind_cycles(self, codes: List[str]) -> List[str]:
+        # Kahn's algorithm over the courses left after the cycles, prerequisites that sit on a
+        # cycle are already placed and don't count
+        pending = set(codes)
+        in_degree = {code: sum(1 for p in self._prerequisite_graph.get(code, []) if p in pending) for code in codes}
+        order = [code for code in codes if in_degree[code] == 0]
+        for code in order:
+            for dependent in self._adjacency_list.get(code, []):
+                if dependent in in_degree:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        order.append(dependent)
+        return order
+
+    def _level_of(self, code: str) -> int:
+        # Only prerequisites earlier in the order count, so the edge that closes a circular
+        # dependency is ignored instead of raising the levels around it forever
+        position = self._position[code]
+        return max((self._levels[p] + 1 for p in self._prerequisite_graph.get(code, [])
+                    if self._position[p] < position), default=0)
+
+    def _compact_order(self) -> None:
+        self._order = [code for code in self._order if code is not None]
+        self._position = {code: i for i, code in enumerate(self._order)}
+
     def topological_sort(self) -> List[str]:
         tsList: List[str] = []
         visited: Dict[str, bool] = {}
-        def dfs(course_code: str):
-            visited[course_code] = True
-            for neighbor in self._prerequisite_graph.get(course_code, []):
-                if not visited.get(neighbor, False):
-                    dfs(neighbor)
-            tsList.append(course_code)
+        # Depth-first with an explicit stack, long prerequisite chains can't hit the recursion limit
         for course_code in self._courses.keys():
-            if not visited.get(course_code, False):
-                dfs(course_code)
+            if visited.get(course_code, False):
+                continue
+            visited[course_code] = True
+            stack = [(course_code, iter(self._prerequisite_graph.get(course_code, [])))]
+            while stack:
+                code, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if not visited.get(neighbor, False):
+                        visited[neighbor] = True
+                        stack.append((neighbor, iter(self._prerequisite_graph.get(neighbor, []))))
+                        break
+                else:
+                    stack.pop()
+                    tsList.append(code)
         return tsList[::-1]
     
     def find_course_levels(self) -> Dict[str, int]:
-        levels: Dict[str, int] = {}
-        def dfs(course_code: str) -> int:
-            if course_code in levels:
-                return levels[course_code]
-            if not self._prerequisite_graph.get(course_code):
-                levels[course_code] = 0
-                return 0
-            max_level = 0
-            for prereq in self._prerequisite_graph[course_code]:
-                prereq_level = dfs(prereq)
-                max_level = max(max_level, prereq_level + 1)
-            levels[course_code] = max_level
-            return max_level
-        for course_code in self._courses.keys():
-            dfs(course_code)
-        return levels
-    
+        return self.get_course_graph().find_course_levels()
+
     def detect_circular_dependencies(self) -> List[str]:
         def dfs(course_code: str, visited: Dict[str, bool], rec_stack: Dict[str, bool]) -> bool:
+            # Explicit stack of (course, prerequisites left to visit) instead of recursion
             visited[course_code] = True
             rec_stack[course_code] = True
-            for neighbor in self._prerequisite_graph.get(course_code, []):
-                if not visited.get(neighbor, False):
-                    if dfs(neighbor, visited, rec_stack):
+            stack = [(course_code, iter(self._prerequisite_graph.get(course_code, [])))]
+            while stack:
+                code, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if not visited.get(neighbor, False):
+                        visited[neighbor] = True
+                        rec_stack[neighbor] = True
+                        stack.append((neighbor, iter(self._prerequisite_graph.get(neighbor, []))))
+                        break
+                    elif rec_stack.get(neighbor, False):
                         return True
-                elif rec_stack.get(neighbor, False):
-                    return True
-            rec_stack[course_code] = False
+                else:
+                    rec_stack[code] = False
+                    stack.pop()
             return False
         visited: Dict[str, bool] = {}
         rec_stack: Dict[str, bool] = {}
@@ -80,6 +364,13 @@ class DAGGenerator:
                     circular_courses.append(course_code)
         return circular_courses
     
+    def get_course_graph(self) -> CourseGraph:
+        """
+        Build the compact, iterative graph core from the courses. Use it for
+        large catalogs or long prerequisite chains.
+        """
+        return CourseGraph({code: course.prerequisites for code, course in self._courses.items()})
+
     def get_courses_without_prerequisites(self) -> List[str]:
         no_prereq_courses: List[str] = []
         for course_code, course in self._courses.items():
@@ -89,3 +380,23 @@ class DAGGenerator:
 
     def set_courses(self, courses: Dict[str, Course]):
         self._courses = courses
+
+    def set_courses_from_catalog(self, catalog: CourseCatalog, course_codes: Optional[List[str]] = None):
+        """
+        Fill the courses straight from the catalog.
+
+        Args:
+            catalog (CourseCatalog): Indexed course catalog
+            course_codes (Optional[List[str]]): Courses to include, the whole catalog if None
+        """
+        if course_codes is None:
+            course_codes = catalog.course_codes()
+        self._courses = {
+            code: Course(code, catalog.get_title(code), 3, False, list(catalog.get_prerequisite_codes(code)))
+            for code in course_codes
+        }
+
+
+class CircularDependencyError(ValueError):
+    """Raised when a prerequisite would make the course graph circular."""
+    pass
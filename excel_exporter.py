@@ -1,26 +1,31 @@
-from typing import List, Dict
+import io
+from typing import List, Dict, Optional, TYPE_CHECKING
 from academic_plan import AcademicPlan
 from semester import Semester
-from openpyxl import Workbook
 import traceback
 from pathlib import Path
 
+# openpyxl is imported when a workbook is built
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+
 class ExcelExporter:
     """
     Exports academic plans to Excel format.
     """
     
-    def __init__(self, output_path: str):
+    def __init__(self, output_path: Optional[str] = None):
         """
         Initialize an ExcelExporter object.
         
         Args:
-            output_path (str): Path where the Excel file will be saved
+            output_path (Optional[str]): Path where the Excel file will be saved, None if
+                plans are only exported in memory with export_academic_plan_bytes()
         """
-        self._output_path = Path(output_path)
+        self._output_path = Path(output_path) if output_path else None
         self._template_path = ""
     
-    def create_semester_sheet(self, semester: Semester, workbook: Workbook) -> None:
+    def create_semester_sheet(self, semester: Semester, workbook: "Workbook") -> None:
         """ Create the worksheet in the workbook for a given semester """
         new_sheet = workbook.create_sheet(str(semester.name) + " " + str(semester.year))
         new_sheet.cell(row=1,column=1,value="Course Code")
@@ -42,23 +47,36 @@ class ExcelExporter:
     def export_academic_plan(self, plan: AcademicPlan) -> bool:
         """ Export plan to excel file """
         try:
-            wb = Workbook()
-            for sem in plan._semesters:
-                self.create_semester_sheet(sem,wb)
-            summarypage = wb.create_sheet("Summary", 0)
-            for key, val in self.format_plan_summary(plan).items():
-                ls = []
-                ls.append(key)
-                if hasattr(val, '__iter__'):
-                    ls += val 
-                else:
-                    ls.append(val)
-                summarypage.append(ls)
+            wb = self.build_workbook(plan)
             wb.save(self._output_path)
             return True
         except Exception as e:
             traceback.print_exc()
             return False
+
+    def export_academic_plan_bytes(self, plan: AcademicPlan) -> bytes:
+        """ Export plan to the content of an excel file, without writing it to disk """
+        buffer = io.BytesIO()
+        self.build_workbook(plan).save(buffer)
+        return buffer.getvalue()
+
+    def build_workbook(self, plan: AcademicPlan) -> "Workbook":
+        """ Create the workbook with a summary sheet and a sheet per semester """
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        for sem in plan._semesters:
+            self.create_semester_sheet(sem,wb)
+        summarypage = wb.create_sheet("Summary", 0)
+        for key, val in self.format_plan_summary(plan).items():
+            ls = []
+            ls.append(key)
+            if hasattr(val, '__iter__'):
+                ls += val 
+            else:
+                ls.append(val)
+            summarypage.append(ls)
+        return wb
         
     def format_plan_summary(self, plan: AcademicPlan) -> Dict:
         return plan.get_plan_summary()
@@ -1,25 +1,53 @@
-from typing import Dict, List, Tuple, Optional
-from openpyxl import worksheet
+from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
 
 from pathlib import Path
 from course import Course
-import openpyxl
+from input_cache import InputCache
+import instrumentation
 
-from openpyxl.utils.exceptions import InvalidFileException
 import re
+
+# openpyxl is only imported once a workbook is opened, results served from the
+# input cache don't need it
+if TYPE_CHECKING:
+    from openpyxl import worksheet
+
+
+def __getattr__(name: str):
+    # excel_parser.InvalidFileException without importing openpyxl up front
+    if name == "InvalidFileException":
+        from openpyxl.utils.exceptions import InvalidFileException
+        return InvalidFileException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _invalid_file_error() -> Exception:
+    from openpyxl.utils.exceptions import InvalidFileException
+    return InvalidFileException()
+
 class ExcelParser:
     """
     Parses Excel files to extract course schedule information.
     """
-    
-    def __init__(self, file_path: str):
+
+    # Bump when a parse step changes its output, so cached results are not reused
+    PARSER_VERSION = 1
+
+    def __init__(self, file_path: str, input_cache: Optional[InputCache] = None):
         """
         Initialize an ExcelParser object.
         
         Args:
             file_path (str): Path to the Excel file to parse
+            input_cache (Optional[InputCache]): Cache of parsed inputs shared between runs
         """
         self._file_path = Path(file_path)
+        self._input_cache = input_cache
+        # Workbook stays open for the whole run, results are memoized per file version
+        self._workbook = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._results_signature: Optional[Tuple[int, int]] = None
+        self._results: Dict[str, object] = {}
 
     def parse_graduate_study_plan(self, degree: str = "Software Dev") -> List[str]:
         """
@@ -28,14 +56,10 @@ class ExcelParser:
         Returns:
             Dict: Dictionary containing parsed graduate study plan data
         """
-        if not self.validate_excel_format():
-            raise InvalidFileException()
-
-        wb = openpyxl.load_workbook(self._file_path, read_only=True, data_only=True)
-        ws = wb.active
-        courses = self.extract_datablock_courses(ws, degree)
-
-        return courses
+        match = self._match_datablock(self._get_datablock_index(), degree)
+        if match is None:
+            return []
+        return list(match[2])
 
     def parse_four_year_schedule(self) -> Dict:
         """
@@ -44,10 +68,10 @@ class ExcelParser:
         Returns:
             Dict: Dictionary containing headers and row data
         """
-        if not self.validate_excel_format():
-            raise InvalidFileException()
-        wb = openpyxl.load_workbook(self._file_path, read_only=True, data_only=True)
-        ws = wb.active
+        courses = self._memoized("four_year_schedule", self._read_four_year_schedule)
+        return {course: list(terms) for course, terms in courses.items()}
+
+    def _read_four_year_schedule(self, ws: "worksheet") -> Dict:
 
         headers = None
         courses = {}
@@ -67,7 +91,6 @@ class ExcelParser:
                                 available_semster.append(headers[i])
                     courses[row[0]] = available_semster
 
-        wb.close()
         return courses
 
 
@@ -82,14 +105,90 @@ class ExcelParser:
         if self._file_path.suffix.lower() not in supported_ext:
             return False
 
+        from openpyxl.utils.exceptions import InvalidFileException
+
         try:
-            openpyxl.load_workbook(self._file_path, read_only=True, data_only=True)
+            self._open_workbook()
         except (InvalidFileException, ValueError, OSError):
             return False
 
         return True
 
-    def find_datablock(self, ws: worksheet, partial_match: str) -> Optional[Tuple[int, str]]:
+    def close(self) -> None:
+        """Close the workbook and drop the memoized results."""
+        if self._workbook is not None:
+            self._workbook.close()
+        self._workbook = None
+        self._signature = None
+        self._results_signature = None
+        self._results.clear()
+
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = self._file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _is_current(self) -> bool:
+        """Check if the open workbook still matches the file on disk."""
+        try:
+            return self._workbook is not None and self._signature == self._file_signature()
+        except OSError:
+            return False
+
+    def _open_workbook(self):
+        """Open the workbook once, again only if the file changed since."""
+        if self._is_current():
+            return self._workbook
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+        import openpyxl
+
+        signature = self._file_signature()
+        if instrumentation.enabled:
+            instrumentation.count("workbook_opens")
+        self._workbook = openpyxl.load_workbook(self._file_path, read_only=True, data_only=True)
+        self._signature = signature
+        return self._workbook
+
+    def _memoized(self, parser: str, read):
+        """
+        Result of a parse step, from memory, the input cache, or read(worksheet) on the workbook.
+        Memoized results are dropped when the file changes on disk.
+        """
+        try:
+            signature = self._file_signature()
+        except OSError:
+            raise _invalid_file_error()
+        if signature != self._results_signature:
+            self._results.clear()
+            self._results_signature = signature
+
+        if parser not in self._results:
+            result = None
+            if self._input_cache is not None:
+                result = self._input_cache.get(str(self._file_path), parser, self.PARSER_VERSION)
+            if result is None:
+                if not self.validate_excel_format():
+                    raise _invalid_file_error()
+                result = read(self._workbook.active)
+                if self._input_cache is not None:
+                    self._input_cache.put(str(self._file_path), parser, self.PARSER_VERSION, result)
+            self._results[parser] = result
+        return self._results[parser]
+
+    def get_datablocks(self) -> Dict[str, List[str]]:
+        """
+        Courses of every datablock (degree program) in the workbook, read in one pass.
+
+        Returns:
+            Dict[str, List[str]]: Full datablock name to its courses, in sheet order
+        """
+        datablocks = {}
+        for _, name, courses in self._get_datablock_index():
+            datablocks.setdefault(name, list(courses))
+        return datablocks
+
+    def find_datablock(self, ws: "worksheet", partial_match: str) -> Optional[Tuple[int, str]]:
         """
         Find a datablock (degree program) based on partial text match.
 
@@ -101,23 +200,12 @@ class ExcelParser:
             Optional[Tuple[int, str]]: Tuple of (row_index, full_datablock_name) if found,
                                        None otherwise
         """
-        search_term = partial_match.lower()
-
-        for row_idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
-            for cell_value in row:
-                if cell_value is None:
-                    continue
+        match = self._match_datablock(self.index_datablocks(ws), partial_match)
+        if match is None:
+            return None
+        return (match[0], match[1])
 
-                cell_str = str(cell_value).strip()
-                compare_str = cell_str.lower()
-
-                # Check if this looks like a datablock header (contains "-")
-                if " - " in cell_str and search_term in compare_str:
-                    return (row_idx, cell_str)
-
-        return None
-
-    def extract_datablock_courses(self, ws: worksheet, partial_match: str) -> List[str]:
+    def extract_datablock_courses(self, ws: "worksheet", partial_match: str) -> List[str]:
         """
         Extract courses from a datablock's Fall section (3 rows x 5 columns starting
         from the cell in the bottom right direction of the datablock header).
@@ -129,36 +217,58 @@ class ExcelParser:
         Returns:
             List[str]: List of courses found in the Fall section
         """
-        datablock_result = self.find_datablock(ws, partial_match)
-        if not datablock_result:
+        match = self._match_datablock(self.index_datablocks(ws), partial_match)
+        if match is None:
             return []
+        return list(match[2])
 
-        header_row, _ = datablock_result
-        courses = []
-
-        header_col = 3  # Default column C (index 3)
-        for col in range(1, ws.max_column + 1):
-            cell_value = ws.cell(row=header_row, column=col).value
-            if cell_value and " - " in str(cell_value):
-                header_col = col
-                break
-
-        # Start collecting courses 1 row below header, from column right of header
-        start_row = header_row + 1
-        start_col = header_col + 1
-
-        # Extract 3 rows x 5 columns
-        for row_offset in range(3):
-            current_row = start_row + row_offset
-            for col_offset in range(5):
-                cell_value = ws.cell(row=current_row, column=start_col + col_offset).value
-                if cell_value:
-                    course_str = str(cell_value).strip()
-                    # Skip empty cells and section headers
-                    if course_str and course_str.lower() not in ["elective"]:
-                        courses.append(course_str)
+    def index_datablocks(self, ws: "worksheet") -> List[Tuple[int, str, List[str]]]:
+        """
+        Index every datablock of a worksheet in a single streaming pass. Read-only
+        worksheets re-read the sheet on every ws.cell() call, so the course grid
+        (3 rows x 5 columns below and right of the header) is collected while the
+        rows go by instead.
 
-        return courses
+        Args:
+            ws worksheet: The worksheet to index
+
+        Returns:
+            List[Tuple[int, str, List[str]]]: (row_index, full_datablock_name, courses)
+                                              of every datablock, in sheet order
+        """
+        datablocks = []
+        open_blocks = []  # (header row, header column, courses) still collecting rows
+
+        for row_idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
+            for header_row, header_col, courses in open_blocks:
+                # Columns are 1-based, so row[header_col] is the cell right of the header
+                for cell_value in row[header_col:header_col + 5]:
+                    if cell_value:
+                        course_str = str(cell_value).strip()
+                        # Skip empty cells and section headers
+                        if course_str and course_str.lower() not in ["elective"]:
+                            courses.append(course_str)
+            open_blocks = [block for block in open_blocks if row_idx < block[0] + 3]
+
+            for col_idx, cell_value in enumerate(row, start=1):
+                if cell_value is None:
+                    continue
+                cell_str = str(cell_value).strip()
+                # Check if this looks like a datablock header (contains "-")
+                if " - " in cell_str:
+                    courses = []
+                    datablocks.append((row_idx, cell_str, courses))
+                    open_blocks.append((row_idx, col_idx, courses))
+
+        return datablocks
+
+    def _get_datablock_index(self) -> List[Tuple[int, str, List[str]]]:
+        return self._memoized("graduate_study_plan_datablocks", self.index_datablocks)
+
+    def _match_datablock(self, datablocks: List[Tuple[int, str, List[str]]],
+                         partial_match: str) -> Optional[Tuple[int, str, List[str]]]:
+        search_term = partial_match.lower()
+        return next((block for block in datablocks if search_term in block[1].lower()), None)
 
 if __name__ == "__main__":
     test = ExcelParser("input/Graduate Study Plans -revised.xlsx")
@@ -0,0 +1,148 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+import instrumentation
+
+
+class InputCache:
+    """
+    On-disk cache of parsed input files (DegreeWorks PDF, Excel workbooks). Entries are
+    keyed by the SHA-256 of the file content plus the parser name and version, so a
+    renamed or copied file still hits and a changed file or parser never does. Each
+    entry is gzipped JSON; the least recently used entries are evicted once the
+    directory grows past its size limit.
+    """
+
+    CACHE_VERSION = 1
+    ENTRY_SUFFIX = ".json.gz"
+
+    def __init__(self, cache_directory: str, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize an InputCache object.
+
+        Args:
+            cache_directory (str): Directory the cache entries are written to
+            max_bytes (int): Size limit of all entries together
+        """
+        self._cache_directory = Path(cache_directory)
+        self._max_bytes = max_bytes
+
+    def get(self, file_path: str, parser: str, parser_version: int) -> Optional[Any]:
+        """
+        Load the parsed result of a file.
+
+        Args:
+            file_path (str): Input file that was parsed
+            parser (str): Name of the parse step, e.g. "degreeworks_pdf"
+            parser_version (int): Version of the parse step
+
+        Returns:
+            Optional[Any]: Cached result, None if the file content wasn't parsed before
+        """
+        return self.get_hashed(self.hash_file(file_path), parser, parser_version)
+
+    def get_hashed(self, content_hash: Optional[str], parser: str, parser_version: int) -> Optional[Any]:
+        """Same as get(), for content that was already hashed, see hash_file() and hash_bytes()."""
+        entry_path = self._entry_path(content_hash, parser, parser_version)
+        if entry_path is None or not entry_path.is_file():
+            if instrumentation.enabled:
+                instrumentation.count("input_cache_misses")
+            return None
+        try:
+            with gzip.open(entry_path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+            # Mark as recently used for the eviction order
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            # Corrupt or evicted entry is treated as a miss
+            payload = None
+        if not isinstance(payload, dict) or payload.get("version") != self.CACHE_VERSION:
+            if instrumentation.enabled:
+                instrumentation.count("input_cache_misses")
+            return None
+        if instrumentation.enabled:
+            instrumentation.count("input_cache_hits")
+        return payload.get("result")
+
+    def put(self, file_path: str, parser: str, parser_version: int, result: Any) -> None:
+        """
+        Save the parsed result of a file and evict old entries past the size limit.
+
+        Args:
+            file_path (str): Input file that was parsed
+            parser (str): Name of the parse step, e.g. "degreeworks_pdf"
+            parser_version (int): Version of the parse step
+            result (Any): JSON serializable parse result
+        """
+        self.put_hashed(self.hash_file(file_path), parser, parser_version, result)
+
+    def put_hashed(self, content_hash: Optional[str], parser: str, parser_version: int, result: Any) -> None:
+        """Same as put(), for content that was already hashed, see hash_file() and hash_bytes()."""
+        entry_path = self._entry_path(content_hash, parser, parser_version)
+        if entry_path is None:
+            return
+        payload = {"version": self.CACHE_VERSION, "parser": parser, "result": result}
+        os.makedirs(self._cache_directory, exist_ok=True)
+
+        # Temp file per process and thread, batch workers may write the same entry at once
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, entry_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits its size limit."""
+        entries = []
+        for entry_path in self._cache_directory.glob("*" + self.ENTRY_SUFFIX):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        for entry_path in self._cache_directory.glob("*" + self.ENTRY_SUFFIX):
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+    def _entry_path(self, content_hash: Optional[str], parser: str, parser_version: int) -> Optional[Path]:
+        if content_hash is None:
+            return None
+        key = hashlib.sha256(f"{parser}:{parser_version}:{content_hash}".encode("utf-8")).hexdigest()
+        return self._cache_directory / (key + self.ENTRY_SUFFIX)
+
+    @staticmethod
+    def hash_file(file_path: str) -> Optional[str]:
+        """SHA-256 of a file's content, None if it can't be read."""
+        digest = hashlib.sha256()
+        try:
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_bytes(data) -> str:
+        """SHA-256 of in-memory content (bytes, bytearray, memoryview or mmap)."""
+        return hashlib.sha256(data).hexdigest()
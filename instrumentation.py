@@ -0,0 +1,178 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import List, Dict, Optional
+
+# Checked by the hot paths before counting, e.g. "if instrumentation.enabled: count(...)",
+# so a run without profiling pays one attribute lookup per operation
+enabled = False
+_profiler: Optional["Profiler"] = None
+_disabled_span = nullcontext()
+
+
+class Profiler:
+    """
+    Collects nested timing spans and operation counters of one run. Spans are kept per
+    thread, so stages running concurrently on the input executor nest on their own.
+    Export with to_dict() (plain JSON) or to_chrome_trace() (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self._spans: List[Dict] = []
+        self._counters: Counter = Counter()
+        self._threads: Dict[int, str] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **args):
+        """
+        Time the enclosed block as a span named name, nested under the open span of the thread.
+
+        Args:
+            name (str): Span name, e.g. "process_inputs"
+            **args: JSON serializable details shown with the span
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        path = f"{stack[-1]}/{name}" if stack else name
+        stack.append(path)
+        thread = threading.current_thread()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            stack.pop()
+            with self._lock:
+                self._threads.setdefault(thread.ident, thread.name)
+                self._spans.append({
+                    "name": name,
+                    "path": path,
+                    "thread": thread.ident,
+                    "start": started - self._started,
+                    "duration": duration,
+                    "args": args,
+                })
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add n to the counter of an operation, e.g. "prerequisite_checks"."""
+        with self._lock:
+            self._counters[name] += n
+
+    def get_counters(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def to_dict(self) -> Dict:
+        """Spans in start order with their total time per path, and the counters."""
+        with self._lock:
+            spans = sorted(self._spans, key=lambda s: s["start"])
+            counters = dict(self._counters)
+            threads = dict(self._threads)
+        totals: Dict[str, float] = {}
+        for s in spans:
+            totals[s["path"]] = totals.get(s["path"], 0.0) + s["duration"]
+        return {
+            "spans": [{
+                "name": s["name"],
+                "path": s["path"],
+                "thread": threads.get(s["thread"], str(s["thread"])),
+                "start_ms": round(s["start"] * 1000, 3),
+                "duration_ms": round(s["duration"] * 1000, 3),
+                "args": s["args"],
+            } for s in spans],
+            "totals_ms": {path: round(seconds * 1000, 3) for path, seconds in totals.items()},
+            "counters": counters,
+        }
+
+    def to_chrome_trace(self) -> Dict:
+        """Spans as complete ("X") events and the counters as one counter ("C") event per name."""
+        with self._lock:
+            spans = list(self._spans)
+            counters = dict(self._counters)
+            threads = dict(self._threads)
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in threads.items()]
+        end = 0.0
+        for s in spans:
+            events.append({
+                "name": s["name"],
+                "cat": "stage",
+                "ph": "X",
+                "ts": round(s["start"] * 1e6, 1),
+                "dur": round(s["duration"] * 1e6, 1),
+                "pid": pid,
+                "tid": s["thread"],
+                "args": s["args"],
+            })
+            end = max(end, s["start"] + s["duration"])
+        for name, value in counters.items():
+            events.append({"name": name, "cat": "counter", "ph": "C", "ts": round(end * 1e6, 1),
+                           "pid": pid, "args": {name: value}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, directory: str, name: str = "profile") -> List[str]:
+        """
+        Write <name>.json and <name>.trace.json to a directory.
+
+        Returns:
+            List[str]: Paths of the written files
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for path, payload in ((os.path.join(directory, name + ".json"), self.to_dict()),
+                              (os.path.join(directory, name + ".trace.json"), self.to_chrome_trace())):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
+            paths.append(path)
+        return paths
+
+
+def start() -> Profiler:
+    """Start collecting spans and counters into a new Profiler, until stop() is called."""
+    global enabled, _profiler
+    _profiler = Profiler()
+    enabled = True
+    return _profiler
+
+
+def stop() -> Optional[Profiler]:
+    """Stop collecting, returns the Profiler of the run (None if none was started)."""
+    global enabled, _profiler
+    profiler, _profiler = _profiler, None
+    enabled = False
+    return profiler
+
+
+def span(name: str, **args):
+    """Context manager timing a span of the running Profiler, does nothing when profiling is off."""
+    profiler = _profiler
+    if profiler is None:
+        return _disabled_span
+    return profiler.span(name, **args)
+
+
+def traced(name: str, **args):
+    """Decorator timing every call of a function as a span, e.g. @instrumentation.traced("parse_schedule")."""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*call_args, **call_kwargs):
+            with span(name, **args):
+                return function(*call_args, **call_kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name: str, n: int = 1) -> None:
+    """Count an operation in the running Profiler, does nothing when profiling is off."""
+    profiler = _profiler
+    if profiler is not None:
+        profiler.count(name, n)
@@ -1,36 +1,103 @@
+import io
+import mmap
 import os
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Iterable, Iterator, Union, BinaryIO, TYPE_CHECKING
 from pathlib import Path
-from pypdf import PdfReader
-from pypdf.errors import PdfReadError
+from input_cache import InputCache
+import instrumentation
 import re
 
+# pypdf is only imported once a PDF is opened, results served from the input
+# cache don't need it
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
+# Patterns used on every line of the audit, compiled once
+_CREDITS_NEEDED = re.compile(r'Still needed: \d Credits in (.+)')
+_CLASS_NEEDED = re.compile(r'Still needed: \d Class in (.+)')
+_MULTIPLE_SPACES = re.compile(r'[ \t]+')
+# Matches 4 capital character course prefix
+_COURSE_PREFIX = re.compile(r'^[A-Z]{4}')
+# Matches 4 digits or 4 digits Course number with capital 5th character
+_COURSE_NUMBER = re.compile(r'^[0-9]{4}[A-Z]?')
+# Matches course prefix and first digit, Ex: PHYS 1
+_CONTINUED_PREFIX = re.compile(r'^[A-Z]{4}\s+\d')
+# Matches course number 4 numbers or 4 numbers and a letter, Ex: 1030K 1031
+_CONTINUED_NUMBER = re.compile(r'^([0-9]{4} |[0-9]{4}[A-Z] )')
+# Sections DegreeWorks prints after the last requirement block
+_END_OF_REQUIREMENTS = re.compile(r'^(Fallthrough Courses|Insufficient|In-progress|Not Counted|Exceptions|Legend)\b')
+
+
+def __getattr__(name: str):
+    # pdf_parser.PdfReadError without importing pypdf up front
+    if name == "PdfReadError":
+        from pypdf.errors import PdfReadError
+        return PdfReadError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _extract_page_range(source: Union[str, bytes], start: int, stop: int) -> List[str]:
+    """Layout text of pages [start, stop). Runs in a worker process, which opens the PDF itself."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(source if isinstance(source, str) else io.BytesIO(source))
+    return [reader.pages[i].extract_text(extraction_mode="layout") for i in range(start, stop)]
+
 class PDFParser:
     """
     Parses PDF files to extract course information.
     Give it the name of the pdf on init and call obj.parse_degreeworks_pdf() to recieve a List[str] of all courses needed to be taken.
+    The PDF can also be given in memory (bytes, a binary buffer or an mmap), so uploads don't need a temp file.
+    One PdfReader is kept for validation and extraction, the cross-reference table is only parsed once.
+    Text flows through the parser as generators of lines, page by page, so no stage holds the whole audit.
     """
-    
-    def __init__(self, file_path: str):
+
+    # Bump when parse_degreeworks_pdf() changes its output, so cached results are not reused
+    PARSER_VERSION = 1
+
+    def __init__(self, source: Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO],
+                 input_cache: Optional[InputCache] = None, stop_early: bool = False, extraction_workers: int = 1):
         """
         Initialize a PDFParser object.
         
         Args:
-            file_path (str): Path to the PDF file to parse
+            source: Path of the PDF file, its content, or a binary buffer to read it from
+            input_cache (Optional[InputCache]): Cache of parsed inputs shared between runs
+            stop_early (bool): Stop reading pages once the sections after the requirement
+                blocks (Fallthrough Courses, Insufficient, ...) start
+            extraction_workers (int): Processes that extract page text in parallel, 1 extracts
+                in this process. Worth it for long audits, a process start costs more than a page.
         """
-        self._file_path = Path(file_path)
+        self._file_path: Optional[Path] = None
+        self._data = None
+        if isinstance(source, (str, os.PathLike)):
+            self._file_path = Path(source)
+        elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._data = source
+        else:
+            self._data = source.read()
+        self._reader: Optional["PdfReader"] = None
+        self._content_hash: Optional[str] = None
+        self._remaining_courses: Optional[List[str]] = None
+        self._input_cache = input_cache
+        self._stop_early = stop_early
+        self._extraction_workers = extraction_workers
     
-    def extract_remaining_courses(self, text: List[str]) -> List[str]:
+    def extract_remaining_courses(self, text: Iterable[str]) -> List[str]:
         """
         Extract remaining courses from the PDF.
         
         Returns:
             List[str]: List of remaining course codes
         """
-        remaining_courses = []
-        for line in text:
-            match = re.search(r'Still needed: \d Credits in (.+)', line)
-            second_match = re.search(r'Still needed: \d Class in (.+)', line)
+        return list(self.iter_remaining_courses(text))
+
+    def iter_remaining_courses(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield the remaining course codes of merged "Still needed:" lines."""
+        for line in lines:
+            match = _CREDITS_NEEDED.search(line)
+            second_match = _CLASS_NEEDED.search(line)
             if match or second_match:
                 if match:
                     line = match.group(1)
@@ -39,14 +106,10 @@ class PDFParser:
                 course_prefix = ""
 
                 for word in line.split(" "):
-                    # Matches 4 capital character course prefix
-                    if re.match(r'^[A-Z]{4}', word):
+                    if _COURSE_PREFIX.match(word):
                         course_prefix = word
-                    # Matches 4 digits or 4 digits Course number with capital 5th character
-                    elif re.match(r'^[0-9]{4}[A-Z]?', word):
-                        remaining_courses.append(course_prefix + " " + word)
-
-        return remaining_courses
+                    elif _COURSE_NUMBER.match(word):
+                        yield course_prefix + " " + word
     
     def parse_degreeworks_pdf(self) -> List[str]:
         """
@@ -55,31 +118,65 @@ class PDFParser:
         Returns:
             Dict: Dictionary containing parsed PDF data
         """
+        # Parsed once per PDFParser, the tool and PlanGenerator both ask for the courses
+        if self._remaining_courses is not None:
+            return list(self._remaining_courses)
+
+        cache_key = "degreeworks_pdf:stop_early" if self._stop_early else "degreeworks_pdf"
+        if self._input_cache is not None:
+            cached = self._input_cache.get_hashed(self._get_content_hash(), cache_key, self.PARSER_VERSION)
+            if cached is not None:
+                self._remaining_courses = cached
+                return list(cached)
+
         self.validate_pdf()
-        pages = self.extract_text()
-        pages = self.merge_course_requirements(pages.split("\n"))
-        remaining_courses = self.extract_remaining_courses(pages)
+        lines = self.iter_clean_lines(self.iter_page_text())
+        if self._stop_early:
+            lines = self._until_end_of_requirements(lines)
+        remaining_courses = self.extract_remaining_courses(self.iter_course_requirements(lines))
 
-        return remaining_courses
+        if self._input_cache is not None:
+            self._input_cache.put_hashed(self._get_content_hash(), cache_key, self.PARSER_VERSION, remaining_courses)
+        self._remaining_courses = remaining_courses
+        return list(remaining_courses)
 
     def extract_text(self) -> str:
-        pages = []
-        reader = PdfReader(str(self._file_path))
-
-        pages = ""
-        for page in reader.pages:
-            pages += page.extract_text(extraction_mode="layout") + "\n"
+        return "".join(line + "\n" for line in self.iter_clean_lines(self.iter_page_text()))
 
-        pages = self.clean_text(pages)
+    def iter_page_text(self) -> Iterator[str]:
+        """
+        Yield the layout text of each page, in page order. Pages are only extracted when the
+        next one is asked for, or ahead of time by the worker processes in parallel mode.
+        """
+        reader = self._get_reader()
+        page_count = len(reader.pages)
+        workers = min(self._extraction_workers, page_count)
+        if workers <= 1:
+            for page in reader.pages:
+                yield page.extract_text(extraction_mode="layout")
+            return
 
-        return pages
+        # One contiguous range of pages per worker, so each worker parses the file once
+        chunk = -(-page_count // workers)
+        source = str(self._file_path) if self._file_path is not None else bytes(self._data)
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [pool.submit(_extract_page_range, source, start, min(start + chunk, page_count))
+                       for start in range(0, page_count, chunk)]
+            for future in futures:
+                yield from future.result()
+        finally:
+            # Pages past an early stop are never extracted
+            pool.shutdown(wait=True, cancel_futures=True)
 
     def is_valid_pdf(self) -> bool:
-        if not self._file_path.exists() or not self._file_path.is_file():
+        from pypdf.errors import PdfReadError
+
+        if self._file_path is not None and (not self._file_path.exists() or not self._file_path.is_file()):
             return False
 
         try:
-            reader = PdfReader(str(self._file_path))
+            reader = self._get_reader()
         except PdfReadError:
             return False
         except Exception:
@@ -100,24 +197,64 @@ class PDFParser:
             Raises error
         """
         if not self.is_valid_pdf():
+            from pypdf.errors import PdfReadError
             raise PdfReadError
 
+    def close(self) -> None:
+        """Drop the PdfReader and the parsed courses, a later parse reads the PDF again."""
+        self._reader = None
+        self._remaining_courses = None
+
+    def _get_reader(self) -> "PdfReader":
+        if self._reader is None:
+            from pypdf import PdfReader
+
+            if instrumentation.enabled:
+                instrumentation.count("pdf_opens")
+            if self._file_path is not None:
+                self._reader = PdfReader(str(self._file_path))
+            elif isinstance(self._data, mmap.mmap):
+                # An mmap is a seekable stream already, no copy needed
+                self._data.seek(0)
+                self._reader = PdfReader(self._data)
+            else:
+                self._reader = PdfReader(io.BytesIO(self._data))
+        return self._reader
+
+    def _get_content_hash(self) -> Optional[str]:
+        if self._content_hash is None:
+            if self._file_path is not None:
+                self._content_hash = InputCache.hash_file(str(self._file_path))
+            else:
+                self._content_hash = InputCache.hash_bytes(self._data)
+        return self._content_hash
+
     def clean_text(self, text: str) -> str:
-        modified_text = ""
-        lines = text.split("\n")
+        return "".join(line + "\n" for line in self.iter_clean_lines([text]))
+
+    def iter_clean_lines(self, pages: Iterable[str]) -> Iterator[str]:
+        """Yield the non-empty lines of each page with runs of spaces collapsed."""
+        for text in pages:
+            for line in text.split("\n"):
+                #Replaces multiple spaces into a single one
+                line = _MULTIPLE_SPACES.sub(' ', line).strip()
+                if line:
+                    yield line
+
+    def _until_end_of_requirements(self, lines: Iterable[str]) -> Iterator[str]:
         for line in lines:
-            #Replaces multiple spaces into a single one
-            line = re.sub(r'[ \t]+', ' ', line)
-            line = line.strip()
-            if line:
-                modified_text += line + "\n"
-        return modified_text
+            if _END_OF_REQUIREMENTS.match(line):
+                return
+            yield line
 
     def merge_course_requirements(self, lines) -> List[str]:
         """
         Fixes the issue where each section might span multiple lines.
         """
-        merged = []
+        return list(self.iter_course_requirements(lines))
+
+    def iter_course_requirements(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield each "Still needed:" requirement with its continuation lines merged in."""
         buffer = ""
 
         for line in lines:
@@ -127,28 +264,24 @@ class PDFParser:
             if "Still needed:" in line:
                 # Save previous buffer if exists
                 if buffer:
-                    merged.append(buffer)
+                    yield buffer
                 buffer = line
 
             # If buffer exists and line looks like a continuation (starts with "or" or course code)
             elif buffer and (line.startswith("or ")
-                             # Matches course prefix and first digit, Ex: PHYS 1
-                             or re.match(r'^[A-Z]{4}\s+\d', line)
-                             # Matches course number 4 numbers or 4 numbers and a letter, Ex: 1030K 1031
-                             or re.match(r'^([0-9]{4} |[0-9]{4}[A-Z] )', line)):
+                             or _CONTINUED_PREFIX.match(line)
+                             or _CONTINUED_NUMBER.match(line)):
                 buffer += " " + line
 
             # Otherwise, it's a new line (not a continuation)
             else:
                 if buffer:
-                    merged.append(buffer)
+                    yield buffer
                     buffer = ""
 
         # Don't forget the last buffer
         if buffer:
-            merged.append(buffer)
-
-        return merged
+            yield buffer
 
     def sample_output_1(self) -> List[str] :
         """
@@ -1,12 +1,14 @@
-from typing import List, Dict
+import heapq
+import instrumentation
+from typing import List, Dict, Optional
 from academic_plan import AcademicPlan
 from semester import Semester
-from course import Course
+from course import Course, normalize_course_code
 from dag_generator import DAGGenerator
 from prerequisite_checker import PrerequisiteChecker
 from excel_parser import ExcelParser
-from web_crawler import WebCrawler
 from pdf_parser import PDFParser
+from plan_solver import PlanSolver
 
 
 class PlanGenerator:
@@ -20,7 +22,7 @@ class PlanGenerator:
         """
         self._remaining_courses = []
         self._completed_courses = []
-        self._course_catalog = {}
+        self._course_catalog = prerequisite_checker.get_course_catalog()
         self._max_hours_per_term = max_hours_per_term
         self._dag = dag
         self._prerequisite_checker = prerequisite_checker
@@ -28,65 +30,180 @@ class PlanGenerator:
         self._four_year_parser = four_year_parser
         self._degreeworks_parser = degreeworks_parser
         self._start_year_two_digit = start_year_two_digit
+        self._study_plan_courses: Optional[List[str]] = None
+        self._course_schedule: Optional[Dict[str, List[str]]] = None
+        self._required_courses: Optional[List[str]] = None
+
+    def set_shared_inputs(self, study_plan_courses: List[str], course_schedule: Dict[str, List[str]]) -> None:
+        """
+        Use already parsed Graduate Study Plan courses and four-year schedule instead of
+        parsing the Excel files again, e.g. when planning for many students.
+        """
+        self._study_plan_courses = study_plan_courses
+        self._course_schedule = course_schedule
+
+    def set_required_courses(self, required_courses: List[str]) -> None:
+        """
+        Use a list of still needed course codes instead of parsing the DegreeWorks PDF,
+        e.g. when a student's courses are given directly.
+        """
+        self._required_courses = required_courses
 
     def generate_optimal_plan(self) -> AcademicPlan:
         """
         Generate an optimal academic plan.
 
+        Greedy, term by term: every course offered in a term whose prerequisites were
+        completed in earlier terms is added in topological order while the hours fit.
+        Courses are only looked at when something changes for them. Each course keeps a
+        count of unmet prerequisite groups and is released once it drops to zero, then
+        waits in the queue of the next term it is offered in.
+
         Returns:
             AcademicPlan: The generated academic plan
         """
-        semesters = []
         self.populate_remaining_courses("Software Dev")
         self.process_degree_works()
 
-        course_schedule = self._four_year_parser.parse_four_year_schedule()
+        course_schedule = self._get_course_schedule()
 
         courses = self.generate_courses(self._remaining_courses)
         self._dag.set_courses(courses)
         self._dag.build_prerequisite_dag()
-        courses_topological_sort = self._dag.topological_sort()
+        rank = {code: i for i, code in enumerate(self._dag.topological_sort())}
 
-        current_semester_index = 0
-        semester_names = ["FA", "SP", "SU"]
-        current_year = self._start_year_two_digit
+        prior_completed = list(self._completed_courses)
+        engine = self._course_catalog.get_prerequisite_engine()
+        completed_mask = self._prerequisite_checker.completed_mask(prior_completed)
+        if instrumentation.enabled:
+            instrumentation.count("prerequisite_checks", len(self._remaining_courses))
+
+        # Unmet prerequisite groups per course, and which groups each planned course meets,
+        # by normalized code since catalog codes may differ in spacing, e.g. "CPSC\xa01301"
+        unmet: Dict[str, int] = {}
+        group_met: Dict[str, List[bool]] = {}
+        meets: Dict[str, List] = {}
+        for code in self._remaining_courses:
+            groups = engine.get_missing(code, completed_mask)
+            unmet[code] = len(groups)
+            group_met[code] = [False] * len(groups)
+            for g, group in enumerate(groups):
+                for member in group:
+                    meets.setdefault(normalize_course_code(member), []).append((code, g))
 
-        while self._remaining_courses:
-            semester_name = semester_names[current_semester_index % 3]
-            semester = Semester(semester_name, current_year, maxHours=self._max_hours_per_term, courses=[])
+        offered = {code: self._offered_term_indexes(course_schedule.get(code, [])) for code in self._remaining_courses}
+        queues: Dict[int, List] = {}
 
-            # Build the semester code to check availability (e.g., "FA25", "SP25")
-            semester_code = semester_name + str(current_year)
+        def release(code: str, after_term: int) -> None:
+            term = next((t for t in offered[code] if t > after_term), None)
+            if term is not None:
+                heapq.heappush(queues.setdefault(term, []), (rank.get(code, len(rank)), code))
 
-            # Try to add courses to this semester based on topological order
-            available_courses = [
-                course for course in courses_topological_sort
-                if course in self._remaining_courses
-                and self._prerequisite_checker.check_prerequisites(course, self._completed_courses)
-                and semester_code in course_schedule.get(course, [])
-            ]
+        for code in self._remaining_courses:
+            if unmet[code] == 0:
+                release(code, -1)
+
+        semesters = []
+        remaining = set(self._remaining_courses)
+        while queues:
+            term = min(queues)
+            queue = queues.pop(term)
+            name, year = self._term_for_index(term)
+            chosen = []
+            hours = 0
+            while queue:
+                _, code = heapq.heappop(queue)
+                course_obj = courses.get(code)
+                if hours + course_obj.getHours() <= self._max_hours_per_term:
+                    chosen.append(course_obj)
+                    hours += course_obj.getHours()
+                else:
+                    release(code, term)
 
-            for course in available_courses:
-                course_obj = courses.get(course)
-                if semester.getTotalCredits() + course_obj.getHours() <= semester.maxHours:
-                    if semester.addCourse(course_obj):
-                        self._remaining_courses.remove(course)
-                        self._completed_courses.append(course)
+            if not chosen:
+                continue
+            semesters.append(Semester(name, year, maxHours=self._max_hours_per_term, courses=chosen))
 
-            if semester.courses:  # Only add non-empty semesters
-                semesters.append(semester)
+            # Courses count as completed once the term is over
+            for course_obj in chosen:
+                remaining.discard(course_obj.code)
+                self._completed_courses.append(course_obj.code)
+                for dependent, g in meets.get(normalize_course_code(course_obj.code), []):
+                    if dependent in remaining and not group_met[dependent][g]:
+                        group_met[dependent][g] = True
+                        unmet[dependent] -= 1
+                        if unmet[dependent] == 0:
+                            release(dependent, term)
 
-            current_semester_index += 1
-            if current_semester_index % 3 == 0:
-                current_year += 1
+        if remaining:
+            print("[PlanGenerator] Can't schedule:", ", ".join(sorted(remaining)))
+        self._remaining_courses = [code for code in self._remaining_courses if code in remaining]
 
         # Create and return the academic plan
-        plan = AcademicPlan([], list(self._completed_courses))
+        planned = [code for sem in semesters for code in sem.getCourseCodes()] + self._remaining_courses
+        plan = AcademicPlan(planned, prior_completed, self._prerequisite_checker)
         for semester in semesters:
             plan.add_semester(semester)
-        test = plan.get_plan_summary()
         return plan
 
+    def _offered_term_indexes(self, term_codes: List[str]) -> List[int]:
+        """Sorted indexes of the terms a course is offered in, e.g. "SP26", see _term_for_index."""
+        semester_names = {"FA": 0, "SP": 1, "SU": 2}
+        indexes = set()
+        for term_code in term_codes:
+            term_code = str(term_code)
+            if term_code[:2] in semester_names and term_code[2:].isdigit():
+                index = (int(term_code[2:]) - self._start_year_two_digit) * 3 + semester_names[term_code[:2]]
+                if index >= 0:
+                    indexes.add(index)
+        return sorted(indexes)
+
+    def generate_solver_plan(self, time_limit: float = 5.0, max_terms: int = 30) -> AcademicPlan:
+        """
+        Generate the plan that finishes in the earliest term with a branch-and-bound search,
+        as an alternative to the greedy generate_optimal_plan. If the search can't finish
+        within the time limit the best plan found so far is returned, or the greedy plan if
+        it found none.
+
+        Args:
+            time_limit (float): Seconds to search
+            max_terms (int): Number of terms, starting at the first one, to plan within
+
+        Returns:
+            AcademicPlan: The generated academic plan
+        """
+        self.populate_remaining_courses("Software Dev")
+        self.process_degree_works()
+
+        course_schedule = self._get_course_schedule()
+        courses = self.generate_courses(self._remaining_courses)
+        self._dag.set_courses(courses)
+        self._dag.build_prerequisite_dag()
+
+        terms = [self._term_for_index(i) for i in range(max_terms)]
+        solver = PlanSolver(courses, self._completed_courses, [name + str(year) for name, year in terms],
+                            course_schedule, self._prerequisite_checker, self._max_hours_per_term)
+        solution = solver.solve(time_limit)
+        if not solver.is_optimal():
+            if not solution:
+                print("[PlanGenerator] Solver found no complete plan, using the greedy plan.")
+                self._completed_courses = []
+                return self.generate_optimal_plan()
+            print("[PlanGenerator] Solver stopped at the time limit, using the best plan found.")
+        if solver.get_unschedulable_courses():
+            print("[PlanGenerator] Can't schedule:", ", ".join(solver.get_unschedulable_courses()))
+
+        plan = AcademicPlan(list(self._remaining_courses), list(self._completed_courses), self._prerequisite_checker)
+        for term_index, codes in solution:
+            name, year = terms[term_index]
+            plan.add_semester(Semester(name, year, maxHours=self._max_hours_per_term,
+                                       courses=[courses[code] for code in codes]))
+        return plan
+
+    def _term_for_index(self, index: int):
+        """Semester name and two digit year of the nth term, following generate_optimal_plan."""
+        semester_names = ["FA", "SP", "SU"]
+        return semester_names[index % 3], self._start_year_two_digit + index // 3
 
     def prioritize_courses_by_dag(self) -> List[str]:
         """
@@ -139,22 +256,33 @@ class PlanGenerator:
         return semesters
 
     def populate_remaining_courses(self, degree: str) -> None:
+        if self._study_plan_courses is not None:
+            self._remaining_courses = list(self._study_plan_courses)
+            return
         self._remaining_courses = self._graduate_parser.parse_graduate_study_plan("Software Dev")
 
+    def _get_course_schedule(self) -> Dict[str, List[str]]:
+        if self._course_schedule is not None:
+            return self._course_schedule
+        return self._four_year_parser.parse_four_year_schedule()
+
     def generate_courses(self, courses: List[Course]) -> Dict[str, Course]:
         return_courses = {}
 
         for course in courses:
-            course_prereq = self._prerequisite_checker.get_missing_prerequisites(course, [])
-            new_course = Course(course, "", 3, False, course_prereq)
+            course_prereq = list(self._course_catalog.get_prerequisite_codes(course))
+            new_course = Course(course, self._course_catalog.get_title(course), 3, False, course_prereq)
             return_courses[course] = new_course
 
         return return_courses
 
     def process_degree_works(self):
-        required_courses = self._degreeworks_parser.parse_degreeworks_pdf()
+        if self._required_courses is not None:
+            required_courses = self._required_courses
+        else:
+            required_courses = self._degreeworks_parser.parse_degreeworks_pdf()
 
-        for course in self._remaining_courses[:]:
-            if course not in required_courses:
-                self._remaining_courses.remove(course)
-                self._completed_courses.append(course)
+        # One pass over the remaining courses, keeping their order
+        required = set(required_courses)
+        self._completed_courses.extend(course for course in self._remaining_courses if course not in required)
+        self._remaining_courses = [course for course in self._remaining_courses if course in required]
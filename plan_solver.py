@@ -0,0 +1,259 @@
+import time
+from typing import List, Dict, Optional, Tuple
+
+from course import Course
+from prerequisite_checker import PrerequisiteChecker
+
+INFEASIBLE = 1 << 30
+
+
+class PlanSolver:
+    """
+    Branch-and-bound search for the plan that finishes in the earliest term.
+
+    Terms are filled one at a time. Only maximal course sets are tried for a term,
+    since taking an available course as early as possible never delays anything.
+    A branch is cut when a lower bound (the earliest term each remaining course can
+    be taken given its prerequisite chain and offerings, and the credit hours left)
+    can't beat the best plan so far, or when the same remaining courses were already
+    reached in an earlier or equal term.
+    """
+
+    def __init__(self, courses: Dict[str, Course], completed: List[str], term_codes: List[str],
+                 course_schedule: Dict[str, List[str]], prerequisite_checker: PrerequisiteChecker,
+                 max_hours_per_term: int):
+        """
+        Initialize a PlanSolver object.
+
+        Args:
+            courses (Dict[str, Course]): Courses to schedule
+            completed (List[str]): Course codes already completed
+            term_codes (List[str]): Term codes in order, e.g. ["FA25", "SP25", ...]. Limits the search.
+            course_schedule (Dict[str, List[str]]): Course code to the term codes it is offered in
+            prerequisite_checker (PrerequisiteChecker): Checker with the compiled prerequisites
+            max_hours_per_term (int): Maximum credit hours per term
+        """
+        self._codes = list(courses.keys())
+        self._hours = [courses[code].getHours() for code in self._codes]
+        self._term_count = len(term_codes)
+        self._max_hours = max_hours_per_term
+        self._checker = prerequisite_checker
+
+        engine = prerequisite_checker.get_course_catalog().get_prerequisite_engine()
+        self._base_mask = prerequisite_checker.completed_mask(completed)
+        self._engine_bits = [engine.mask_of([code]) for code in self._codes]
+
+        # offered[t] is a bitmask of the courses offered in term t
+        self._offered = [0] * self._term_count
+        for i, code in enumerate(self._codes):
+            offered_terms = set(course_schedule.get(code, []))
+            for t, term in enumerate(term_codes):
+                if term in offered_terms:
+                    self._offered[t] |= 1 << i
+
+        # Prerequisite groups of each course, as local course bits. A group another course
+        # in the plan can't meet and completed courses don't meet makes the course infeasible.
+        local = {code: i for i, code in enumerate(self._codes)}
+        self._groups: List[List[int]] = []
+        self._blocked = 0
+        for i, code in enumerate(self._codes):
+            # A course with more hours than a term allows never fits, nor do its dependents
+            if self._hours[i] > max_hours_per_term:
+                self._blocked |= 1 << i
+            groups = []
+            for group in engine.get_missing(code, self._base_mask):
+                members = 0
+                for member in group:
+                    if member in local:
+                        members |= 1 << local[member]
+                if not members:
+                    self._blocked |= 1 << i
+                groups.append(members)
+            self._groups.append(groups)
+
+        self._order = self._local_topological_order()
+        self._tail = self._tail_lengths()
+
+        self._best_end = INFEASIBLE
+        self._best_terms: List[int] = []
+        self._seen: Dict[int, int] = {}
+        self._deadline = 0.0
+        self._timed_out = False
+        self._unschedulable: List[str] = []
+
+    def solve(self, time_limit: float = 5.0) -> List[Tuple[int, List[str]]]:
+        """
+        Search for the plan that finishes earliest.
+
+        Args:
+            time_limit (float): Seconds to search before returning the best plan found
+
+        Returns:
+            List[Tuple[int, List[str]]]: Term index and course codes of every non-empty term,
+            empty if no plan was found (see is_optimal)
+        """
+        self._deadline = time.perf_counter() + time_limit
+        self._timed_out = False
+        self._best_end = INFEASIBLE
+        self._best_terms = []
+        self._seen = {}
+
+        remaining = (1 << len(self._codes)) - 1
+        earliest = self._earliest_terms(remaining, 0, 0)
+        unschedulable = 0
+        for i in range(len(self._codes)):
+            if earliest[i] >= INFEASIBLE:
+                unschedulable |= 1 << i
+        self._unschedulable = self._decode(unschedulable)
+        remaining &= ~unschedulable
+
+        self._search(remaining, 0, 0, [])
+
+        plan = []
+        for t, taken in enumerate(self._best_terms):
+            if taken:
+                plan.append((t, self._decode(taken)))
+        return plan
+
+    def is_optimal(self) -> bool:
+        """True if the last solve() finished the search, so no plan ends earlier."""
+        return not self._timed_out and self._best_end < INFEASIBLE
+
+    def get_unschedulable_courses(self) -> List[str]:
+        """Courses that can't be scheduled within the terms, prerequisites or offerings."""
+        return list(self._unschedulable)
+
+    def _search(self, remaining: int, term: int, taken_mask: int, terms: List[int]) -> None:
+        if not remaining:
+            last = len(terms) - 1
+            while last >= 0 and not terms[last]:
+                last -= 1
+            if last < self._best_end:
+                self._best_end = last
+                self._best_terms = list(terms)
+            return
+        if time.perf_counter() > self._deadline:
+            self._timed_out = True
+            return
+
+        # Skip ahead to the next term something can be taken in
+        engine_mask = self._engine_mask(taken_mask)
+        while True:
+            if term >= self._term_count:
+                return
+            available = [i for i in self._order
+                         if remaining >> i & 1 and self._offered[term] >> i & 1
+                         and self._checker.check_prerequisites_mask(self._codes[i], engine_mask)]
+            if available:
+                break
+            term += 1
+            terms = terms + [0]
+
+        # Same courses left by an earlier or equal term was already explored
+        if self._seen.get(remaining, INFEASIBLE) <= term:
+            return
+        self._seen[remaining] = term
+
+        if self._lower_bound(remaining, term, taken_mask) >= self._best_end:
+            return
+
+        # Longest chain of remaining dependents first, so the first plan found is already good
+        available.sort(key=lambda i: -self._tail[i])
+        for chosen in self._maximal_sets(available):
+            self._search(remaining & ~chosen, term + 1, taken_mask | chosen, terms + [chosen])
+            if self._timed_out:
+                return
+
+    def _maximal_sets(self, available: List[int]):
+        """Yield every set of available courses that fits the hours and has no room for another."""
+        hours = self._hours
+        chosen = []
+
+        def extend(index: int, used: float):
+            if index == len(available):
+                spare = self._max_hours - used
+                taken = set(chosen)
+                if any(hours[i] <= spare for i in available if i not in taken):
+                    return
+                mask = 0
+                for i in chosen:
+                    mask |= 1 << i
+                yield mask
+                return
+            course = available[index]
+            if used + hours[course] <= self._max_hours:
+                chosen.append(course)
+                yield from extend(index + 1, used + hours[course])
+                chosen.pop()
+            yield from extend(index + 1, used)
+
+        yield from extend(0, 0)
+
+    def _lower_bound(self, remaining: int, term: int, taken_mask: int) -> int:
+        earliest = self._earliest_terms(remaining, term, taken_mask)
+        last = max((earliest[i] for i in range(len(self._codes)) if remaining >> i & 1), default=term)
+        hours_left = sum(self._hours[i] for i in range(len(self._codes)) if remaining >> i & 1)
+        terms_needed = -(-hours_left // self._max_hours) if self._max_hours > 0 else INFEASIBLE
+        return max(last, term + terms_needed - 1)
+
+    def _earliest_terms(self, remaining: int, term: int, taken_mask: int) -> List[int]:
+        # Earliest term each remaining course could be taken, ignoring credit hours
+        earliest = [term] * len(self._codes)
+        for i in self._order:
+            if not remaining >> i & 1:
+                continue
+            if self._blocked >> i & 1:
+                earliest[i] = INFEASIBLE
+                continue
+            start = term
+            for members in self._groups[i]:
+                if members & taken_mask:
+                    continue
+                group_start = min((earliest[m] + 1 for m in range(len(self._codes))
+                                   if members >> m & 1 and remaining >> m & 1), default=INFEASIBLE)
+                start = max(start, group_start)
+            earliest[i] = self._next_offered(i, start)
+        return earliest
+
+    def _next_offered(self, course: int, start: int) -> int:
+        for t in range(start, self._term_count):
+            if self._offered[t] >> course & 1:
+                return t
+        return INFEASIBLE
+
+    def _engine_mask(self, taken_mask: int) -> int:
+        mask = self._base_mask
+        for i, bit in enumerate(self._engine_bits):
+            if taken_mask >> i & 1:
+                mask |= bit
+        return mask
+
+    def _local_topological_order(self) -> List[int]:
+        count = len(self._codes)
+        prereqs = [set() for _ in range(count)]
+        for i, groups in enumerate(self._groups):
+            for members in groups:
+                prereqs[i].update(m for m in range(count) if members >> m & 1 and m != i)
+        order, placed = [], set()
+        while len(order) < count:
+            ready = [i for i in range(count) if i not in placed and prereqs[i] <= placed]
+            if not ready:
+                # Circular prerequisites, those courses are never available anyway
+                ready = [i for i in range(count) if i not in placed]
+            order.extend(ready)
+            placed.update(ready)
+        return order
+
+    def _tail_lengths(self) -> List[int]:
+        # Longest chain of courses in the plan that depend on each course
+        count = len(self._codes)
+        tail = [0] * count
+        for i in reversed(self._order):
+            for members in self._groups[i]:
+                for m in range(count):
+                    if members >> m & 1 and m != i:
+                        tail[m] = max(tail[m], tail[i] + 1)
+        return tail
+
+    def _decode(self, mask: int) -> List[str]:
+        return [code for i, code in enumerate(self._codes) if mask >> i & 1]
@@ -1,5 +1,6 @@
-from typing import List, Dict
-from web_crawler import WebCrawler
+from typing import List, Dict, Iterable
+import instrumentation
+from course_catalog import CourseCatalog
 from semester import Semester
 
 
@@ -8,36 +9,51 @@ class PrerequisiteChecker:
     Checks course prerequisites and validates semester plans.
     """
     
-    def __init__(self, web_crawler: WebCrawler):
+    def __init__(self, course_catalog: CourseCatalog):
         """
         Initialize a PrerequisiteChecker object.
         
         Args:
-            web_crawler (WebCrawler): WebCrawler instance for fetching course data
+            course_catalog (CourseCatalog): Indexed catalog, see WebCrawler.get_catalog()
         """
-        self._course_catalog = {}
-        self._web_crawler = web_crawler
+        self._course_catalog = course_catalog
+        self._engine = course_catalog.get_prerequisite_engine()
+
+    def get_course_catalog(self) -> CourseCatalog:
+        return self._course_catalog
+
+    def completed_mask(self, completed: Iterable[str]) -> int:
+        """
+        Get the bitmask of completed courses. Build it once and reuse it with
+        check_prerequisites_mask when checking many courses against the same set.
+        """
+        return self._engine.mask_of(completed)
     
-    def check_prerequisites(self, course: str, completed: List[str]) -> bool:
+    def check_prerequisites(self, course: str, completed: Iterable[str]) -> bool:
         """
         Check if prerequisites are met for a course.
         """
-        prereqs = self._web_crawler.get_course_prerequisites()
-        remaining = [x for x in prereqs.get(course, []) if not any(y in completed for y in x)]
-        if remaining == [''] or not remaining:
-            return True
-        else:
-            return False
+        if instrumentation.enabled:
+            instrumentation.count("prerequisite_checks")
+        return self._engine.is_satisfied(course, self.completed_mask(completed))
+
+    def check_prerequisites_mask(self, course: str, completed_mask: int) -> bool:
+        """
+        Check if prerequisites are met for a course given a completed_mask().
+        """
+        if instrumentation.enabled:
+            instrumentation.count("prerequisite_checks")
+        return self._engine.is_satisfied(course, completed_mask)
     
-    def get_missing_prerequisites(self, course: str, completed: List[str]) -> List[str]:
+    def get_missing_prerequisites(self, course: str, completed: Iterable[str]) -> List[List[str]]:
         """
-        Get missing prerequisites for a course.
+        Get missing prerequisite groups for a course. Any one course of a group meets it.
         """
-        prereqs = self._web_crawler.get_course_prerequisites()
-        return [x for x in prereqs.get(course) if not any(y in completed for y in x)]
-        # return prereqs.get(course, [])
+        if instrumentation.enabled:
+            instrumentation.count("prerequisite_checks")
+        return self._engine.get_missing(course, self.completed_mask(completed))
     
-    def validate_semester_plan(self, semester: Semester, completed: List[str]) -> List[str]:
+    def validate_semester_plan(self, semester: Semester, completed: Iterable[str]) -> List[str]:
         """
         Validate a semester plan for prerequisite issues.
         
@@ -48,10 +64,14 @@ class PrerequisiteChecker:
         Returns:
             List[str]: List of prerequisite issues found
         """
-        if all(self.check_prerequisites(course.code, completed) for course in semester.courses):
-            return []
-        else:
-            return list(set(sum(self.get_missing_prerequisites(course.code, completed) for course in semester.courses)))
+        issues = []
+        mask = self.completed_mask(completed)
+        if instrumentation.enabled:
+            instrumentation.count("prerequisite_checks", len(semester.courses))
+        for course in semester.courses:
+            for group in self._engine.get_missing(course.code, mask):
+                issues.append(" or ".join(group))
+        return list(dict.fromkeys(issues))
     
     def update_course_catalog(self, course_data: Dict) -> None:
         """ Obsolete, covered by webcrawler
@@ -0,0 +1,188 @@
+import re
+from typing import List, Dict, Iterable, Tuple
+
+from course import normalize_course_code
+
+_TOKEN = re.compile(r"\(|\)|\b(?:[A-Z]{4}\s*\d{4}[A-Z]?|and|or)\b")
+
+
+class CourseRequirement:
+    """A single course that must be completed."""
+
+    def __init__(self, code: str):
+        self.code = code
+
+    def to_cnf(self) -> List[Tuple[str, ...]]:
+        return [(self.code,)]
+
+    def __repr__(self) -> str:
+        return self.code
+
+
+class AllOf:
+    """Every child requirement must be met."""
+
+    def __init__(self, children: List):
+        self.children = children
+
+    def to_cnf(self) -> List[Tuple[str, ...]]:
+        return _simplify([clause for child in self.children for clause in child.to_cnf()])
+
+    def __repr__(self) -> str:
+        return "(" + " and ".join(repr(c) for c in self.children) + ")"
+
+
+class AnyOf:
+    """Any one child requirement must be met."""
+
+    def __init__(self, children: List):
+        self.children = children
+
+    def to_cnf(self) -> List[Tuple[str, ...]]:
+        # (a and b) or (c and d) -> (a or c) and (a or d) and (b or c) and (b or d)
+        clauses: List[Tuple[str, ...]] = [()]
+        for child in self.children:
+            clauses = _simplify([left + right for left in clauses for right in child.to_cnf()])
+        return clauses
+
+    def __repr__(self) -> str:
+        return "(" + " or ".join(repr(c) for c in self.children) + ")"
+
+
+def parse_prerequisite_expression(text: str):
+    """
+    Parse catalog prerequisite text into an expression tree.
+
+    "or" binds tighter than "and" and course codes listed without an operator
+    are alternatives, matching WebCrawler.preq_list. Parentheses group.
+    Words other than course codes and operators are ignored.
+
+    Args:
+        text (str): Prerequisite text from the catalog
+
+    Returns:
+        AllOf: Expression tree, with no children if there are no prerequisites
+    """
+    tokens = _TOKEN.findall(text.replace("\xa0", " "))
+    children = []
+    pos = 0
+    while pos < len(tokens):
+        node, pos = _parse_and(tokens, pos)
+        children.extend(node.children)
+        pos += 1  # closing parenthesis without an opening one, keep the requirements after it
+    return AllOf(children)
+
+
+def _parse_and(tokens: List[str], pos: int):
+    children = []
+    while pos < len(tokens) and tokens[pos] != ")":
+        if tokens[pos] in ("and", "or"):
+            # Dangling operator, e.g. "and" with nothing before it
+            pos += 1
+            continue
+        child, pos = _parse_or(tokens, pos)
+        if child is not None:
+            children.append(child)
+    return AllOf(children), pos
+
+
+def _parse_or(tokens: List[str], pos: int):
+    children = []
+    while pos < len(tokens) and tokens[pos] not in ("and", ")"):
+        token = tokens[pos]
+        if token == "or":
+            pos += 1
+        elif token == "(":
+            child, pos = _parse_and(tokens, pos + 1)
+            pos += 1  # closing parenthesis, if any
+            if child.children:
+                children.append(child)
+        else:
+            children.append(CourseRequirement(normalize_course_code(token)))
+            pos += 1
+    if not children:
+        return None, pos
+    return (children[0] if len(children) == 1 else AnyOf(children)), pos
+
+
+def _simplify(clauses: List[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+    """Remove duplicate codes, duplicate clauses and clauses implied by a smaller one."""
+    unique = list(dict.fromkeys(tuple(dict.fromkeys(clause)) for clause in clauses))
+    sets = [frozenset(clause) for clause in unique]
+    return [clause for i, clause in enumerate(unique)
+            if not any(j != i and other < sets[i] or (other == sets[i] and j < i)
+                       for j, other in enumerate(sets))]
+
+
+class PrerequisiteEngine:
+    """
+    Compiles prerequisite expressions to bitmasks. Every course code gets one bit,
+    every course a list of clause masks in conjunctive normal form. A course is
+    satisfiable when each clause shares a bit with the completed mask.
+    """
+
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+        self._codes: List[str] = []
+        self._clauses: Dict[str, List[int]] = {}
+        self._groups: Dict[str, List[List[str]]] = {}
+
+    def compile(self, course_code: str, expression) -> None:
+        """
+        Compile the prerequisite expression of a course.
+
+        Args:
+            course_code (str): Normalized course code
+            expression: Tree from parse_prerequisite_expression
+        """
+        self.compile_groups(course_code, [list(clause) for clause in expression.to_cnf()])
+
+    def compile_groups(self, course_code: str, groups: List[List[str]]) -> None:
+        """
+        Compile prerequisite groups that are already in conjunctive normal form,
+        e.g. WebCrawler.preq_list output.
+        """
+        groups = [list(clause) for clause in _simplify([tuple(group) for group in groups if group])]
+        self._groups[course_code] = groups
+        self._clauses[course_code] = [self._mask(group, assign=True) for group in groups]
+
+    def mask_of(self, course_codes: Iterable[str]) -> int:
+        """Bitmask of course codes. Codes no prerequisite mentions are left out."""
+        return self._mask(course_codes, assign=False)
+
+    def is_satisfied(self, course_code: str, completed_mask: int) -> bool:
+        for clause in self._clauses.get(self._key(course_code), ()):
+            if not clause & completed_mask:
+                return False
+        return True
+
+    def get_missing(self, course_code: str, completed_mask: int) -> List[List[str]]:
+        course_code = self._key(course_code)
+        clauses = self._clauses.get(course_code, ())
+        groups = self._groups.get(course_code, ())
+        return [group for clause, group in zip(clauses, groups) if not clause & completed_mask]
+
+    def get_groups(self, course_code: str) -> List[List[str]]:
+        return self._groups.get(self._key(course_code), [])
+
+    def _key(self, course_code: str) -> str:
+        # Compiled courses are keyed by normalized code, e.g. "CPSC 1302" for "CPSC1302"
+        if course_code in self._clauses:
+            return course_code
+        return normalize_course_code(course_code)
+
+    def _mask(self, course_codes: Iterable[str], assign: bool) -> int:
+        mask = 0
+        for code in course_codes:
+            bit = self._bits.get(code)
+            if bit is None:
+                code = normalize_course_code(code)
+                bit = self._bits.get(code)
+            if bit is None:
+                if not assign:
+                    continue
+                bit = 1 << len(self._codes)
+                self._bits[code] = bit
+                self._codes.append(code)
+            mask |= bit
+        return mask
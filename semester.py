@@ -1,27 +1,59 @@
 from course import Course
-from typing import List
+from typing import Dict, List, Tuple, Union
 class Semester():
+      # Courses are kept by code with a running credit total, so membership, removal
+      # and getTotalCredits() don't scan the course list
+      __slots__ = ("name", "year", "maxHours", "_courses", "_total_hours")
+
       def __init__(self,name:str,year:int, maxHours:int, courses:List[Course]):
             self.name = name
             self.year = year
             self.maxHours = maxHours
-            self.courses = list(courses)
+            self.courses = courses
+
+      @property
+      def courses(self) -> Tuple[Course, ...]:
+            """Courses in the order they were added. Read-only, change them with addCourse/removeCourse."""
+            return tuple(self._courses.values())
+
+      @courses.setter
+      def courses(self, courses: List[Course]):
+            self._courses: Dict[str, Course] = {}
+            self._total_hours = 0
+            for course in courses:
+                  self._append(course)
 
       def getTotalCredits(self):
-            hours = 0
-            for course in self.courses:
-                  hours += course.getHours()
-            return hours
+            return self._total_hours
       
       def addCourse(self, course: Course):
-            if self.getTotalCredits() + course.getHours() <= self.maxHours:
-                  self.courses.append(course)
+            if course.code not in self._courses and self.getTotalCredits() + course.getHours() <= self.maxHours:
+                  self._append(course)
                   return True
             return False
 
-      def removeCourse(self, course: Course):
-            if course in self.courses:
-                  self.courses.remove(course)
+      def removeCourse(self, course: Union[Course, str]):
+            removed = self._courses.pop(self._code(course), None)
+            if removed is not None:
+                  self._total_hours -= removed.getHours()
                   return True
             return False
 
+      def getCourseCodes(self) -> List[str]:
+            return list(self._courses)
+
+      def hasCourse(self, course: Union[Course, str]) -> bool:
+            return self._code(course) in self._courses
+
+      def __contains__(self, course: Union[Course, str]) -> bool:
+            return self.hasCourse(course)
+
+      def _append(self, course: Course):
+            # A course is in a term once, adding it again would count its hours twice
+            if course.code not in self._courses:
+                  self._courses[course.code] = course
+                  self._total_hours += course.getHours()
+
+      @staticmethod
+      def _code(course: Union[Course, str]) -> str:
+            return course if isinstance(course, str) else course.code
@@ -1,12 +1,19 @@
 # smart_advising_tool.py
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future
+import multiprocessing
 import os
 
+import instrumentation
 from config_manager import ConfigManager
+import pdf_parser
 from pdf_parser import PDFParser
+import excel_parser
 from excel_parser import ExcelParser
 from excel_exporter import ExcelExporter
-from web_crawler import WebCrawler
+from catalog_cache import CatalogCache, CATALOG_SUBJECTS
+from course_catalog import CourseCatalog
+from input_cache import InputCache
 from prerequisite_checker import PrerequisiteChecker
 from dag_generator import DAGGenerator
 from plan_generator import PlanGenerator
@@ -31,6 +38,13 @@ class SmartAdvisingTool:
         self._excel_parser_gsp: Optional[ExcelParser] = None
         self._excel_parser_4yr: Optional[ExcelParser] = None
         self._excel_exporter: Optional[ExcelExporter] = None
+        self._catalog_data: Optional[List[Dict]] = None
+        self._prerequisite_checker: Optional[PrerequisiteChecker] = None
+
+        # Input stages (catalog, PDF, workbooks) run concurrently on this executor
+        self._input_executor: Optional[ThreadPoolExecutor] = None
+        self._catalog_future: Optional[Future] = None
+        self._stage_errors: Dict[str, str] = {}
 
         self._remaining_courses: List[str] = []
         self._completed_courses: List[str] = []
@@ -42,27 +56,31 @@ class SmartAdvisingTool:
     # ---------------------------
     # Initialization
     # ---------------------------
+    @instrumentation.traced("initialize")
     def initialize_components(self) -> None:
         print("[SmartAdvisingTool] Initializing components...")
 
         self._config_manager = ConfigManager(self._config_file)
         paths = self._config_manager.get_input_paths()
 
-        # Parsers
-        self._pdf_parser = PDFParser(paths.get("degree_pdf_path"))
-        self._excel_parser_gsp = ExcelParser(paths.get("graduate_study_plan_path"))
-        self._excel_parser_4yr = ExcelParser(paths.get("four_year_schedule_path"))
+        # Parsers, unchanged input files are served from the parsed input cache
+        input_cache_settings = self._config_manager.get_input_cache_settings()
+        input_cache = None
+        if input_cache_settings.get("enabled"):
+            input_cache = InputCache(input_cache_settings.get("cache_directory"), input_cache_settings.get("max_bytes"))
+        self._pdf_parser = PDFParser(paths.get("degree_pdf_path"), input_cache,
+                                     stop_early=bool(self._config_manager.get_setting("pdf_stop_early")),
+                                     extraction_workers=self._config_manager.get_setting("pdf_extraction_workers"))
+        self._excel_parser_gsp = ExcelParser(paths.get("graduate_study_plan_path"), input_cache)
+        self._excel_parser_4yr = ExcelParser(paths.get("four_year_schedule_path"), input_cache)
        
 
-        # Optional: Web crawler + prereq checker (don’t fail run if network/HTML changes)
-        catalog_url = self._config_manager.get_setting("course_catalog_url") or "https://catalog.columbusstate.edu/course-descriptions/"
-        try:
-            self._web_crawler = WebCrawler(catalog_url)
-            self._prerequisite_checker = PrerequisiteChecker(self._web_crawler)
-        except Exception as e:
-            print("[SmartAdvisingTool] Crawler unavailable:", e)
-            self._web_crawler = None
-            self._prerequisite_checker = None
+        # Optional: Web crawler + prereq checker (don’t fail run if network/HTML changes).
+        # The catalog loads in the background while the inputs are parsed, see wait_for_catalog()
+        self._catalog_data = None
+        self._prerequisite_checker = None
+        self._stage_errors = {}
+        self._catalog_future = self._get_input_executor().submit(self._load_catalog)
 
         self._dag_generator = DAGGenerator()  # start empty; PlanGenerator.set_courses will fill
 
@@ -81,41 +99,127 @@ class SmartAdvisingTool:
 
         print("[SmartAdvisingTool] Components initialized.")
 
+    def _get_input_executor(self) -> ThreadPoolExecutor:
+        if self._input_executor is None:
+            self._input_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="input-stage")
+        return self._input_executor
+
+    @instrumentation.traced("crawl")
+    def _load_catalog(self) -> Tuple[List[Dict], PrerequisiteChecker]:
+        catalog_url = self._config_manager.get_setting("course_catalog_url") or "https://catalog.columbusstate.edu/course-descriptions/"
+        cache_settings = self._config_manager.get_cache_settings()
+        catalog_cache = None
+        catalog_data = None
+        if cache_settings.get("enabled"):
+            catalog_cache = CatalogCache(cache_settings.get("cache_path"), cache_settings.get("ttl_hours"))
+            catalog_data = catalog_cache.load(catalog_url, CATALOG_SUBJECTS, allow_stale=cache_settings.get("offline"))
+        if catalog_data is None:
+            # Only a cache miss needs the crawler and its network stack
+            from web_crawler import WebCrawler
+            web_crawler = WebCrawler(catalog_url, CATALOG_SUBJECTS, cache=catalog_cache,
+                                     offline=cache_settings.get("offline"),
+                                     max_workers=self._config_manager.get_setting("crawler_max_workers"))
+            catalog_data = web_crawler.get_catalog_data()
+        return catalog_data, PrerequisiteChecker(CourseCatalog(catalog_data))
+
+    def wait_for_catalog(self) -> Optional[PrerequisiteChecker]:
+        """
+        Wait for the catalog stage started by initialize_components().
+
+        Returns:
+            Optional[PrerequisiteChecker]: The checker, None if the crawler is unavailable
+        """
+        if self._catalog_future is not None:
+            future, self._catalog_future = self._catalog_future, None
+            try:
+                with instrumentation.span("wait_for_catalog"):
+                    self._catalog_data, self._prerequisite_checker = future.result()
+            except Exception as e:
+                print("[SmartAdvisingTool] Crawler unavailable:", e)
+                self._stage_errors["catalog"] = repr(e)
+                self._catalog_data = None
+                self._prerequisite_checker = None
+        return self._prerequisite_checker
+
+    def get_stage_errors(self) -> Dict[str, str]:
+        """Errors of the input stages of the last run, by stage name."""
+        return dict(self._stage_errors)
+
 
     # ---------------------------
     # Input processing
     # ---------------------------
+    @instrumentation.traced("process_inputs")
     def process_inputs(self) -> bool:
+        """
+        Parse the DegreeWorks PDF, Graduate Study Plan and four-year schedule concurrently,
+        while the catalog keeps loading. A failed stage is reported by name and fails the
+        input step, except the catalog, which falls back to planning without prerequisites.
+        """
         print("[SmartAdvisingTool] Processing inputs...")
-        try:
-            # Parse remaining courses from DegreeWorks PDF
-            remaining_from_pdf = []
-            if self._pdf_parser and self._pdf_parser.is_valid_pdf():
+        stages = {
+            "DegreeWorks PDF": self._parse_degreeworks_stage,
+            "Graduate Study Plan": self._parse_study_plan_stage,
+            "Four-Year Schedule": self._parse_schedule_stage,
+        }
+        executor = self._get_input_executor()
+        futures = {name: executor.submit(stage) for name, stage in stages.items()}
+
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"[SmartAdvisingTool] Error while processing {name}:", e)
+                self._stage_errors[name] = repr(e)
+        self.wait_for_catalog()
+        if len(results) < len(stages):
+            return False
+
+        # Merge results
+        self._remaining_courses = list(dict.fromkeys(results["DegreeWorks PDF"] + results["Graduate Study Plan"]))
+        self._completed_courses = []
+        self._term_hints = results["Four-Year Schedule"]
+
+        print(f"[SmartAdvisingTool] Remaining: {len(self._remaining_courses)} | Completed: {len(self._completed_courses)}")
+        return True
+
+    @instrumentation.traced("parse_degreeworks_pdf")
+    def _parse_degreeworks_stage(self) -> List[str]:
+        # Parse remaining courses from DegreeWorks PDF
+        # The parser validates the PDF itself, unless the result is in the input cache
+        remaining_from_pdf = []
+        if self._pdf_parser:
+            try:
                 remaining_from_pdf = self._pdf_parser.parse_degreeworks_pdf()
                 print(f"[SmartAdvisingTool] PDFParser found {len(remaining_from_pdf)} remaining courses")
-
-            # Parse graduate study plan
-            remaining_from_gsp = []
-            if self._excel_parser_gsp and self._excel_parser_gsp.validate_excel_format():
+            except pdf_parser.PdfReadError:
+                pass
+        return remaining_from_pdf
+
+    @instrumentation.traced("parse_study_plan")
+    def _parse_study_plan_stage(self) -> List[str]:
+        # The parsers validate the workbook themselves, unless the result is in the input cache
+        remaining_from_gsp = []
+        if self._excel_parser_gsp:
+            try:
                 remaining_from_gsp = self._excel_parser_gsp.parse_graduate_study_plan()
                 print(f"[SmartAdvisingTool] Graduate Study Plan courses: {len(remaining_from_gsp)}")
-
-            # Parse four-year schedule for term hints
-            term_hints = {}
-            if self._excel_parser_4yr and self._excel_parser_4yr.validate_excel_format():
+            except excel_parser.InvalidFileException:
+                pass
+        return remaining_from_gsp
+
+    @instrumentation.traced("parse_schedule")
+    def _parse_schedule_stage(self) -> Dict[str, List[str]]:
+        # Parse four-year schedule for term hints
+        term_hints = {}
+        if self._excel_parser_4yr:
+            try:
                 term_hints = self._excel_parser_4yr.parse_four_year_schedule()
                 print(f"[SmartAdvisingTool] Four-Year Schedule terms: {len(term_hints)}")
-
-            # Merge results
-            self._remaining_courses = list(dict.fromkeys(remaining_from_pdf + remaining_from_gsp))
-            self._completed_courses = []
-            self._term_hints = term_hints
-
-            print(f"[SmartAdvisingTool] Remaining: {len(self._remaining_courses)} | Completed: {len(self._completed_courses)}")
-            return True
-        except Exception as e:
-            print("[SmartAdvisingTool] Error while processing inputs:", e)
-            return False
+            except excel_parser.InvalidFileException:
+                pass
+        return term_hints
 
     # ---------------------------
     # Plan generation
@@ -135,9 +239,10 @@ class SmartAdvisingTool:
 
         # Working sets
         remaining = list(self._remaining_courses)  # list of codes
-        placed: List[str] = []                     # codes already scheduled (become “completed” for next terms)
+        placed: Set[str] = set()                   # codes already scheduled (become “completed” for next terms)
         completed_seed = set(self._completed_courses or [])
-        plan = AcademicPlan(remaining_courses=self._remaining_courses, completed_courses=self._completed_courses)
+        plan = AcademicPlan(remaining_courses=self._remaining_courses, completed_courses=self._completed_courses,
+                            prerequisite_checker=self._prerequisite_checker)
 
         # Term generator (keeps it simple)
         year = 2025
@@ -147,9 +252,7 @@ class SmartAdvisingTool:
         def new_semester():
             nonlocal term_idx, year
             name = term_cycle[term_idx]
-            sem = Semester(name, year, max_hours)   # no *courses initially
-            if not isinstance(sem.courses, list):
-                sem.courses = list(sem.courses)
+            sem = Semester(name, year, max_hours, [])   # no courses initially
             # advance pointer for next time
             term_idx = (term_idx + 1) % len(term_cycle)
             if term_idx == 1:  # Fall -> Spring rolls year forward
@@ -176,7 +279,7 @@ class SmartAdvisingTool:
                     continue
 
                 # Check prereqs if checker is available
-                if self._use_prereqs and self._prerequisite_checker:
+                if self._prerequisite_checker:
                     try:
                         ok = self._prerequisite_checker.check_prerequisites(code, list(completed_now))
                     except Exception:
@@ -194,18 +297,10 @@ class SmartAdvisingTool:
                     continue
 
                 # Add to this semester (as a placeholder Course object)
-                c = Course(
-                    code=code,
-                    name=code,
-                    desc=f"Auto-generated placeholder for {code}",
-                    hours=HOURS_PER_COURSE,
-                    courseTaken=False,
-                    letterGrade="",
-                    semestersoffered=["Fall", "Spring", "Summer"],
-                )
-                sem.courses.append(c)
+                c = Course(code=code, name=code, hours=HOURS_PER_COURSE)
+                sem.addCourse(c)
                 term_load += HOURS_PER_COURSE
-                placed.append(code)
+                placed.add(code)
                 made_progress_this_term = True
 
             # If we scheduled anything, add the semester to the plan
@@ -222,13 +317,9 @@ class SmartAdvisingTool:
         # Optionally: if anything remains unscheduled, dump them into an “Extra” semester
         # (useful for visibility)
         if remaining:
-            extra = Semester("Extra", year, max_hours)
-            if not isinstance(extra.courses, list):
-                extra.courses = list(extra.courses)
-            for code in remaining:
-                extra.courses.append(
-                    Course(code, code, f"Unscheduled (prereqs/credits)", HOURS_PER_COURSE, False, "", ["Fall","Spring","Summer"])
-                )
+            # Built with all its courses at once, it may go past max_hours
+            extra = Semester("Extra", year, max_hours,
+                             [Course(code, "Unscheduled (prereqs/credits)", HOURS_PER_COURSE) for code in remaining])
             plan.add_semester(extra)
 
         _ = plan.validate_plan()  # harmless check
@@ -237,6 +328,7 @@ class SmartAdvisingTool:
 
     def generate_course_plan(self) -> str:
         print("[SmartAdvisingTool] Generating course plan...")
+        self.wait_for_catalog()
 
         if not self._excel_exporter or not getattr(self._excel_exporter, "_output_path", None):
             raise RuntimeError("Output path not initialized. Check initialize_components().")
@@ -260,11 +352,19 @@ class SmartAdvisingTool:
                 max_hours_per_term=self._config_manager.get_setting("max_semester_hours") or 9,
                 start_year_two_digit=25,
             )
-            plan = gen.generate_optimal_plan()
+            if self._config_manager.get_setting("plan_strategy") == "optimal":
+                with instrumentation.span("plan", strategy="optimal"):
+                    plan = gen.generate_solver_plan(self._config_manager.get_setting("plan_time_limit_seconds"))
+            else:
+                with instrumentation.span("plan", strategy="greedy"):
+                    plan = gen.generate_optimal_plan()
         else:
             print("[SmartAdvisingTool] Falling back to naive plan generator.")
-            plan = self._build_naive_plan()
-        if not self._excel_exporter.export_academic_plan(plan):
+            with instrumentation.span("plan", strategy="naive"):
+                plan = self._build_naive_plan()
+        with instrumentation.span("export"):
+            exported = self._excel_exporter.export_academic_plan(plan)
+        if not exported:
             raise RuntimeError("Failed to export academic plan to Excel.")
         print(f"[SmartAdvisingTool] Plan exported: {self._excel_exporter._output_path}")
         return self._excel_exporter._output_path
@@ -274,13 +374,15 @@ class SmartAdvisingTool:
     # ---------------------------
     def run(self) -> bool:
         print("[SmartAdvisingTool] Run started.")
+        profile_directory = self._start_profiling()
         try:
-            self.initialize_components()
-            if not self.process_inputs():
-                print("[SmartAdvisingTool] Input processing failed.")
-                return False
-            
-            self.generate_course_plan()
+            with instrumentation.span("run"):
+                self.initialize_components()
+                if not self.process_inputs():
+                    print("[SmartAdvisingTool] Input processing failed.")
+                    return False
+
+                self.generate_course_plan()
             print("[SmartAdvisingTool] Run finished successfully.")
             return True
         except Exception as e:
@@ -289,9 +391,172 @@ class SmartAdvisingTool:
             return False
         finally:
             self.cleanup_resources()
+            if profile_directory:
+                self._write_profile(profile_directory)
+
+    def _start_profiling(self) -> str:
+        """Start recording spans and counters if profile_directory is set, returns the directory."""
+        if self._config_manager is None:
+            self._config_manager = ConfigManager(self._config_file)
+        profile_directory = str(self._config_manager.get_setting("profile_directory") or "").strip()
+        if profile_directory:
+            instrumentation.start()
+        return profile_directory
+
+    def _write_profile(self, profile_directory: str) -> None:
+        profiler = instrumentation.stop()
+        if profiler is None:
+            return
+        try:
+            paths = profiler.write(profile_directory)
+            print("[SmartAdvisingTool] Profile written:", ", ".join(paths))
+        except OSError as e:
+            print("[SmartAdvisingTool] Failed to write profile:", e)
+
+    def run_batch(self, pdf_directory: str) -> bool:
+        """
+        Plan every DegreeWorks PDF in a directory. The catalog, Graduate Study Plan and
+        four-year schedule are loaded once, students are planned in parallel processes.
+        Plans and batch_summary.json are written to <output_directory>/batch.
+        """
+        print("[SmartAdvisingTool] Batch run started.")
+        try:
+            self.initialize_components()
+            if not self.wait_for_catalog():
+                print("[SmartAdvisingTool] Batch run needs the course catalog.")
+                return False
+
+            study_plan_courses = self._excel_parser_gsp.parse_graduate_study_plan()
+            course_schedule = self._excel_parser_4yr.parse_four_year_schedule()
+            out_dir = self._config_manager.get_setting("output_directory") or "outputs"
+            input_cache_settings = self._config_manager.get_input_cache_settings()
+
+            # Imported on demand, like the other optional modes, to keep startup fast
+            from batch_advisor import BatchAdvisor
+
+            advisor = BatchAdvisor(
+                catalog_data=self._catalog_data,
+                study_plan_courses=study_plan_courses,
+                course_schedule=course_schedule,
+                output_directory=os.path.join(out_dir, "batch"),
+                max_hours_per_term=self._config_manager.get_setting("max_semester_hours") or 9,
+                start_year_two_digit=25,
+                plan_strategy=self._config_manager.get_setting("plan_strategy"),
+                plan_time_limit_seconds=self._config_manager.get_setting("plan_time_limit_seconds"),
+                max_workers=self._config_manager.get_setting("batch_max_workers") or None,
+                input_cache_directory=input_cache_settings.get("cache_directory"),
+                input_cache_max_bytes=input_cache_settings.get("max_bytes"),
+                pdf_stop_early=bool(self._config_manager.get_setting("pdf_stop_early")),
+            )
+            pdf_paths = advisor.find_pdfs(pdf_directory)
+            print(f"[SmartAdvisingTool] Planning {len(pdf_paths)} students...")
+            summary = advisor.run(pdf_paths)
+
+            for result in summary["results"]:
+                if not result["ok"]:
+                    print(f"[SmartAdvisingTool] Failed {result['pdf']}: {result.get('error')}")
+            print(f"[SmartAdvisingTool] Batch finished: {summary['succeeded']}/{summary['students']} plans "
+                  f"in {summary['seconds']}s ({summary['workers']} workers).")
+            return summary["failed"] == 0
+        except Exception as e:
+            print("[SmartAdvisingTool] Batch run failed:", e)
+            return False
+        finally:
+            self.cleanup_resources()
+
+    def serve(self) -> bool:
+        """
+        Run the advising HTTP service until interrupted (Ctrl+C). The catalog, Graduate Study
+        Plan and four-year schedule are loaded once, see AdvisingService for the endpoints.
+        """
+        print("[SmartAdvisingTool] Service starting...")
+        try:
+            self.initialize_components()
+            if not self.wait_for_catalog():
+                print("[SmartAdvisingTool] Service needs the course catalog.")
+                return False
+
+            input_cache_settings = self._config_manager.get_input_cache_settings()
+            input_cache = None
+            if input_cache_settings.get("enabled"):
+                input_cache = InputCache(input_cache_settings.get("cache_directory"), input_cache_settings.get("max_bytes"))
+            from advising_service import AdvisingService
+
+            service = AdvisingService(
+                prerequisite_checker=self._prerequisite_checker,
+                study_plan_courses=self._excel_parser_gsp.parse_graduate_study_plan(),
+                course_schedule=self._excel_parser_4yr.parse_four_year_schedule(),
+                max_hours_per_term=self._config_manager.get_setting("max_semester_hours") or 9,
+                start_year_two_digit=25,
+                plan_strategy=self._config_manager.get_setting("plan_strategy"),
+                plan_time_limit_seconds=self._config_manager.get_setting("plan_time_limit_seconds"),
+                input_cache=input_cache,
+                pdf_stop_early=bool(self._config_manager.get_setting("pdf_stop_early")),
+            )
+            server = service.create_server(self._config_manager.get_setting("service_host"),
+                                           self._config_manager.get_setting("service_port"))
+            host, port = server.server_address[:2]
+            print(f"[SmartAdvisingTool] Service listening on http://{host}:{port}/ (Ctrl+C to stop)")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+            print("[SmartAdvisingTool] Service stopped.")
+            return True
+        except Exception as e:
+            print("[SmartAdvisingTool] Service failed:", e)
+            return False
+        finally:
+            self.cleanup_resources()
+
+    def refresh_catalog(self) -> bool:
+        """
+        Crawl the course catalog again and update the prerequisite cache. Subject pages are
+        requested conditionally, only the ones that changed are parsed and merged.
+        """
+        print("[SmartAdvisingTool] Refreshing course catalog...")
+        if self._config_manager is None:
+            self._config_manager = ConfigManager(self._config_file)
+        catalog_url = self._config_manager.get_setting("course_catalog_url") or "https://catalog.columbusstate.edu/course-descriptions/"
+        cache_settings = self._config_manager.get_cache_settings()
+        if not cache_settings.get("enabled"):
+            print("[SmartAdvisingTool] Prerequisite cache is disabled (cache_prerequisites).")
+            return False
+        try:
+            from web_crawler import WebCrawler
+            catalog_cache = CatalogCache(cache_settings.get("cache_path"), cache_settings.get("ttl_hours"))
+            web_crawler = WebCrawler(catalog_url, CATALOG_SUBJECTS, cache=catalog_cache, refresh=True,
+                                     max_workers=self._config_manager.get_setting("crawler_max_workers"))
+        except Exception as e:
+            print("[SmartAdvisingTool] Catalog refresh failed:", e)
+            return False
+        summary = web_crawler.get_refresh_summary()
+        if summary is None:
+            print("[SmartAdvisingTool] Catalog unreachable, kept the cached copy.")
+            return True
+        statuses = summary["subjects"].values()
+        diff = summary["diff"]
+        print(f"[SmartAdvisingTool] Catalog refreshed: {len(summary['subjects'])} subjects checked, "
+              f"{summary['parsed']} parsed, {sum(1 for s in statuses if s in ('unchanged', 'not_modified'))} unchanged.")
+        print(f"[SmartAdvisingTool] Courses added: {len(diff['added'])}, removed: {len(diff['removed'])}, "
+              f"prerequisites changed: {len(diff['prerequisites_changed'])}, retitled: {len(diff['retitled'])}")
+        for key in ("added", "removed", "prerequisites_changed", "retitled"):
+            if diff[key]:
+                print(f"[SmartAdvisingTool]   {key.replace('_', ' ')}: {', '.join(diff[key])}")
+        return True
 
     def cleanup_resources(self) -> None:
         print("[SmartAdvisingTool] Cleaning up resources...")
+        if self._input_executor is not None:
+            # A catalog crawl that is still running finishes in the background
+            self._input_executor.shutdown(wait=False, cancel_futures=True)
+        self._input_executor = None
+        self._catalog_future = None
+        for excel_parser in (self._excel_parser_gsp, self._excel_parser_4yr):
+            if excel_parser:
+                excel_parser.close()
         self._pdf_parser = None
         self._excel_parser_gsp = None
         self._excel_parser_4yr = None
@@ -299,12 +564,17 @@ class SmartAdvisingTool:
         print("[SmartAdvisingTool] Cleanup complete.")
 
 if __name__ == "__main__":
+    # Needed for the batch worker processes in PyInstaller builds
+    multiprocessing.freeze_support()
     SAT = SmartAdvisingTool()
     try:
         while True:
             print("Welcome to Better Advise!\nPlease select from the following menu.")
             print("1.\tRun")
             print("2.\tConfig")
+            print("3.\tRefresh Catalog")
+            print("4.\tBatch Run")
+            print("5.\tStart Service")
             print("0.\tQuit")
             s = input(">> ").replace(" ", "")
             if(s=="1"):
@@ -323,6 +593,19 @@ if __name__ == "__main__":
                     print("7. cache_prerequisites")# = "cacheprerequisites.txt"
                     print("8. prerequiste_cache_path")# = "prerequisites.cache"
                     print("9. max_semester_hours")# = 15"
+                    print("10. prerequisite_cache_ttl_hours")# = 168
+                    print("11. catalog_offline")# = false
+                    print("12. crawler_max_workers")# = 4
+                    print("13. plan_strategy")# = "greedy"
+                    print("14. plan_time_limit_seconds")# = 5
+                    print("15. batch_max_workers")# = 0
+                    print("16. input_cache_directory")# = "input_cache"
+                    print("17. input_cache_max_mb")# = 64
+                    print("18. pdf_extraction_workers")# = 1
+                    print("19. service_host")# = "127.0.0.1"
+                    print("20. service_port")# = 8080
+                    print("21. profile_directory")# = ""
+                    print("22. pdf_stop_early")# = false
                     print("0. Back and Save")
                     print("A. Back without Saving")
                     j = input("config>> ").replace(" ", "")
@@ -353,6 +636,45 @@ if __name__ == "__main__":
                     elif(j == "9"):
                         print("Current value:", SAT._config_manager.get_setting("max_semester_hours"))
                         SAT._config_manager.update_setting("max_semester_hours", int(input("New value: ")))
+                    elif(j == "10"):
+                        print("Current value:", SAT._config_manager.get_setting("prerequisite_cache_ttl_hours"))
+                        SAT._config_manager.update_setting("prerequisite_cache_ttl_hours", int(input("New value: ")))
+                    elif(j == "11"):
+                        print("Current value:", SAT._config_manager.get_setting("catalog_offline"))
+                        SAT._config_manager.update_setting("catalog_offline", input("New value (y/n): ").lower().startswith("y"))
+                    elif(j == "12"):
+                        print("Current value:", SAT._config_manager.get_setting("crawler_max_workers"))
+                        SAT._config_manager.update_setting("crawler_max_workers", int(input("New value: ")))
+                    elif(j == "13"):
+                        print("Current value:", SAT._config_manager.get_setting("plan_strategy"))
+                        SAT._config_manager.update_setting("plan_strategy", input("New value (greedy/optimal): "))
+                    elif(j == "14"):
+                        print("Current value:", SAT._config_manager.get_setting("plan_time_limit_seconds"))
+                        SAT._config_manager.update_setting("plan_time_limit_seconds", int(input("New value: ")))
+                    elif(j == "15"):
+                        print("Current value:", SAT._config_manager.get_setting("batch_max_workers"))
+                        SAT._config_manager.update_setting("batch_max_workers", int(input("New value: ")))
+                    elif(j == "16"):
+                        print("Current value:", SAT._config_manager.get_setting("input_cache_directory"))
+                        SAT._config_manager.update_setting("input_cache_directory", input("New value: "))
+                    elif(j == "17"):
+                        print("Current value:", SAT._config_manager.get_setting("input_cache_max_mb"))
+                        SAT._config_manager.update_setting("input_cache_max_mb", int(input("New value: ")))
+                    elif(j == "18"):
+                        print("Current value:", SAT._config_manager.get_setting("pdf_extraction_workers"))
+                        SAT._config_manager.update_setting("pdf_extraction_workers", int(input("New value: ")))
+                    elif(j == "19"):
+                        print("Current value:", SAT._config_manager.get_setting("service_host"))
+                        SAT._config_manager.update_setting("service_host", input("New value: "))
+                    elif(j == "20"):
+                        print("Current value:", SAT._config_manager.get_setting("service_port"))
+                        SAT._config_manager.update_setting("service_port", int(input("New value: ")))
+                    elif(j == "21"):
+                        print("Current value:", SAT._config_manager.get_setting("profile_directory"))
+                        SAT._config_manager.update_setting("profile_directory", input("New value: "))
+                    elif(j == "22"):
+                        print("Current value:", SAT._config_manager.get_setting("pdf_stop_early"))
+                        SAT._config_manager.update_setting("pdf_stop_early", input("New value (y/n): ").lower().startswith("y"))
                     elif(j=="0"):
                         SAT._config_manager.update_config_file()
                         break
@@ -360,6 +682,12 @@ if __name__ == "__main__":
                         break
                     else:
                         print("Invalid Input!")
+            elif(s=="3"):
+                SAT.refresh_catalog()
+            elif(s=="4"):
+                SAT.run_batch(input("Directory of DegreeWorks PDFs: ").strip())
+            elif(s=="5"):
+                SAT.serve()
             elif(s=="0"):
                 break
             else:
@@ -1,68 +1,314 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+import hashlib
 import re
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+from catalog_cache import CatalogCache, CATALOG_SUBJECTS
+from course_catalog import CourseCatalog
+
+# requests, bs4 and pandas are imported where they are used, so runs served
+# from the catalog cache (and the CLI menu) never load them
+if TYPE_CHECKING:
+    import requests
+
+# Prerequisite text cleanup, compiled once instead of per description block
+_TEXT_FIXES = str.maketrans({"\xa0": " ", "Â": " "})   # non-breaking space, stray symbol
+_NON_ALPHANUMERIC = re.compile(r"[^A-Za-z0-9\s]")
+_COURSE_CODE = re.compile(r"[A-Z]{4}\s?\d{4}[A-Z]?")
+_PREREQUISITE_TOKEN = re.compile(r'\b(?:[A-Z]{4}\s+\d{4}[A-Z]?|or|and)\b')
 
 class WebCrawler():
-    def __init__(self, catalog_url = "https://catalog.columbusstate.edu/course-descriptions/", courses = ["cpsc", "cybr"]):
+    REQUEST_TIMEOUT = 30  # seconds
+
+    def __init__(self, catalog_url = "https://catalog.columbusstate.edu/course-descriptions/", courses = CATALOG_SUBJECTS,
+                 cache: Optional[CatalogCache] = None, offline: bool = False, refresh: bool = False,
+                 max_workers: int = 4):
         self.catalog_url = catalog_url
         self._courses = courses
-        self._data = self.get_course_data()
+        self._max_workers = max_workers
+        self._cache = cache
+        self._offline = offline
+        # Validators and courses of each crawled subject page, see fetch_subject()
+        self._pages: Dict[str, Dict] = {}
+        self._refresh_summary: Optional[Dict] = None
+        self._data = self.load_course_data(refresh)
+        self._catalog = CourseCatalog(self._data)
+
+    def load_course_data(self, refresh: bool = False) -> List[Dict]:
+        """
+        Loads course data from the cache when possible, otherwise crawls the catalog.
+        A crawl with an earlier copy in the cache only re-parses the subject pages that
+        changed since, and records what changed, see get_refresh_summary().
+
+        Args:
+            refresh (bool): Ignore a fresh cache and crawl the catalog again
+
+        Returns:
+            List[Dict]: Parsed course data
+        """
+        if self._cache and (not refresh or self._offline):
+            cached = self._cache.load(self.catalog_url, self._courses, allow_stale=self._offline)
+            if cached is not None:
+                return cached
+
+        if self._offline:
+            raise CatalogUnavailableError("Offline mode is on and no cached catalog was found.")
+
+        import requests
+
+        previous_data = None
+        previous_pages = None
+        if self._cache:
+            previous_data = self._cache.load(self.catalog_url, self._courses, allow_stale=True)
+            if previous_data is not None:
+                previous_pages = self._previous_pages(previous_data,
+                                                      self._cache.load_pages(self.catalog_url, self._courses))
+        try:
+            data = self.get_course_data(previous_pages)
+        except requests.RequestException:
+            # Catalog host is slow or down, an old copy is better than nothing
+            stale = self._cache.load(self.catalog_url, self._courses, allow_stale=True) if self._cache else None
+            if stale is None:
+                raise
+            print("Catalog unreachable, using cached copy.")
+            return stale
+
+        self._refresh_summary["diff"] = diff_course_data(previous_data or [], data)
+        if self._cache:
+            pages = {subject: {key: page[key] for key in ("etag", "last_modified", "content_hash")}
+                     for subject, page in self._pages.items()}
+            for subject, page in self._pages.items():
+                pages[subject]["course_codes"] = [course["Course_Code"] for course in page["courses"]]
+            self._cache.save(self.catalog_url, self._courses, data, pages)
+        return data
+
+    def _previous_pages(self, previous_data: List[Dict], pages: Optional[Dict[str, Dict]]) -> Dict[str, Dict]:
+        """Cached page validators with the cached courses of each page."""
+        # The courses were saved page after page in the order of the pages, so each page owns
+        # the next len(course_codes) of them. Looking them up by code alone would hand a course
+        # listed on two subject pages the other page's entry.
+        previous_pages = {}
+        start = 0
+        for subject, page in (pages or {}).items():
+            codes = page.get("course_codes") or []
+            courses = previous_data[start:start + len(codes)]
+            if [course.get("Course_Code") for course in courses] != codes:
+                break
+            previous_pages[subject] = dict(page, courses=courses)
+            start += len(codes)
+        return previous_pages
+
+    def refresh(self) -> None:
+        """Crawls the catalog again and updates the cache."""
+        self._data = self.load_course_data(refresh=True)
+        self._catalog = CourseCatalog(self._data)
+
+    def get_catalog_data(self) -> List[Dict]:
+        """Returns the crawled (or cached) course data."""
+        return self._data
+
+    def get_catalog(self) -> CourseCatalog:
+        """Returns the indexed catalog built from the crawled data."""
+        return self._catalog
+
+    def get_refresh_summary(self) -> Optional[Dict]:
+        """
+        What the last crawl did, None if the data came from the cache.
+
+        Returns:
+            Optional[Dict]: "subjects" (subject -> "new", "changed", "unchanged" or "not_modified"),
+                "parsed" (number of pages parsed) and "diff", see diff_course_data()
+        """
+        return self._refresh_summary
+
+    def get_course_data(self, previous_pages: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+        """
+        Scrapes CSU CPSC catalog and extracts course details with prerequisites.
+
+        Args:
+            previous_pages (Optional[Dict[str, Dict]]): Earlier fetch_subject() page of each subject,
+                pages that didn't change since are not parsed again
+
+        Returns:
+            List[Dict]: Parsed course data, in subject order
+        """
+        previous_pages = previous_pages or {}
+        fetch = lambda session, code: self.fetch_subject(session, code, previous_pages.get(code))
+        if self._max_workers <= 1 or len(self._courses) <= 1:
+            with self._create_session() as session:
+                results = [fetch(session, code) for code in self._courses]
+        else:
+            # Each worker fetches and parses its own subject, so parsing one page overlaps
+            # with waiting on the others. Results are kept in self._courses order.
+            workers = min(self._max_workers, len(self._courses))
+            with self._create_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(lambda code: fetch(session, code), self._courses))
+
+        self._pages = {code: page for code, (page, _) in zip(self._courses, results)}
+        statuses = {code: status for code, (_, status) in zip(self._courses, results)}
+        self._refresh_summary = {
+            "subjects": statuses,
+            "parsed": sum(1 for status in statuses.values() if status in ("new", "changed")),
+        }
+        return [course for page, _ in results for course in page["courses"]]
+
+    def crawl_subject(self, session: "requests.Session", subject: str) -> List[Dict]:
+        """Fetches one subject page of the catalog and parses its courses."""
+        return self.fetch_subject(session, subject)[0]["courses"]
+
+    def fetch_subject(self, session: "requests.Session", subject: str,
+                      previous: Optional[Dict] = None) -> Tuple[Dict, str]:
+        """
+        Fetches one subject page, as a conditional request if it was fetched before, and
+        parses it only if it changed. Servers without ETag/Last-Modified support still
+        skip the parsing when the page content hashes the same.
+
+        Args:
+            session (requests.Session): Session to fetch with
+            subject (str): Subject prefix, e.g. "cpsc"
+            previous (Optional[Dict]): Page of the last fetch of this subject
+
+        Returns:
+            Tuple[Dict, str]: The page (etag, last_modified, content_hash, courses) and
+                "new", "changed", "unchanged" (same content) or "not_modified" (HTTP 304)
+        """
+        headers = {}
+        if previous:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        print("Connecting to catalog...")
+        response = session.get(self.catalog_url + subject + "/", headers=headers, timeout=self.REQUEST_TIMEOUT)
+        if response.status_code == 304 and previous:
+            page = dict(previous)
+            page["etag"] = response.headers.get("ETag") or previous.get("etag")
+            page["last_modified"] = response.headers.get("Last-Modified") or previous.get("last_modified")
+            return page, "not_modified"
+        response.raise_for_status()
+
+        page = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_hash": hashlib.sha256(response.content).hexdigest(),
+        }
+        if previous and previous.get("content_hash") == page["content_hash"]:
+            page["courses"] = previous["courses"]
+            return page, "unchanged"
+        page["courses"] = self.parse_subject_page(response.text)
+        return page, "changed" if previous else "new"
+
+    def parse_subject_page(self, html: str) -> List[Dict]:
+        """
+        Extracts course details with prerequisites from one subject page. Streams the page
+        and keeps only the text of the course blocks, no document tree is built.
+        """
+        extractor = _CourseBlockExtractor()
+        extractor.feed(html)
+        extractor.close()
+
+        extracted = []
+        for code, title, extras in extractor.blocks:
+            prereq_list = []
+            list_of_preq = []
+            prereq_text = ""
+
+            # Search for prerequisite text in the course description
+            for text in extras:
+                if "Prerequisite" in text:
+                    text = self._clean_prerequisite_text(text)
+                    # Clean text and extract all course codes like CPSC 1301K, MATH 1113, etc.
+                    matches = _COURSE_CODE.findall(_NON_ALPHANUMERIC.sub(" ", text))
+                    list_of_preq = self.preq_list(text)
+                    prereq_text = text
+                    prereq_list.extend(matches)
+
+            prereq_list = list(dict.fromkeys(prereq_list))  # remove duplicates
+
+            extracted.append({
+                "Course_Code": code,
+                "Course_Title": title,
+                "Prerequisites": ", ".join(prereq_list) if prereq_list else "",
+                "preq_list": list_of_preq,
+                "Prerequisite_Text": prereq_text
+            })
+
+        return extracted
+
+    @staticmethod
+    def _clean_prerequisite_text(text: str) -> str:
+        # Same result as the replace/encode/decode chain of parse_subject_page_soup()
+        return text.translate(_TEXT_FIXES).replace("¬†", " ").encode("utf-8", "ignore").decode("utf-8")
 
+    def parse_subject_page_soup(self, html: str) -> List[Dict]:
+        """
+        Reference BeautifulSoup version of parse_subject_page(), several times slower.
+        Kept to check the streaming extractor against saved pages, see
+        benchmarks/catalog_parse_benchmark.py.
+        """
+        from bs4 import BeautifulSoup
 
-    def get_course_data(self):
-        """Scrapes CSU CPSC catalog and extracts course details with prerequisites."""
         extracted = []
-        for code in self._courses:
-            # Step 1: Fetch HTML
-            print("Connecting to catalog...")
-            page = requests.get(self.catalog_url + code + "/")
-            page.raise_for_status()
-            soup = BeautifulSoup(page.text, "html.parser")
-
-
-            # Step 2: Iterate through all course blocks
-            for block in soup.select("div.courseblock"):
-                header = block.select_one("div.cols.noindent")
-                if not header:
-                    continue
-
-                code = header.select_one("span.detail-code strong").get_text(strip=True)
-                title = header.select_one("span.detail-title strong").get_text(strip=True)
-                prereq_list = []
-                list_of_preq = []
-
-                # Step 3: Search for prerequisite text in the course description
-                for desc in block.select("div.courseblockextra"):
-                    text = desc.get_text(" ", strip=True)
-                    if "Prerequisite" in text:
-                        text = (text
-                            .replace("\xa0", " ")   # non-breaking space
-                            .replace("Â", " ")      # stray symbol
-                            .replace("¬†", " ")     # alternate non-breaking space
-                            .encode("utf-8", "ignore")
-                            .decode("utf-8"))
-                        # Clean text and extract all course codes like CPSC 1301K, MATH 1113, etc.
-                        cleaned = re.sub(r"[^A-Za-z0-9\s]", " ", text)
-                        matches = re.findall(r"[A-Z]{4}\s?\d{4}[A-Z]?", cleaned)
-                        list_of_preq = self.preq_list(text)
-                        prereq_list.extend(matches)
-
-                prereq_list = list(dict.fromkeys(prereq_list))  # remove duplicates
-
-                extracted.append({
-                    "Course_Code": code,
-                    "Course_Title": title,
-                    "Prerequisites": ", ".join(prereq_list) if prereq_list else "",
-                    "preq_list": list_of_preq
-                })
+        soup = BeautifulSoup(html, "html.parser")
+
+        # Iterate through all course blocks
+        for block in soup.select("div.courseblock"):
+            header = block.select_one("div.cols.noindent")
+            if not header:
+                continue
+
+            code = header.select_one("span.detail-code strong").get_text(strip=True)
+            title = header.select_one("span.detail-title strong").get_text(strip=True)
+            prereq_list = []
+            list_of_preq = []
+            prereq_text = ""
+
+            # Search for prerequisite text in the course description
+            for desc in block.select("div.courseblockextra"):
+                text = desc.get_text(" ", strip=True)
+                if "Prerequisite" in text:
+                    text = (text
+                        .replace("\xa0", " ")   # non-breaking space
+                        .replace("Â", " ")      # stray symbol
+                        .replace("¬†", " ")     # alternate non-breaking space
+                        .encode("utf-8", "ignore")
+                        .decode("utf-8"))
+                    # Clean text and extract all course codes like CPSC 1301K, MATH 1113, etc.
+                    cleaned = re.sub(r"[^A-Za-z0-9\s]", " ", text)
+                    matches = re.findall(r"[A-Z]{4}\s?\d{4}[A-Z]?", cleaned)
+                    list_of_preq = self.preq_list(text)
+                    prereq_text = text
+                    prereq_list.extend(matches)
+
+            prereq_list = list(dict.fromkeys(prereq_list))  # remove duplicates
+
+            extracted.append({
+                "Course_Code": code,
+                "Course_Title": title,
+                "Prerequisites": ", ".join(prereq_list) if prereq_list else "",
+                "preq_list": list_of_preq,
+                "Prerequisite_Text": prereq_text
+            })
 
         return extracted
 
+    def _create_session(self, pool_size: int = 1) -> "requests.Session":
+        """Creates a session that reuses connections to the catalog host."""
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(pool_size, 1))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def save_to_csv(self, data, output_file="cpsc_prerequisites.csv"):
         """Stores the parsed data into a CSV file."""
+        import pandas as pd
+
         df = pd.DataFrame(data, columns=["Course_Code", "Course_Title", "Prerequisites"])
         if os.path.exists(output_file):
             os.remove(output_file)
@@ -74,14 +320,10 @@ class WebCrawler():
         self.save_to_csv(results)
 
     def crawl_course_prerequisites(self, course_code: str) -> List[str]:
-        course = [x for x in self._data if x.get("Course_Code") == course_code]
-        if not course:
-            return []
-        return course[0].get("Prerequisites").split(", ")
+        return self._catalog.get_prerequisite_codes(course_code)
 
     def preq_list(self, text:str) -> List[(str)]:
-        pattern = r'\b(?:[A-Z]{4}\s+\d{4}[A-Z]?|or|and)\b'
-        matches = re.findall(pattern, text)
+        matches = _PREREQUISITE_TOKEN.findall(text)
 
         return_list = []
         buffer = []
@@ -98,12 +340,142 @@ class WebCrawler():
             return_list.append(buffer)
         return return_list
 
-    def get_course_prerequisites(self) -> Dict[str, List[str]]:
-        return_dict = {}
-        for course in self._data:
-            course_code = course.get("Course_Code")
-            prereq_list = course.get("preq_list")
+    def get_course_prerequisites(self) -> Dict[str, List[List[str]]]:
+        return self._catalog.get_prerequisite_map()
+
+
+def diff_course_data(old: List[Dict], new: List[Dict]) -> Dict[str, List[str]]:
+    """
+    Course level differences between two crawls of the catalog.
+
+    Args:
+        old (List[Dict]): Earlier course data
+        new (List[Dict]): Current course data
+
+    Returns:
+        Dict[str, List[str]]: Course codes that were "added", "removed", whose
+            prerequisites changed ("prerequisites_changed") or whose title changed ("retitled")
+    """
+    old_courses = {course.get("Course_Code"): course for course in old}
+    new_courses = {course.get("Course_Code"): course for course in new}
+    both = [code for code in new_courses if code in old_courses]
+    return {
+        "added": [code for code in new_courses if code not in old_courses],
+        "removed": [code for code in old_courses if code not in new_courses],
+        "prerequisites_changed": [code for code in both
+                                  if any(old_courses[code].get(key) != new_courses[code].get(key)
+                                         for key in ("Prerequisite_Text", "preq_list", "Prerequisites"))],
+        "retitled": [code for code in both
+                     if old_courses[code].get("Course_Title") != new_courses[code].get("Course_Title")],
+    }
+
+
+class _CourseBlockExtractor(HTMLParser):
+    """
+    Streaming parser for a catalog subject page. Collects, for every div.courseblock with
+    a div.cols.noindent header, the course code and title (the first strong of
+    span.detail-code and span.detail-title) and the text of each div.courseblockextra.
+    Text is joined like BeautifulSoup's get_text(strip=True) and get_text(" ", strip=True).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # (code, title, courseblockextra texts) per course block, in page order
+        self.blocks: List[Tuple[str, str, List[str]]] = []
+        # Every open div as (starts the block, index of its courseblockextra text, is the header),
+        # every open span as "code", "title" or None
+        self._divs: List[Tuple[bool, Optional[int], bool]] = []
+        self._spans: List[Optional[str]] = []
+        self._strongs: List[bool] = []
+        self._in_block = False
+        self._header: Optional[Dict[str, Optional[str]]] = None
+        self._field: Optional[str] = None
+        self._field_parts: Optional[List[str]] = None
+        self._extras: List[List[str]] = []
+        self._extra_texts: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag == "div":
+            classes = self._classes(attrs)
+            starts_block, extra, is_header = False, None, False
+            if not self._in_block:
+                if "courseblock" in classes:
+                    starts_block = True
+                    self._in_block = True
+                    self._header = None
+                    self._extras = []
+                    self._extra_texts = []
+            else:
+                if "courseblockextra" in classes:
+                    # Texts keep the order the divs start in, like soup.select()
+                    extra = len(self._extra_texts)
+                    self._extra_texts.append("")
+                    self._extras.append([])
+                if self._header is None and "cols" in classes and "noindent" in classes:
+                    is_header = True
+                    self._header = {"code": None, "title": None, "open": True}
+            self._divs.append((starts_block, extra, is_header))
+        elif tag == "span":
+            role = None
+            header = self._header
+            if header is not None and header["open"]:
+                classes = self._classes(attrs)
+                if "detail-code" in classes:
+                    role = "code"
+                elif "detail-title" in classes:
+                    role = "title"
+            self._spans.append(role)
+        elif tag == "strong":
+            starts_field = False
+            if self._field is None and self._header is not None and self._header["open"]:
+                # First strong of a code or title span that wasn't read yet
+                field = next((role for role in reversed(self._spans) if role), None)
+                if field and self._header[field] is None:
+                    self._field, self._field_parts = field, []
+                    starts_field = True
+            self._strongs.append(starts_field)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "div":
+            if not self._divs:
+                return
+            starts_block, extra, is_header = self._divs.pop()
+            if extra is not None:
+                self._extra_texts[extra] = " ".join(self._extras.pop())
+            if is_header:
+                self._header["open"] = False
+            if starts_block:
+                self._in_block = False
+                header = self._header
+                if header is not None and header["code"] is not None and header["title"] is not None:
+                    self.blocks.append((header["code"], header["title"], self._extra_texts))
+        elif tag == "span":
+            if self._spans:
+                self._spans.pop()
+        elif tag == "strong":
+            if self._strongs and self._strongs.pop():
+                self._header[self._field] = "".join(self._field_parts)
+                self._field, self._field_parts = None, None
+
+    def handle_data(self, data: str) -> None:
+        if not self._in_block:
+            return
+        text = data.strip()
+        if not text:
+            return
+        if self._field_parts is not None:
+            self._field_parts.append(text)
+        for parts in self._extras:
+            parts.append(text)
+
+    @staticmethod
+    def _classes(attrs) -> List[str]:
+        for name, value in attrs:
+            if name == "class":
+                return value.split() if value else []
+        return []
 
-            return_dict[course_code] = prereq_list
 
-        return return_dict
+class CatalogUnavailableError(RuntimeError):
+    """Raised when catalog data can neither be crawled nor loaded from the cache."""
+    pass